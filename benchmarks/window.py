@@ -0,0 +1,52 @@
+"""Compare elementwise mutators, which skip the group window, against windowed ones.
+
+Run with `python benchmarks/window.py`. The windowed variant appends `0 * n()`, which leaves the
+values unchanged but contains a reduction, so it is still evaluated over the group window as
+every mutator was before elementwise expressions were detected.
+"""
+
+import time
+
+import numpy as np
+
+from tabeline import DataFrame
+
+HEIGHT = 10_000_000
+REPEATS = 5
+
+
+def best_time(function) -> float:
+    times = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    rng = np.random.default_rng(0)
+    df = DataFrame.from_dict(
+        {
+            "group": rng.integers(0, 1000, HEIGHT),
+            "x": rng.random(HEIGHT),
+        }
+    )
+    grouped_df = df.group_by("group")
+
+    cases = {
+        "ungrouped": df,
+        "grouped": grouped_df,
+    }
+
+    for name, frame in cases.items():
+        elementwise = best_time(lambda frame=frame: frame.mutate(y="x * 2 + 1"))
+        windowed = best_time(lambda frame=frame: frame.mutate(y="x * 2 + 1 + 0 * n()"))
+        print(
+            f"{name:>10}: elementwise {elementwise:.3f}s, windowed {windowed:.3f}s, "
+            f"speedup {windowed / elementwise:.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
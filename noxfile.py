@@ -29,7 +29,7 @@ def _install_project(s: Session):
 
 
 @session(
-    python=["3.10", "3.11", "3.12", "3.13", "3.14"],
+    python=["3.10", "3.11", "3.12", "3.13", "3.14", "3.14t"],
     uv_groups=["test"],
     uv_no_install_project=True,
 )
@@ -48,7 +48,16 @@ def test(s: Session):
 def test_polars(s: Session):
     _install_project(s)
     coverage_file = f".coverage.{platform.machine()}.{platform.system()}.{s.python}.polars"
-    s.run("coverage", "run", "--data-file", coverage_file, "-m", "pytest", "tests/test_polars.py")
+    s.run(
+        "coverage",
+        "run",
+        "--data-file",
+        coverage_file,
+        "-m",
+        "pytest",
+        "tests/test_polars.py",
+        "tests/test_arrow.py",
+    )
 
 
 @session(
@@ -60,7 +69,17 @@ def test_polars(s: Session):
 def test_pandas(s: Session):
     _install_project(s)
     coverage_file = f".coverage.{platform.machine()}.{platform.system()}.{s.python}.pandas"
-    s.run("coverage", "run", "--data-file", coverage_file, "-m", "pytest", "tests/test_pandas.py")
+    s.run(
+        "coverage",
+        "run",
+        "--data-file",
+        coverage_file,
+        "-m",
+        "pytest",
+        "tests/test_pandas.py",
+        "tests/test_numpy.py",
+        "tests/test_arrow.py",
+    )
 
 
 @session(uv_only_groups=["test"])
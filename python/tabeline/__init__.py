@@ -1,5 +1,8 @@
+from . import config
 from ._array import Array
 from ._concatenate import concatenate_columns, concatenate_rows
-from ._data_frame import DataFrame
+from ._data_frame import DataFrame, read_csv_async, read_ipc_async, read_parquet_async
+from ._expression import clear_expression_cache, expression_cache_info, set_expression_cache_size
+from ._lazy_data_frame import LazyDataFrame, scan_csv, scan_parquet
 from ._record import Record
 from ._tabeline import DataType
@@ -6,7 +6,6 @@ from collections.abc import Sequence
 from typing import TYPE_CHECKING, Generic, TypeVar, overload
 
 from ._tabeline import DataType, PyArray
-from .exceptions import IncompatibleElementTypeError
 
 Element = TypeVar("Element", bound=DataType)
 
@@ -15,150 +14,6 @@ if TYPE_CHECKING:
     import polars as pl
 
 
-def py_array_from_sequence(elements: Sequence[Element], data_type: DataType) -> PyArray:
-    # This is split out so that __init__ and from_sequence can share the logic,
-    # when they can't call each other
-    match data_type:
-        case None:
-            inferred_data_type = DataType.Nothing
-            parsed_elements = list(elements)
-            for i, item in enumerate(parsed_elements):
-                match inferred_data_type:
-                    case DataType.Nothing:
-                        match item:
-                            case None:
-                                pass
-                            case bool():
-                                inferred_data_type = DataType.Boolean
-                            case int():
-                                inferred_data_type = DataType.Integer64
-                            case float():
-                                inferred_data_type = DataType.Float64
-                            case str():
-                                inferred_data_type = DataType.String
-                            case _:
-                                raise IncompatibleElementTypeError(
-                                    [bool, int, float, str, type(None)], item, i
-                                )
-                    case DataType.Boolean:
-                        match item:
-                            case None:
-                                pass
-                            case bool():
-                                pass
-                            case _:
-                                raise IncompatibleElementTypeError([bool, type(None)], item, i)
-                    case DataType.Integer64:
-                        match item:
-                            case None:
-                                pass
-                            case int():
-                                pass
-                            case float():
-                                for j in range(i + 1):
-                                    element_j = parsed_elements[j]
-                                    parsed_elements[j] = (
-                                        float(parsed_elements[j])
-                                        if element_j is not None
-                                        else None
-                                    )
-                                inferred_data_type = DataType.Float64
-                            case _:
-                                raise IncompatibleElementTypeError(
-                                    [int, float, type(None)], item, i
-                                )
-                    case DataType.Float64:
-                        match item:
-                            case None:
-                                pass
-                            case int():
-                                parsed_elements[i] = float(item)
-                            case float():
-                                pass
-                            case _:
-                                raise IncompatibleElementTypeError(
-                                    [int, float, type(None)], item, i
-                                )
-                    case DataType.String:
-                        match item:
-                            case None:
-                                pass
-                            case str():
-                                pass
-                            case _:
-                                raise IncompatibleElementTypeError([str, type(None)], item, i)
-                    case _:
-                        raise NotImplementedError()
-        case _:
-            inferred_data_type = data_type
-            parsed_elements = list(elements)
-            match data_type:
-                case DataType.Nothing:
-                    for i, item in enumerate(parsed_elements):
-                        match item:
-                            case None:
-                                pass
-                            case _:
-                                raise IncompatibleElementTypeError([type(None)], item, i)
-                case DataType.Boolean:
-                    for i, item in enumerate(parsed_elements):
-                        match item:
-                            case None:
-                                pass
-                            case bool():
-                                pass
-                            case _:
-                                raise IncompatibleElementTypeError([bool, type(None)], item, i)
-                case (
-                    DataType.Integer8
-                    | DataType.Integer16
-                    | DataType.Integer32
-                    | DataType.Integer64
-                    | DataType.Whole8
-                    | DataType.Whole16
-                    | DataType.Whole32
-                    | DataType.Whole64
-                ):
-                    for i, item in enumerate(parsed_elements):
-                        match item:
-                            case None:
-                                pass
-                            case int():
-                                pass
-                            case _:
-                                raise IncompatibleElementTypeError(
-                                    [int, float, type(None)], item, i
-                                )
-                case DataType.Float32 | DataType.Float64:
-                    for i, item in enumerate(parsed_elements):
-                        match item:
-                            case None:
-                                pass
-                            case int():
-                                parsed_elements[i] = float(item)
-                            case float():
-                                pass
-                            case _:
-                                raise IncompatibleElementTypeError(
-                                    [int, float, type(None)], item, i
-                                )
-                case DataType.String:
-                    for i, item in enumerate(parsed_elements):
-                        match item:
-                            case None:
-                                pass
-                            case str():
-                                pass
-                            case _:
-                                raise IncompatibleElementTypeError([str, type(None)], item, i)
-                case _:
-                    raise TypeError(
-                        f"Array.from_sequence not implemented for data type {data_type}"
-                    )
-
-    return PyArray.from_list(parsed_elements, data_type=inferred_data_type)
-
-
 class Array(Generic[Element]):
     @overload
     def __init__(self, *elements: bool | None, data_type: DataType | None = None) -> None:
@@ -195,7 +50,7 @@ class Array(Generic[Element]):
 
             rust_array = elements[0]
         else:
-            rust_array = py_array_from_sequence(elements, data_type=data_type)
+            rust_array = PyArray.from_sequence(elements, data_type=data_type)
 
         self._py_array = rust_array
 
@@ -262,30 +117,97 @@ class Array(Generic[Element]):
         All types can also have `None` as a value. If all elements are `None`, including an empty
         sequence, the data type will be `DataType.Nothing`.
         """
-        return Array(py_array_from_sequence(elements, data_type=data_type))
+        return Array(PyArray.from_sequence(elements, data_type=data_type))
+
+    @staticmethod
+    def from_arrow(data: object, /) -> Array:
+        """Construct an Array from any object implementing the Arrow PyCapsule interface.
+
+        This accepts arrays and chunked arrays from PyArrow, Series from Polars, and any other
+        object that implements `__arrow_c_stream__` or `__arrow_c_array__`. The Arrow buffers are
+        shared rather than copied, and PyArrow is not needed.
+        """
+        return Array(PyArray.from_arrow(data))
 
     @staticmethod
     def from_polars(series: pl.Series) -> Array:
         """Construct an Array from a polars Series."""
-        return Array(PyArray.from_pyarrow_array(series.to_arrow()))
+        return Array.from_arrow(series)
 
     def to_polars(self) -> pl.Series:
         """Convert the Array to a polars Series."""
         import polars
 
-        return polars.from_arrow(self._py_array.to_pyarrow_array())
+        return polars.Series(self)
 
     @staticmethod
     def from_numpy(array: np.ndarray) -> Array:
-        """Construct an Array from a numpy array."""
+        """Construct an Array from a numpy array.
+
+        Boolean, integer, and float arrays are copied once, directly from the numpy buffer. The
+        masked elements of a `numpy.ma.MaskedArray` become nulls. Arrays of other types, such as
+        strings, are converted through PyArrow.
+        """
+        import numpy as np
+
+        if isinstance(array, np.ma.MaskedArray):
+            values = array.data
+            mask = np.ma.getmaskarray(array) if array.mask is not np.ma.nomask else None
+        else:
+            values = array
+            mask = None
+
+        if values.ndim == 1:
+            # The buffer must be in native byte order to be read directly
+            native_values = values.astype(values.dtype.newbyteorder("="), copy=False)
+            py_array = PyArray.from_buffer(native_values, mask=mask)
+            if py_array is not None:
+                return Array(py_array)
+
         import pyarrow
 
         return Array(PyArray.from_pyarrow_array(pyarrow.array(array)))
 
-    def to_numpy(self) -> np.ndarray:
-        """Convert the Array to a numpy array."""
-        # PyArrow does not support zero-copy for all data types
-        return self._py_array.to_pyarrow_array().to_numpy(zero_copy_only=False)
+    def to_numpy(self, *, copy: bool | None = None) -> np.ndarray:
+        """Convert the Array to a numpy array.
+
+        A numeric array without nulls that is stored contiguously is returned as a read-only view
+        of the Array's values, without copying. Otherwise, the values are copied: booleans are
+        unpacked from bits to bytes, and an array with nulls or stored in several chunks is
+        gathered into a new buffer. Arrays with nulls and string arrays are converted through
+        PyArrow, so integers with nulls become floats with NaN, and strings become objects.
+
+        With `copy=True`, the result is always a new, writable array. With `copy=False`, a
+        `ValueError` is raised if the conversion cannot be done without copying.
+        """
+        import numpy as np
+
+        match self._py_array.to_numpy_buffer():
+            case (buffer, copied):
+                if copy is False and copied:
+                    raise ValueError(
+                        f"Converting an Array of {self.data_type} stored in several chunks or as "
+                        "bits to numpy requires a copy"
+                    )
+                array = np.asarray(memoryview(buffer))
+                return array.copy() if copy else array
+            case None:
+                if copy is False:
+                    raise ValueError(
+                        f"Converting an Array of {self.data_type} with nulls or non-numeric "
+                        "values to numpy requires a copy"
+                    )
+                # PyArrow does not support zero-copy for all data types
+                return self._py_array.to_pyarrow_array().to_numpy(zero_copy_only=False)
+
+    def __arrow_c_schema__(self) -> object:
+        return self._py_array.__arrow_c_schema__()
+
+    def __arrow_c_array__(self, requested_schema: object | None = None) -> tuple[object, object]:
+        return self._py_array.__arrow_c_array__(requested_schema)
+
+    def __arrow_c_stream__(self, requested_schema: object | None = None) -> object:
+        return self._py_array.__arrow_c_stream__(requested_schema)
 
     def __class_getitem__(cls, data_type: DataType) -> SpecializedArray:
         return SpecializedArray(data_type)
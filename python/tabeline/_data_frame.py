@@ -1,16 +1,16 @@
 from __future__ import annotations
 
-__all__ = ["DataFrame"]
+__all__ = ["DataFrame", "read_csv_async", "read_ipc_async", "read_parquet_async"]
 
-from collections.abc import Sequence
+from collections.abc import Iterator, Sequence
 from pathlib import Path
 from typing import TYPE_CHECKING, Literal, overload
 
 from ._array import Array, Element
-from ._expression import parse_expression, to_py_expression
+from ._executor import run_in_executor
+from ._expression import compile_expression
 from ._record import Record
-from ._tabeline import PyArray, PyDataFrame, PyExpression
-from .exceptions import IncompatibleLengthError
+from ._tabeline import DataType, PyArray, PyDataFrame, PyExpression
 
 try:
     from numpy import ndarray
@@ -24,50 +24,46 @@ if TYPE_CHECKING:
     import pandas as pd
     import polars as pl
 
+    from ._lazy_data_frame import LazyDataFrame
+
 
 def py_data_frame_from_dict(columns: dict[str, Sequence[Element]]) -> PyDataFrame:
-    cleaned_columns: list[tuple[str, PyArray]] = []
-    height: int | None = None
+    # Numpy arrays are converted here, where masked arrays and byte order are handled; everything
+    # else is converted and checked for length in a single native call
+    prepared_columns: dict[str, PyArray | Sequence[Element]] = {}
     for name, elements in columns.items():
         match elements:
             case Array():
-                array = elements._py_array
+                prepared_columns[name] = elements._py_array
             case ndarray():
-                array = Array.from_numpy(elements)._py_array
+                prepared_columns[name] = Array.from_numpy(elements)._py_array
             case _:
-                array = Array.from_sequence(elements)._py_array
-
-        if height is None:
-            height = len(array)
-        elif len(array) != height:
-            raise IncompatibleLengthError(height, len(array), name)
-
-        cleaned_columns.append((name, array))
-
-    if height is None:
-        # Default height when no columns are provided
-        height = 0
+                prepared_columns[name] = elements
 
-    return PyDataFrame.from_tuple_list(cleaned_columns, height)
+    return PyDataFrame.from_dict(prepared_columns)
 
 
 def tuple_list_from_kwargs(columns: dict[str, str]) -> list[tuple[str, PyExpression]]:
     tuple_list = []
     for name, expression in columns.items():
-        parsed_expression = parse_expression(expression)
-        py_expression = to_py_expression(parsed_expression)
-        tuple_list.append((name, py_expression))
+        tuple_list.append((name, compile_expression(expression)))
 
     return tuple_list
 
 
 def standardize_join_by(
-    left: DataFrame, right: DataFrame, by: Sequence[str | tuple[str, str]] | None
+    left: DataFrame | LazyDataFrame,
+    right: DataFrame | LazyDataFrame,
+    by: Sequence[str | tuple[str, str]] | None,
 ) -> list[tuple[str, str]]:
     if by is None:
+        # Group columns are always matched, so they are not listed as keys
+        group_names = {name for level in left.group_levels for name in level}
         left_names = left.column_names
         right_names = set(right.column_names)
-        return [(name, name) for name in left_names if name in right_names]
+        return [
+            (name, name) for name in left_names if name in right_names and name not in group_names
+        ]
     else:
         return [(name, name) if isinstance(name, str) else name for name in by]
 
@@ -124,6 +120,30 @@ class DataFrame:
     def group_levels(self) -> tuple[tuple[str, ...], ...]:
         return self._py_data_frame.group_levels
 
+    @property
+    def has_group_index(self) -> bool:
+        """Whether the row positions of each group have been computed and cached.
+
+        The index is built the first time a grouped verb runs on a data frame with at least one
+        group column: `filter`, `distinct`, `sort`, `cluster`, `mutate`, `transmute`,
+        `summarize`, `spread`, or a slice. Those verbs then partition by its group ids instead of
+        hashing the group columns. It is shared with the data frames derived from this one by verbs
+        that keep the same rows and groups, such as `mutate`, `transmute`, `select`, `deselect`,
+        and `rename`. This is for diagnostics only; results never depend on it.
+        """
+        return self._py_data_frame.has_group_index
+
+    def lazy(self) -> LazyDataFrame:
+        """Start a lazy pipeline on this data frame.
+
+        Verbs applied to the returned `LazyDataFrame` are validated immediately, but nothing is
+        computed until `collect()` is called, at which point the whole pipeline runs as a single
+        optimized query.
+        """
+        from ._lazy_data_frame import LazyDataFrame
+
+        return LazyDataFrame(self._py_data_frame.lazy())
+
     def slice0(self, indexes: list[int]) -> DataFrame:
         return DataFrame(self._py_data_frame.slice0(indexes))
 
@@ -131,8 +151,7 @@ class DataFrame:
         return DataFrame(self._py_data_frame.slice1(indexes))
 
     def filter(self, predicate: str, /) -> DataFrame:
-        expression = parse_expression(predicate)
-        py_expression = to_py_expression(expression)
+        py_expression = compile_expression(predicate)
         return DataFrame(self._py_data_frame.filter(py_expression))
 
     def distinct(self, *columns: str) -> DataFrame:
@@ -263,6 +282,36 @@ class DataFrame:
                     case _:  # Sequence[int]
                         return DataFrame(selected_data_frame.slice0(row_index))
 
+    @overload
+    def iter_rows(
+        self, *, named: Literal[False] = False, buffer_size: int = 512
+    ) -> Iterator[tuple[bool | int | float | str | None, ...]]:
+        pass
+
+    @overload
+    def iter_rows(
+        self, *, named: Literal[True], buffer_size: int = 512
+    ) -> Iterator[dict[str, bool | int | float | str | None]]:
+        pass
+
+    def iter_rows(
+        self, *, named: bool = False, buffer_size: int = 512
+    ) -> Iterator[tuple[object, ...]] | Iterator[dict[str, object]]:
+        """Iterate over the rows of the data frame.
+
+        Each row is a tuple of values in column order, or a dict from column name to value if
+        `named=True`. Rows are converted `buffer_size` at a time, one column at a time, which is
+        much faster than indexing each row. Group levels are ignored.
+        """
+        if buffer_size < 1:
+            raise ValueError(f"buffer_size must be positive, but got {buffer_size}")
+
+        return self._iter_rows(named, buffer_size)
+
+    def _iter_rows(self, named: bool, buffer_size: int):
+        for start in range(0, self.height, buffer_size):
+            yield from self._py_data_frame.rows(start, buffer_size, named)
+
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, DataFrame):
             return False
@@ -282,27 +331,212 @@ class DataFrame:
         return str(self._py_data_frame)
 
     @staticmethod
-    def read_csv(path: Path, /) -> DataFrame:
-        return DataFrame(PyDataFrame.read_csv(str(path)))
+    def read_csv(
+        path: Path | str,
+        /,
+        *,
+        columns: Sequence[str] | None = None,
+        dtypes: dict[str, DataType] | None = None,
+        n_rows: int | None = None,
+        infer_schema_length: int | None = 100,
+        n_threads: int | None = None,
+    ) -> DataFrame:
+        """Read a CSV file with a header row into a data frame.
+
+        Files compressed with gzip or zstd, such as those written by `write_csv` with
+        `compression`, are detected and decompressed transparently.
 
-    def write_csv(self, path: Path, /) -> None:
-        self._py_data_frame.write_csv(str(path))
+        Only the columns named in `columns` are decoded, in file order; all columns are read by
+        default. Columns named in `dtypes` are parsed as the given type instead of being
+        inferred. At most `n_rows` rows are read. The types of the remaining columns are
+        inferred from the first `infer_schema_length` rows, or from the whole file if it is
+        `None`. Parsing runs on `n_threads` threads, defaulting to the Polars thread pool, and
+        does not hold the GIL.
+
+        A missing file raises `FileNotFoundError`, and a file that cannot be parsed with the
+        requested options raises `ValueError`.
+        """
+        return DataFrame(
+            PyDataFrame.read_csv(
+                str(path),
+                columns=None if columns is None else list(columns),
+                dtypes=dtypes,
+                n_rows=n_rows,
+                infer_schema_length=infer_schema_length,
+                n_threads=n_threads,
+            )
+        )
+
+    def write_csv(
+        self,
+        path: Path | str,
+        /,
+        *,
+        compression: Literal["gzip", "zstd"] | None = None,
+        compression_level: int | None = None,
+        batch_size: int = 1024,
+        n_threads: int | None = None,
+    ) -> None:
+        """Write this data frame to a CSV file with a header row.
+
+        With `compression`, the file is compressed with gzip or zstd as it is written, at
+        `compression_level` if given. `read_csv` detects the compression and decompresses
+        transparently. Rows are serialized `batch_size` at a time on `n_threads` threads,
+        defaulting to the Polars thread pool, and the GIL is released while writing.
+        """
+        self._py_data_frame.write_csv(
+            str(path),
+            compression=compression,
+            compression_level=compression_level,
+            batch_size=batch_size,
+            n_threads=n_threads,
+        )
+
+    async def write_csv_async(
+        self,
+        path: Path | str,
+        /,
+        *,
+        compression: Literal["gzip", "zstd"] | None = None,
+        compression_level: int | None = None,
+        batch_size: int = 1024,
+        n_threads: int | None = None,
+    ) -> None:
+        """Write this data frame to a CSV file without blocking the event loop.
+
+        This is `write_csv` run on Tabeline's worker threads. See `read_csv_async` for how
+        cancellation is handled.
+        """
+        await run_in_executor(
+            self.write_csv,
+            path,
+            compression=compression,
+            compression_level=compression_level,
+            batch_size=batch_size,
+            n_threads=n_threads,
+        )
 
     @staticmethod
-    def from_polars(polars_data_frame: pl.DataFrame) -> DataFrame:
-        import pyarrow
+    def read_ipc(path: Path | str, /, *, memory_map: bool = True) -> DataFrame:
+        """Read an Arrow IPC (Feather v2) file into a data frame.
+
+        With `memory_map=True`, the file is memory-mapped rather than read, so the columns of the
+        result share the file's buffers and loading takes time independent of the file's size.
+        Pages are read from disk only as they are used. The file must not be modified while any
+        data frame read from it is alive.
+        """
+        return DataFrame(PyDataFrame.read_ipc(str(path), memory_map=memory_map))
 
-        arrow_struct_array = polars_data_frame.to_struct().to_arrow()
+    def write_ipc(self, path: Path | str, /) -> None:
+        """Write this data frame to an uncompressed Arrow IPC (Feather v2) file.
 
-        arrow_record_batch = pyarrow.RecordBatch.from_struct_array(arrow_struct_array)
+        The file holds the columns in their in-memory layout, so `read_ipc` can memory-map it.
+        """
+        self._py_data_frame.write_ipc(str(path))
 
-        return DataFrame(PyDataFrame.from_pyarrow_record_batch(arrow_record_batch))
+    async def write_ipc_async(self, path: Path | str, /) -> None:
+        """Write this data frame to an Arrow IPC file without blocking the event loop.
+
+        This is `write_ipc` run on Tabeline's worker threads.
+        """
+        await run_in_executor(self.write_ipc, path)
+
+    @staticmethod
+    def read_parquet(
+        path: Path | str,
+        /,
+        *,
+        columns: Sequence[str] | None = None,
+        predicate: str | None = None,
+    ) -> DataFrame:
+        """Read a Parquet file into a data frame.
+
+        Only the columns named in `columns` are decoded; all columns are read by default. If a
+        `predicate` is given, only rows for which it is true are kept, as with `filter`. The
+        predicate is checked against the statistics of each row group first, so row groups that
+        cannot contain a matching row are never read.
+        """
+        from ._lazy_data_frame import scan_parquet
+
+        lazy = scan_parquet(path)
+        if predicate is not None:
+            lazy = lazy.filter(predicate)
+        if columns is not None:
+            lazy = lazy.select(*columns)
+        return lazy.collect()
+
+    def write_parquet(
+        self,
+        path: Path | str,
+        /,
+        *,
+        compression: Literal["uncompressed", "snappy", "gzip", "lz4", "zstd", "brotli"] = "zstd",
+        compression_level: int | None = None,
+        row_group_size: int | None = None,
+    ) -> None:
+        """Write this data frame to a Parquet file.
+
+        Each column is compressed with `compression`, at `compression_level` if the codec takes
+        one. Rows are written in groups of `row_group_size`, defaulting to Polars' choice.
+        Statistics are written for every row group so that `read_parquet` and `scan_parquet` can
+        skip the groups a filter rules out. Smaller row groups allow finer skipping at the cost
+        of a larger file.
+        """
+        self._py_data_frame.write_parquet(
+            str(path),
+            compression=compression,
+            compression_level=compression_level,
+            row_group_size=row_group_size,
+        )
+
+    async def write_parquet_async(
+        self,
+        path: Path | str,
+        /,
+        *,
+        compression: Literal["uncompressed", "snappy", "gzip", "lz4", "zstd", "brotli"] = "zstd",
+        compression_level: int | None = None,
+        row_group_size: int | None = None,
+    ) -> None:
+        """Write this data frame to a Parquet file without blocking the event loop.
+
+        This is `write_parquet` run on Tabeline's worker threads.
+        """
+        await run_in_executor(
+            self.write_parquet,
+            path,
+            compression=compression,
+            compression_level=compression_level,
+            row_group_size=row_group_size,
+        )
+
+    @staticmethod
+    def from_arrow(data: object, /) -> DataFrame:
+        """Construct a DataFrame from any object implementing the Arrow PyCapsule interface.
+
+        This accepts tables and record batches from PyArrow, Polars, DuckDB, and other libraries
+        that implement `__arrow_c_stream__` or `__arrow_c_array__` with a struct type. The Arrow
+        buffers are shared rather than copied, and PyArrow is not needed.
+        """
+        return DataFrame(PyDataFrame.from_arrow(data))
+
+    def __arrow_c_schema__(self) -> object:
+        return self._py_data_frame.__arrow_c_schema__()
+
+    def __arrow_c_array__(self, requested_schema: object | None = None) -> tuple[object, object]:
+        return self._py_data_frame.__arrow_c_array__(requested_schema)
+
+    def __arrow_c_stream__(self, requested_schema: object | None = None) -> object:
+        return self._py_data_frame.__arrow_c_stream__(requested_schema)
+
+    @staticmethod
+    def from_polars(polars_data_frame: pl.DataFrame) -> DataFrame:
+        return DataFrame.from_arrow(polars_data_frame)
 
     def to_polars(self) -> pl.DataFrame:
         import polars
 
-        arrow_record_batches = self._py_data_frame.to_pyarrow_record_batches()
-        return polars.from_arrow(arrow_record_batches).drop("_dummy")
+        return polars.DataFrame(self)
 
     @staticmethod
     def from_pandas(pandas_data_frame: pd.DataFrame) -> DataFrame:
@@ -310,11 +544,61 @@ class DataFrame:
 
         arrow_record_batch = pyarrow.RecordBatch.from_pandas(pandas_data_frame)
 
-        return DataFrame(PyDataFrame.from_pyarrow_record_batch(arrow_record_batch))
+        return DataFrame.from_arrow(arrow_record_batch)
 
     def to_pandas(self) -> pd.DataFrame:
         import pyarrow
 
-        record_batches = self._py_data_frame.to_pyarrow_record_batches()
-        table = pyarrow.Table.from_batches(record_batches)
-        return table.to_pandas().drop("_dummy", axis=1)
+        return pyarrow.table(self).to_pandas()
+
+
+async def read_csv_async(
+    path: Path | str,
+    /,
+    *,
+    columns: Sequence[str] | None = None,
+    dtypes: dict[str, DataType] | None = None,
+    n_rows: int | None = None,
+    infer_schema_length: int | None = 100,
+    n_threads: int | None = None,
+) -> DataFrame:
+    """Read a CSV file without blocking the event loop.
+
+    This is `DataFrame.read_csv` run on a pool of worker threads managed by Tabeline. Parsing
+    does not hold the GIL, so the event loop keeps serving other tasks in the meantime. If the
+    awaiting task is cancelled before the read starts, the read is never run; a read that has
+    already started finishes in the background and its result is discarded.
+    """
+    return await run_in_executor(
+        DataFrame.read_csv,
+        path,
+        columns=columns,
+        dtypes=dtypes,
+        n_rows=n_rows,
+        infer_schema_length=infer_schema_length,
+        n_threads=n_threads,
+    )
+
+
+async def read_ipc_async(path: Path | str, /, *, memory_map: bool = True) -> DataFrame:
+    """Read an Arrow IPC file without blocking the event loop.
+
+    This is `DataFrame.read_ipc` run on Tabeline's worker threads.
+    """
+    return await run_in_executor(DataFrame.read_ipc, path, memory_map=memory_map)
+
+
+async def read_parquet_async(
+    path: Path | str,
+    /,
+    *,
+    columns: Sequence[str] | None = None,
+    predicate: str | None = None,
+) -> DataFrame:
+    """Read a Parquet file without blocking the event loop.
+
+    This is `DataFrame.read_parquet` run on Tabeline's worker threads.
+    """
+    return await run_in_executor(
+        DataFrame.read_parquet, path, columns=columns, predicate=predicate
+    )
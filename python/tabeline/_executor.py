@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+__all__ = ["run_in_executor"]
+
+import asyncio
+import contextvars
+import functools
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import ParamSpec, TypeVar
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(thread_name_prefix="tabeline")
+        return _executor
+
+
+async def run_in_executor(function: Callable[P, T], /, *args: P.args, **kwargs: P.kwargs) -> T:
+    # The native work releases the GIL, so running it on a worker thread leaves the event loop
+    # free. The caller's context variables are carried over, like asyncio.to_thread.
+    context = contextvars.copy_context()
+    call = functools.partial(context.run, function, *args, **kwargs)
+
+    # If the awaiting task is cancelled before the call starts, the call never runs. A call that
+    # has already started runs to completion on its thread, but its result is discarded.
+    return await asyncio.wrap_future(_get_executor().submit(call))
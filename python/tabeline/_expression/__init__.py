@@ -1,2 +1,9 @@
+from ._cache import (
+    ExpressionCacheInfo,
+    clear_expression_cache,
+    compile_expression,
+    expression_cache_info,
+    set_expression_cache_size,
+)
 from ._parser import parse_expression
 from ._to_py_expression import to_py_expression
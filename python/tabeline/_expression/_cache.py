@@ -0,0 +1,70 @@
+__all__ = [
+    "ExpressionCacheInfo",
+    "clear_expression_cache",
+    "compile_expression",
+    "expression_cache_info",
+    "set_expression_cache_size",
+]
+
+import threading
+from functools import lru_cache
+from typing import NamedTuple
+
+from .._tabeline import PyExpression, clear_compiled_expression_cache
+from ._parser import parse_expression
+from ._to_py_expression import to_py_expression
+
+DEFAULT_EXPRESSION_CACHE_SIZE = 1024
+
+
+class ExpressionCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int | None
+    currsize: int
+
+
+def _compile_expression(text: str) -> PyExpression:
+    return to_py_expression(parse_expression(text))
+
+
+_cached_compile_expression = lru_cache(maxsize=DEFAULT_EXPRESSION_CACHE_SIZE)(
+    _compile_expression
+)
+
+# Guards replacing the cache, which other threads may be using without the GIL
+_cache_lock = threading.Lock()
+
+
+def compile_expression(text: str) -> PyExpression:
+    # PyExpression is immutable, so the same instance can be shared by every caller
+    return _cached_compile_expression(text)
+
+
+def expression_cache_info() -> ExpressionCacheInfo:
+    """Statistics of the cache from expression text to parsed expression.
+
+    Returns a named tuple of `hits`, `misses`, `maxsize`, and `currsize`.
+    """
+    return ExpressionCacheInfo(*_cached_compile_expression.cache_info())
+
+
+def clear_expression_cache() -> None:
+    """Remove all parsed expressions from the cache and reset its statistics.
+
+    The expressions that were compiled against the schemas of data frames are removed as well.
+    """
+    with _cache_lock:
+        _cached_compile_expression.cache_clear()
+    clear_compiled_expression_cache()
+
+
+def set_expression_cache_size(maxsize: int | None) -> None:
+    """Change the maximum number of parsed expressions kept in the cache.
+
+    The cache is cleared. A `maxsize` of `0` disables caching, and `None` lets the cache grow
+    without bound.
+    """
+    global _cached_compile_expression
+    with _cache_lock:
+        _cached_compile_expression = lru_cache(maxsize=maxsize)(_compile_expression)
@@ -9,7 +9,7 @@ from parsita.util import constant, splat
 from . import ast
 from .ast import Expression
 
-reserved_names = {"None", "True", "False", "inf", "nan"}
+reserved_names = frozenset({"None", "True", "False", "inf", "nan"})
 
 
 def make_exponent(first: Expression, maybe_second: Union[tuple[()], tuple[Expression]]):
@@ -131,6 +131,8 @@ class ExpressionParser(ParserContext, whitespace=r"[ ]*"):
 
 
 def parse_expression(text: str) -> Expression:
+    # The grammar is never modified after the class is built, and each call to parse keeps its
+    # position and memo table to itself, so this can be called from many threads at once
     match ExpressionParser.expression.parse(text):
         case Success(value):
             return value
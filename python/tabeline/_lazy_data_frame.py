@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+__all__ = ["LazyDataFrame", "scan_csv", "scan_parquet"]
+
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Literal
+
+from ._data_frame import DataFrame, standardize_join_by, tuple_list_from_kwargs
+from ._executor import run_in_executor
+from ._expression import compile_expression
+from ._tabeline import PyLazyDataFrame
+
+
+def py_lazy_data_frame_from(data_frame: DataFrame | LazyDataFrame) -> PyLazyDataFrame:
+    match data_frame:
+        case LazyDataFrame():
+            return data_frame._py_lazy_data_frame
+        case DataFrame():
+            return data_frame._py_data_frame.lazy()
+        case _:
+            raise TypeError(f"Expected DataFrame or LazyDataFrame, but got {type(data_frame)}")
+
+
+def scan_csv(path: Path | str, /) -> LazyDataFrame:
+    """Lazily read a CSV file with a header row.
+
+    Only the header is read immediately, to learn the column names and types. When the result is
+    collected, the reader skips columns that the pipeline does not use and applies filters while
+    parsing, so rows that are filtered out are never materialized.
+    """
+    return LazyDataFrame(PyLazyDataFrame.scan_csv(str(path)))
+
+
+def scan_parquet(path: Path | str, /) -> LazyDataFrame:
+    """Lazily read a Parquet file.
+
+    Only the file metadata is read immediately. When the result is collected, only the columns
+    that the pipeline uses are decoded, and filters are compared against the statistics of each
+    row group so that groups without any matching rows are skipped entirely.
+    """
+    return LazyDataFrame(PyLazyDataFrame.scan_parquet(str(path)))
+
+
+class LazyDataFrame:
+    """A deferred pipeline of verbs applied to a data frame.
+
+    Created by `DataFrame.lazy()`. Each verb is validated immediately against the schema of the
+    pipeline so far, but no data is computed until `collect()` is called. At that point, the
+    entire pipeline is optimized and executed as a single Polars query.
+    """
+
+    def __init__(self, py_lazy_data_frame: PyLazyDataFrame, /):
+        self._py_lazy_data_frame = py_lazy_data_frame
+
+    def collect(self, *, streaming: bool | None = None) -> DataFrame:
+        """Run the pipeline and return the result as a `DataFrame`.
+
+        With `streaming=True`, Polars' streaming engine runs the pipeline in batches. Sources
+        scanned from disk, such as with `scan_csv`, are then never held in memory all at once;
+        only the result is. By default, the engine is chosen by `tabeline.config`.
+        """
+        return DataFrame(self._py_lazy_data_frame.collect(streaming))
+
+    async def collect_async(self, *, streaming: bool | None = None) -> DataFrame:
+        """Run the pipeline without blocking the event loop.
+
+        This is `collect` run on Tabeline's worker threads. Expensive pipelines, such as large
+        joins, can be recorded on the event loop, because recording only validates, and then
+        awaited. If the awaiting task is cancelled before the pipeline starts, it is never run.
+        """
+        return await run_in_executor(self.collect, streaming=streaming)
+
+    def explain(self, *, optimized: bool = True, physical: bool = False) -> str:
+        """Describe the query plan that `collect()` would run.
+
+        With `optimized=True`, this is the plan after Polars has applied its optimizations, such
+        as predicate and projection pushdown. With `optimized=False`, this is the plan exactly as
+        the verbs recorded it. With `physical=True`, this is instead the physical plan that the
+        streaming engine would run, as a graph in the DOT language.
+        """
+        return self._py_lazy_data_frame.explain(optimized, physical)
+
+    def profile(self, *, streaming: bool | None = None) -> tuple[DataFrame, DataFrame]:
+        """Run the pipeline while timing each node of the query plan.
+
+        Returns the collected result and a data frame of timings with columns `node`, `start`,
+        and `end`. The times are in microseconds since the start of the query. The pipeline is run
+        by the same engine as `collect(streaming=streaming)`.
+        """
+        result, timings = self._py_lazy_data_frame.profile(streaming)
+        return DataFrame(result), DataFrame(timings)
+
+    @property
+    def width(self) -> int:
+        return self._py_lazy_data_frame.width
+
+    @property
+    def column_names(self) -> tuple[str]:
+        return self._py_lazy_data_frame.column_names
+
+    @property
+    def group_levels(self) -> tuple[tuple[str, ...], ...]:
+        return self._py_lazy_data_frame.group_levels
+
+    def filter(self, predicate: str, /) -> LazyDataFrame:
+        py_expression = compile_expression(predicate)
+        return LazyDataFrame(self._py_lazy_data_frame.filter(py_expression))
+
+    def distinct(self, *columns: str) -> LazyDataFrame:
+        return LazyDataFrame(self._py_lazy_data_frame.distinct(columns))
+
+    def unique(self) -> LazyDataFrame:
+        return LazyDataFrame(self._py_lazy_data_frame.unique())
+
+    def sort(self, *columns: str) -> LazyDataFrame:
+        return LazyDataFrame(self._py_lazy_data_frame.sort(columns))
+
+    def cluster(self, *columns: str) -> LazyDataFrame:
+        return LazyDataFrame(self._py_lazy_data_frame.cluster(columns))
+
+    def select(self, *columns: str) -> LazyDataFrame:
+        return LazyDataFrame(self._py_lazy_data_frame.select(columns))
+
+    def deselect(self, *columns: str) -> LazyDataFrame:
+        return LazyDataFrame(self._py_lazy_data_frame.deselect(columns))
+
+    def rename(self, **columns: str) -> LazyDataFrame:
+        return LazyDataFrame(self._py_lazy_data_frame.rename(list(columns.items())))
+
+    def mutate(self, **columns: str) -> LazyDataFrame:
+        return LazyDataFrame(self._py_lazy_data_frame.mutate(tuple_list_from_kwargs(columns)))
+
+    def transmute(self, **columns: str) -> LazyDataFrame:
+        return LazyDataFrame(self._py_lazy_data_frame.transmute(tuple_list_from_kwargs(columns)))
+
+    def group_by(
+        self, *columns: str, order: Literal["original", "cluster", "sort"] = "original"
+    ) -> LazyDataFrame:
+        if order == "original":
+            ordered_df = self
+        elif order == "cluster":
+            ordered_df = self.cluster(*columns)
+        elif order == "sort":
+            ordered_df = self.sort(*columns)
+        else:
+            raise TypeError(
+                f"For order, expected 'original', 'cluster', or 'sort', but got {order!r}"
+            )
+
+        return LazyDataFrame(ordered_df._py_lazy_data_frame.group_by(columns))
+
+    def ungroup(self) -> LazyDataFrame:
+        return LazyDataFrame(self._py_lazy_data_frame.ungroup())
+
+    def summarize(self, **columns: str) -> LazyDataFrame:
+        return LazyDataFrame(self._py_lazy_data_frame.summarize(tuple_list_from_kwargs(columns)))
+
+    def spread(self, key: str, value: str) -> LazyDataFrame:
+        return LazyDataFrame(self._py_lazy_data_frame.spread(key, value))
+
+    def gather(self, key: str, value: str, *columns: str) -> LazyDataFrame:
+        return LazyDataFrame(self._py_lazy_data_frame.gather(key, value, columns))
+
+    def inner_join(
+        self,
+        other: DataFrame | LazyDataFrame,
+        by: Sequence[str | tuple[str, str]] | None = None,
+    ) -> LazyDataFrame:
+        return LazyDataFrame(
+            self._py_lazy_data_frame.inner_join(
+                py_lazy_data_frame_from(other), standardize_join_by(self, other, by)
+            )
+        )
+
+    def outer_join(
+        self,
+        other: DataFrame | LazyDataFrame,
+        by: Sequence[str | tuple[str, str]] | None = None,
+    ) -> LazyDataFrame:
+        return LazyDataFrame(
+            self._py_lazy_data_frame.outer_join(
+                py_lazy_data_frame_from(other), standardize_join_by(self, other, by)
+            )
+        )
+
+    def left_join(
+        self,
+        other: DataFrame | LazyDataFrame,
+        by: Sequence[str | tuple[str, str]] | None = None,
+    ) -> LazyDataFrame:
+        return LazyDataFrame(
+            self._py_lazy_data_frame.left_join(
+                py_lazy_data_frame_from(other), standardize_join_by(self, other, by)
+            )
+        )
+
+    def __repr__(self):
+        group_strs = [f".group_by({', '.join(map(repr, level))})" for level in self.group_levels]
+        return f"LazyDataFrame({', '.join(self.column_names)}){''.join(group_strs)}"
@@ -0,0 +1,121 @@
+"""Settings for how Tabeline executes queries.
+
+The settings are process-wide, like the Polars thread pool they configure. `max_threads` and
+`streaming_chunk_size` are read by Polars when its thread pool and streaming engine first start,
+so they must be set before the first query; they can be set ahead of time with the
+`POLARS_MAX_THREADS` and `POLARS_IDEAL_MORSEL_SIZE` environment variables instead.
+"""
+
+from __future__ import annotations
+
+__all__ = ["Config", "context", "get", "update"]
+
+import os
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+from ._tabeline import (
+    default_streaming,
+    set_default_streaming,
+    set_streaming_chunk_size,
+    thread_pool_size,
+)
+from ._tabeline import max_threads as _max_threads
+from ._tabeline import streaming_chunk_size as _streaming_chunk_size
+
+_MAX_THREADS_VARIABLE = "POLARS_MAX_THREADS"
+
+_lock = threading.RLock()
+
+
+@dataclass(frozen=True, kw_only=True)
+class Config:
+    """The effective execution settings.
+
+    `max_threads` is the number of threads in the Polars thread pool, which runs every query.
+    `streaming` is whether queries that do not choose an engine use the streaming engine.
+    `streaming_chunk_size` is the number of rows per batch in the streaming engine, or `None` for
+    Polars' default.
+    """
+
+    max_threads: int
+    streaming: bool
+    streaming_chunk_size: int | None
+
+
+def get() -> Config:
+    """Report the settings in effect.
+
+    This does not start the Polars thread pool, so `max_threads` can still be changed afterward if
+    no query has run.
+    """
+    return Config(
+        max_threads=_max_threads(),
+        streaming=default_streaming(),
+        streaming_chunk_size=_streaming_chunk_size(),
+    )
+
+
+def update(
+    *,
+    max_threads: int | None = None,
+    streaming: bool | None = None,
+    streaming_chunk_size: int | None = None,
+) -> None:
+    """Change the settings that are given, leaving the others as they are.
+
+    `max_threads` caps the Polars thread pool, which is the only pool Tabeline uses. It starts the
+    pool if necessary and raises `RuntimeError` if the pool is already running with a different
+    number of threads. `streaming` sets the engine for every eager verb and for
+    `LazyDataFrame.collect` when it is not given `streaming`. `streaming_chunk_size` sets the
+    number of rows per batch in the streaming engine and raises `RuntimeError` if the streaming
+    engine has already run with a different size.
+    """
+    if max_threads is not None and max_threads < 1:
+        raise ValueError(f"max_threads must be at least 1, but got {max_threads}")
+    if streaming_chunk_size is not None and streaming_chunk_size < 1:
+        raise ValueError(
+            f"streaming_chunk_size must be at least 1, but got {streaming_chunk_size}"
+        )
+
+    with _lock:
+        if streaming_chunk_size is not None:
+            set_streaming_chunk_size(streaming_chunk_size)
+
+        if max_threads is not None:
+            # The pool only takes its size from the environment, which it reads when it starts
+            previous = os.environ.get(_MAX_THREADS_VARIABLE)
+            os.environ[_MAX_THREADS_VARIABLE] = str(max_threads)
+            actual_threads = thread_pool_size()
+            if actual_threads != max_threads:
+                if previous is None:
+                    del os.environ[_MAX_THREADS_VARIABLE]
+                else:
+                    os.environ[_MAX_THREADS_VARIABLE] = previous
+                raise RuntimeError(
+                    f"The thread pool is already running with {actual_threads} threads; "
+                    f"max_threads must be set before the first query"
+                )
+
+        if streaming is not None:
+            set_default_streaming(streaming)
+
+
+@contextmanager
+def context(*, streaming: bool) -> Iterator[Config]:
+    """Switch the default engine for the duration of a `with` block.
+
+    The block receives the resulting settings, and the previous default engine is restored when
+    it exits. Because the setting is process-wide, it also applies to other threads while the
+    block runs. The thread count and chunk size cannot change once queries have run, so they are
+    set with `update` instead.
+    """
+    with _lock:
+        previous = default_streaming()
+        set_default_streaming(streaming)
+    try:
+        yield get()
+    finally:
+        set_default_streaming(previous)
@@ -1,15 +1,28 @@
 use polars::prelude::*;
+use polars_arrow::array::{new_empty_array, BooleanArray, PrimitiveArray};
+use polars_arrow::bitmap::Bitmap;
+use polars_arrow::datatypes::Field as ArrowField;
 use pyo3::{
-    exceptions::{PyIndexError, PyStopIteration},
+    buffer::{Element, ElementType, PyBuffer},
+    exceptions::{PyBufferError, PyIndexError, PyStopIteration, PyValueError},
+    ffi,
     prelude::*,
-    types::PyList,
+    sync::MutexExt,
+    types::{PyCapsule, PyMemoryView},
     IntoPyObjectExt,
 };
+use std::ffi::{c_char, c_int, c_void, CStr, CString};
+use std::ptr;
+use std::sync::Mutex;
 
 use crate::{
-    arrow::{polars_arrow_array_from_pyarrow, pyarrow_array_from_polars_arrow_array},
-    error::IncompatibleTypeError,
-    py_scalar::PyScalar,
+    arrow::{
+        array_capsules, arrays_from_arrow_producer, polars_arrow_array_from_pyarrow,
+        pyarrow_array_from_polars_arrow_array, schema_capsule, stream_capsule,
+    },
+    data_type::PolarsDataType,
+    from_sequence::column_from_sequence,
+    py_scalar::{py_objects_from_series, PyScalar},
     DataType, IndexOutOfBoundsError,
 };
 
@@ -19,43 +32,47 @@ pub struct PyArray {
     pub(crate) polars_column: Column,
 }
 
-fn collect_elements_of_given_type<T>(
-    elements: &Bound<'_, PyList>,
-    data_type: DataType,
-) -> PyResult<Column>
-where
-    for<'py> T: FromPyObject<'py, 'py>,
-    Series: FromIterator<Option<T>>,
-{
-    let converted_elements = elements
-        .iter()
-        .enumerate()
-        .map(|(i, item)| {
-            if item.is_none() {
-                Ok(None)
-            } else {
-                match item.extract::<T>() {
-                    Ok(value) => Ok(Some(value)),
-                    Err(_) => Err(PyErr::from_value(
-                        IncompatibleTypeError {
-                            expected_type: data_type,
-                            item: item.clone().into(),
-                            location: i,
-                        }
-                        .into_bound_py_any(elements.py())?,
-                    )),
-                }
-            }
-        })
-        .collect::<Result<Vec<Option<T>>, PyErr>>()?;
+// Upper bound on the values converted at once, so that iterating over a
+// single huge chunk does not convert all of it up front
+const ITERATOR_BATCH_SIZE: usize = 4096;
 
-    Ok(Series::from_iter(converted_elements).into_column())
+/// Iterates over an array by converting a batch of values at a time, never
+/// crossing a chunk boundary within a batch
+///
+/// The position is behind a mutex so that threads sharing one iterator each
+/// receive distinct values, even without the GIL.
+#[pyclass(frozen)]
+struct PyArrayIterator {
+    series: Series,
+    /// Position just after the end of each chunk
+    chunk_ends: Vec<usize>,
+    state: Mutex<IteratorState>,
 }
 
-#[pyclass]
-struct PyArrayIterator {
-    polars_column: Column,
+struct IteratorState {
     position: usize,
+    batch: std::vec::IntoIter<Py<PyAny>>,
+}
+
+impl PyArrayIterator {
+    fn new(series: Series) -> Self {
+        let chunk_ends = series
+            .chunk_lengths()
+            .scan(0, |end, length| {
+                *end += length;
+                Some(*end)
+            })
+            .collect();
+
+        PyArrayIterator {
+            series,
+            chunk_ends,
+            state: Mutex::new(IteratorState {
+                position: 0,
+                batch: Vec::new().into_iter(),
+            }),
+        }
+    }
 }
 
 #[pymethods]
@@ -64,68 +81,180 @@ impl PyArrayIterator {
         slf
     }
 
-    fn __next__(mut slf: PyRefMut<'_, Self>, py: Python<'_>) -> PyResult<PyScalar> {
-        match slf.polars_column.get(slf.position) {
-            Ok(value) => {
-                // value holds onto the lifetime of the column, so we need to
-                // bind it before we can mutate
-                let py_value = PyScalar::from(value);
-                slf.position += 1;
-                Ok(py_value)
-            }
-            Err(_) => Err(PyStopIteration::new_err(py.None())),
+    fn __next__(&self, py: Python<'_>) -> PyResult<Py<PyAny>> {
+        // Waiting for the lock detaches from the interpreter, so a thread
+        // holding it can still run Python code while converting a batch
+        let mut state = self.state.lock_py_attached(py).unwrap();
+        if let Some(value) = state.batch.next() {
+            return Ok(value);
+        }
+
+        let position = state.position;
+        let Some(&chunk_end) = self.chunk_ends.iter().find(|&&end| end > position) else {
+            return Err(PyStopIteration::new_err(py.None()));
+        };
+        let batch_end = chunk_end.min(position + ITERATOR_BATCH_SIZE);
+
+        let batch = self.series.slice(position as i64, batch_end - position);
+        state.batch = py_objects_from_series(&batch, py)?.into_iter();
+        state.position = batch_end;
+
+        Ok(state.batch.next().unwrap())
+    }
+}
+
+type BufferConverter = fn(&Bound<'_, PyAny>, &Option<Bitmap>) -> PyResult<Column>;
+
+/// Copy a buffer of `T::Native` into a column.
+fn numeric_column_from_buffer<T>(
+    array: &Bound<'_, PyAny>,
+    validity: &Option<Bitmap>,
+) -> PyResult<Column>
+where
+    T: PolarsNumericType,
+    T::Native: Element,
+{
+    let buffer = PyBuffer::<T::Native>::get(array)?;
+    let values =
+        PrimitiveArray::from_vec(buffer.to_vec(array.py())?).with_validity(validity.clone());
+
+    Ok(ChunkedArray::<T>::with_chunk("".into(), values)
+        .into_series()
+        .into_column())
+}
+
+fn boolean_column_from_buffer(
+    array: &Bound<'_, PyAny>,
+    validity: &Option<Bitmap>,
+) -> PyResult<Column> {
+    let buffer = PyBuffer::<bool>::get(array)?;
+    let values =
+        BooleanArray::from_slice(buffer.to_vec(array.py())?).with_validity(validity.clone());
+
+    Ok(BooleanChunked::with_chunk("".into(), values)
+        .into_series()
+        .into_column())
+}
+
+/// The converter for the elements of a buffer, chosen from the format of the
+/// buffer, or None if the object has no buffer or its elements are not
+/// native-endian booleans or numbers.
+fn buffer_converter(array: &Bound<'_, PyAny>) -> PyResult<Option<BufferConverter>> {
+    let Ok(view) = PyMemoryView::from(array) else {
+        return Ok(None);
+    };
+    let format: String = view.getattr("format")?.extract()?;
+    let Ok(format) = CString::new(format) else {
+        return Ok(None);
+    };
+
+    let converter: BufferConverter = match ElementType::from_format(&format) {
+        ElementType::Bool => boolean_column_from_buffer,
+        ElementType::SignedInteger { bytes: 1 } => numeric_column_from_buffer::<Int8Type>,
+        ElementType::SignedInteger { bytes: 2 } => numeric_column_from_buffer::<Int16Type>,
+        ElementType::SignedInteger { bytes: 4 } => numeric_column_from_buffer::<Int32Type>,
+        ElementType::SignedInteger { bytes: 8 } => numeric_column_from_buffer::<Int64Type>,
+        ElementType::UnsignedInteger { bytes: 1 } => numeric_column_from_buffer::<UInt8Type>,
+        ElementType::UnsignedInteger { bytes: 2 } => numeric_column_from_buffer::<UInt16Type>,
+        ElementType::UnsignedInteger { bytes: 4 } => numeric_column_from_buffer::<UInt32Type>,
+        ElementType::UnsignedInteger { bytes: 8 } => numeric_column_from_buffer::<UInt64Type>,
+        ElementType::Float { bytes: 4 } => numeric_column_from_buffer::<Float32Type>,
+        ElementType::Float { bytes: 8 } => numeric_column_from_buffer::<Float64Type>,
+        _ => return Ok(None),
+    };
+
+    Ok(Some(converter))
+}
+
+/// A read-only view of the values of a primitive column, exported through the
+/// buffer protocol so that NumPy can wrap it without copying. The series is
+/// held so that the values outlive every array viewing them.
+#[pyclass(frozen)]
+struct PyValuesBuffer {
+    series: Series,
+    format: &'static CStr,
+    item_size: isize,
+    shape: [isize; 1],
+}
+
+impl PyValuesBuffer {
+    fn values_ptr(&self) -> *const u8 {
+        fn cont_ptr<T: PolarsNumericType>(chunked_array: &ChunkedArray<T>) -> *const u8 {
+            chunked_array.cont_slice().unwrap().as_ptr() as *const u8
+        }
+
+        match self.series.dtype() {
+            PolarsDataType::Int8 => cont_ptr(self.series.i8().unwrap()),
+            PolarsDataType::Int16 => cont_ptr(self.series.i16().unwrap()),
+            PolarsDataType::Int32 => cont_ptr(self.series.i32().unwrap()),
+            PolarsDataType::Int64 => cont_ptr(self.series.i64().unwrap()),
+            PolarsDataType::UInt8 => cont_ptr(self.series.u8().unwrap()),
+            PolarsDataType::UInt16 => cont_ptr(self.series.u16().unwrap()),
+            PolarsDataType::UInt32 => cont_ptr(self.series.u32().unwrap()),
+            PolarsDataType::UInt64 => cont_ptr(self.series.u64().unwrap()),
+            PolarsDataType::Float32 => cont_ptr(self.series.f32().unwrap()),
+            PolarsDataType::Float64 => cont_ptr(self.series.f64().unwrap()),
+            _ => unreachable!("PyValuesBuffer only holds primitive series"),
         }
     }
 }
 
 #[pymethods]
-impl PyArray {
-    #[staticmethod]
-    #[pyo3(signature = (elements, /, data_type))]
-    pub fn from_list(elements: &Bound<'_, PyList>, data_type: DataType) -> PyResult<PyArray> {
-        // Use the data type to convert each element to that type. Raise an exception if the
-        // element is not compatible with the data type.
-        let polars_data_type = data_type.into();
-
-        let series = match data_type {
-            DataType::Boolean => collect_elements_of_given_type::<bool>(elements, data_type)?,
-            DataType::Integer8 => collect_elements_of_given_type::<i8>(elements, data_type)?,
-            DataType::Integer16 => collect_elements_of_given_type::<i16>(elements, data_type)?,
-            DataType::Integer32 => collect_elements_of_given_type::<i32>(elements, data_type)?,
-            DataType::Integer64 => collect_elements_of_given_type::<i64>(elements, data_type)?,
-            DataType::Whole8 => collect_elements_of_given_type::<u8>(elements, data_type)?,
-            DataType::Whole16 => collect_elements_of_given_type::<u16>(elements, data_type)?,
-            DataType::Whole32 => collect_elements_of_given_type::<u32>(elements, data_type)?,
-            DataType::Whole64 => collect_elements_of_given_type::<u64>(elements, data_type)?,
-            DataType::Float32 => collect_elements_of_given_type::<f32>(elements, data_type)?,
-            DataType::Float64 => collect_elements_of_given_type::<f64>(elements, data_type)?,
-            DataType::String => collect_elements_of_given_type::<String>(elements, data_type)?,
-            DataType::Nothing => {
-                // Apparently, `collect_elements_of_given_type::<!>` is not supported,
-                // so duplicate the checking code, but use new_scalar to actually create.
-                for (i, item) in elements.iter().enumerate() {
-                    if !item.is_none() {
-                        return Err(PyErr::from_value(
-                            IncompatibleTypeError {
-                                expected_type: data_type,
-                                item: item.into(),
-                                location: i,
-                            }
-                            .into_bound_py_any(elements.py())?,
-                        ));
-                    }
-                }
+impl PyValuesBuffer {
+    unsafe fn __getbuffer__(
+        slf: Bound<'_, Self>,
+        view: *mut ffi::Py_buffer,
+        flags: c_int,
+    ) -> PyResult<()> {
+        if view.is_null() {
+            return Err(PyBufferError::new_err("View is null"));
+        }
+        if (flags & ffi::PyBUF_WRITABLE) == ffi::PyBUF_WRITABLE {
+            return Err(PyBufferError::new_err("Array values are read-only"));
+        }
 
-                Column::new_scalar(
-                    "".into(),
-                    Scalar::new(polars_data_type, AnyValue::Null),
-                    elements.len(),
-                )
-            }
+        let buffer = slf.get();
+        (*view).buf = buffer.values_ptr() as *mut c_void;
+        (*view).len = buffer.shape[0] * buffer.item_size;
+        (*view).readonly = 1;
+        (*view).itemsize = buffer.item_size;
+        (*view).format = if (flags & ffi::PyBUF_FORMAT) == ffi::PyBUF_FORMAT {
+            buffer.format.as_ptr() as *mut c_char
+        } else {
+            ptr::null_mut()
+        };
+        (*view).ndim = 1;
+        (*view).shape = if (flags & ffi::PyBUF_ND) == ffi::PyBUF_ND {
+            buffer.shape.as_ptr() as *mut isize
+        } else {
+            ptr::null_mut()
         };
+        (*view).strides = if (flags & ffi::PyBUF_STRIDES) == ffi::PyBUF_STRIDES {
+            &buffer.item_size as *const isize as *mut isize
+        } else {
+            ptr::null_mut()
+        };
+        (*view).suboffsets = ptr::null_mut();
+        (*view).internal = ptr::null_mut();
+        // The view owns a reference to this object, which owns the values
+        (*view).obj = slf.into_any().into_ptr();
+
+        Ok(())
+    }
 
+    unsafe fn __releasebuffer__(&self, _view: *mut ffi::Py_buffer) {}
+}
+
+#[pymethods]
+impl PyArray {
+    #[staticmethod]
+    #[pyo3(signature = (elements, /, data_type = None))]
+    pub fn from_sequence(
+        elements: &Bound<'_, PyAny>,
+        data_type: Option<DataType>,
+    ) -> PyResult<PyArray> {
         Ok(PyArray {
-            polars_column: series,
+            polars_column: column_from_sequence(elements, data_type)?,
         })
     }
 
@@ -139,10 +268,7 @@ impl PyArray {
     }
 
     fn __iter__(&self) -> PyArrayIterator {
-        PyArrayIterator {
-            polars_column: self.polars_column.clone(),
-            position: 0,
-        }
+        PyArrayIterator::new(self.polars_column.as_materialized_series().clone())
     }
 
     fn item(&self, key: usize) -> PyResult<PyScalar> {
@@ -202,6 +328,140 @@ impl PyArray {
         Ok(PyArray { polars_column })
     }
 
+    /// Import any object implementing the Arrow PyCapsule interface, such as
+    /// a Polars Series or a PyArrow array or chunked array, sharing its
+    /// buffers. Each chunk of a stream becomes a chunk of the array.
+    #[staticmethod]
+    #[pyo3(signature = (producer, /))]
+    fn from_arrow(producer: &Bound<'_, PyAny>) -> PyResult<PyArray> {
+        let (field, mut arrays) = arrays_from_arrow_producer(producer)?;
+        if arrays.is_empty() {
+            arrays.push(new_empty_array(field.dtype.clone()));
+        }
+
+        let series = Series::try_from((PlSmallStr::EMPTY, arrays))
+            .map_err(|error| PyValueError::new_err(error.to_string()))?;
+
+        Ok(PyArray {
+            polars_column: series.into_column(),
+        })
+    }
+
+    /// Copy a one-dimensional buffer of booleans or of native-endian numbers,
+    /// such as a NumPy array, into a new array. Elements where the optional
+    /// boolean `mask` is true are null. None if the buffer holds any other
+    /// type.
+    #[staticmethod]
+    #[pyo3(signature = (array, /, mask = None))]
+    fn from_buffer(
+        array: &Bound<'_, PyAny>,
+        mask: Option<&Bound<'_, PyAny>>,
+    ) -> PyResult<Option<PyArray>> {
+        // The format is read once, so a buffer of strings or objects falls
+        // back without raising and discarding an error for every type
+        let Some(converter) = buffer_converter(array)? else {
+            return Ok(None);
+        };
+
+        let validity = match mask {
+            None => None,
+            Some(mask) => {
+                let mask = PyBuffer::<bool>::get(mask)?.to_vec(array.py())?;
+                if mask.len() != array.len()? {
+                    return Err(PyValueError::new_err(format!(
+                        "Mask has length {} but array has length {}",
+                        mask.len(),
+                        array.len()?
+                    )));
+                }
+                mask.contains(&true)
+                    .then(|| mask.iter().map(|&masked| !masked).collect::<Bitmap>())
+            }
+        };
+
+        let polars_column = converter(array, &validity)?;
+
+        Ok(Some(PyArray { polars_column }))
+    }
+
+    /// The values as a buffer that NumPy can view, and whether producing it
+    /// required a copy. None if the column has nulls or is not numeric or
+    /// boolean, in which case NumPy needs values that Polars does not store.
+    #[pyo3(signature = ())]
+    fn to_numpy_buffer(&self) -> Option<(PyValuesBuffer, bool)> {
+        let series = self.polars_column.as_materialized_series();
+        if series.null_count() > 0 {
+            return None;
+        }
+
+        let (format, item_size): (&'static CStr, usize) = match series.dtype() {
+            PolarsDataType::Boolean => (c"?", 1),
+            PolarsDataType::Int8 => (c"b", 1),
+            PolarsDataType::Int16 => (c"h", 2),
+            PolarsDataType::Int32 => (c"i", 4),
+            PolarsDataType::Int64 => (c"q", 8),
+            PolarsDataType::UInt8 => (c"B", 1),
+            PolarsDataType::UInt16 => (c"H", 2),
+            PolarsDataType::UInt32 => (c"I", 4),
+            PolarsDataType::UInt64 => (c"Q", 8),
+            PolarsDataType::Float32 => (c"f", 4),
+            PolarsDataType::Float64 => (c"d", 8),
+            _ => return None,
+        };
+
+        // Booleans are stored as bits, but NumPy wants one byte per value
+        let (series, copied) = match series.dtype() {
+            PolarsDataType::Boolean => (series.cast(&PolarsDataType::UInt8).unwrap(), true),
+            _ if series.n_chunks() != 1 => (series.rechunk(), true),
+            _ => (series.clone(), false),
+        };
+
+        let buffer = PyValuesBuffer {
+            shape: [series.len() as isize],
+            series,
+            format,
+            item_size: item_size as isize,
+        };
+        Some((buffer, copied))
+    }
+
+    #[pyo3(signature = ())]
+    fn __arrow_c_schema__<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyCapsule>> {
+        schema_capsule(py, &self.arrow_field())
+    }
+
+    #[pyo3(signature = (requested_schema = None))]
+    fn __arrow_c_array__<'py>(
+        &self,
+        requested_schema: Option<&Bound<'py, PyAny>>,
+        py: Python<'py>,
+    ) -> PyResult<(Bound<'py, PyCapsule>, Bound<'py, PyCapsule>)> {
+        // The requested schema is a hint that producers may ignore
+        let _ = requested_schema;
+
+        let series = self.polars_column.as_materialized_series().rechunk();
+        array_capsules(
+            py,
+            series.to_arrow(0, CompatLevel::newest()),
+            &self.arrow_field(),
+        )
+    }
+
+    #[pyo3(signature = (requested_schema = None))]
+    fn __arrow_c_stream__<'py>(
+        &self,
+        requested_schema: Option<&Bound<'py, PyAny>>,
+        py: Python<'py>,
+    ) -> PyResult<Bound<'py, PyCapsule>> {
+        let _ = requested_schema;
+
+        let series = self.polars_column.as_materialized_series();
+        let chunks = (0..series.n_chunks())
+            .map(|i| series.to_arrow(i, CompatLevel::newest()))
+            .collect();
+        stream_capsule(py, chunks, self.arrow_field())
+    }
+
     #[pyo3(signature = ())]
     fn to_pyarrow_array(&self) -> PyResult<Py<PyAny>> {
         // Convert Column to contiguous Series
@@ -227,6 +487,10 @@ impl PyArray {
 }
 
 impl PyArray {
+    fn arrow_field(&self) -> ArrowField {
+        self.polars_column.field().to_arrow(CompatLevel::newest())
+    }
+
     pub fn is_empty(&self) -> bool {
         self.polars_column.is_empty()
     }
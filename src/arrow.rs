@@ -1,6 +1,12 @@
 use polars::prelude::*;
-use polars_arrow::{array::Array, datatypes::Field, ffi, record_batch::RecordBatchT};
-use pyo3::{ffi::Py_uintptr_t, prelude::*};
+use polars_arrow::{array::Array, datatypes::Field, ffi};
+use pyo3::{
+    exceptions::{PyTypeError, PyValueError},
+    ffi::Py_uintptr_t,
+    prelude::*,
+    types::PyCapsule,
+};
+use std::ffi::CString;
 
 pub fn polars_arrow_array_from_pyarrow(pyarrow_array: &Bound<PyAny>) -> PyResult<Box<dyn Array>> {
     // record_batch must be a pyarrow.RecordBatch
@@ -49,37 +55,113 @@ pub fn pyarrow_array_from_polars_arrow_array<'a>(
     Ok(pyarrow_array)
 }
 
-pub fn record_batches_from_polars_arrow_record_batch<'a>(
-    pyarrow: &Bound<'a, PyModule>,
-    record_batch: RecordBatchT<Box<dyn Array>>,
-) -> PyResult<Bound<'a, PyAny>> {
-    let mut arrow_arrays = Vec::with_capacity(record_batch.width());
+// The Arrow PyCapsule interface
+// https://arrow.apache.org/docs/format/CDataInterface/PyCapsuleInterface.html
 
-    for (array, field) in record_batch
-        .columns()
-        .iter()
-        .zip(record_batch.schema().iter_values())
-    {
-        let pyarrow_array = pyarrow_array_from_polars_arrow_array(pyarrow, array.clone(), field)?;
+/// A C data interface struct moved into a capsule. The structs hold raw
+/// pointers, but the C data interface allows them to be released from any
+/// thread. The capsule's pointer is the struct itself, and dropping it calls
+/// its release callback unless a consumer has already moved it out.
+#[repr(transparent)]
+struct Exported<T>(T);
 
-        arrow_arrays.push(pyarrow_array.unbind());
-    }
+unsafe impl<T> Send for Exported<T> {}
 
-    let arrow_schema = Box::new(ffi::export_field_to_c(&Field {
-        name: PlSmallStr::EMPTY,
-        dtype: ArrowDataType::Struct(record_batch.schema().iter_values().cloned().collect()),
-        is_nullable: false,
-        metadata: None,
-    }));
-    let arrow_schema_ptr: *const ffi::ArrowSchema = &*arrow_schema;
-
-    let pyarrow_schema = pyarrow
-        .getattr("Schema")?
-        .call_method1("_import_from_c", (arrow_schema_ptr as Py_uintptr_t,))?;
-    let pyarrow_record_batch = pyarrow.getattr("RecordBatch")?.call_method1(
-        "from_arrays",
-        (arrow_arrays, pyarrow.py().None(), pyarrow_schema),
+pub fn schema_capsule<'py>(py: Python<'py>, field: &Field) -> PyResult<Bound<'py, PyCapsule>> {
+    PyCapsule::new(
+        py,
+        Exported(ffi::export_field_to_c(field)),
+        Some(CString::new("arrow_schema").unwrap()),
+    )
+}
+
+pub fn array_capsules<'py>(
+    py: Python<'py>,
+    array: Box<dyn Array>,
+    field: &Field,
+) -> PyResult<(Bound<'py, PyCapsule>, Bound<'py, PyCapsule>)> {
+    let array_capsule = PyCapsule::new(
+        py,
+        Exported(ffi::export_array_to_c(array)),
+        Some(CString::new("arrow_array").unwrap()),
     )?;
+    Ok((schema_capsule(py, field)?, array_capsule))
+}
 
-    Ok(pyarrow_record_batch)
+pub fn stream_capsule<'py>(
+    py: Python<'py>,
+    arrays: Vec<Box<dyn Array>>,
+    field: Field,
+) -> PyResult<Bound<'py, PyCapsule>> {
+    let iterator = Box::new(arrays.into_iter().map(Ok::<_, PolarsError>));
+    PyCapsule::new(
+        py,
+        Exported(ffi::export_iterator(iterator, field)),
+        Some(CString::new("arrow_array_stream").unwrap()),
+    )
+}
+
+/// Take ownership of the struct in a capsule, leaving a released struct in
+/// its place so that the capsule's destructor does nothing.
+unsafe fn take_from_capsule<T>(capsule: &Bound<'_, PyAny>, name: &str, empty: T) -> PyResult<T> {
+    let capsule = capsule.cast::<PyCapsule>()?;
+    let capsule_name = capsule
+        .name()?
+        .map(|name| name.to_str().unwrap_or_default());
+    if capsule_name != Some(name) {
+        return Err(PyValueError::new_err(format!(
+            "Expected a PyCapsule named {name}, but got {capsule_name:?}"
+        )));
+    }
+    let pointer = capsule.pointer() as *mut T;
+    Ok(std::ptr::replace(pointer, empty))
+}
+
+/// Import the field and arrays from any object implementing the Arrow
+/// PyCapsule interface, preferring a stream over a single array.
+pub fn arrays_from_arrow_producer(
+    producer: &Bound<'_, PyAny>,
+) -> PyResult<(Field, Vec<Box<dyn Array>>)> {
+    let polars_error = |error: PolarsError| PyValueError::new_err(error.to_string());
+
+    if producer.hasattr("__arrow_c_stream__")? {
+        let capsule = producer.call_method1("__arrow_c_stream__", (producer.py().None(),))?;
+        let stream = unsafe {
+            take_from_capsule(
+                &capsule,
+                "arrow_array_stream",
+                ffi::ArrowArrayStream::empty(),
+            )?
+        };
+
+        let mut reader = unsafe { ffi::ArrowArrayStreamReader::try_new(Box::new(stream)) }
+            .map_err(polars_error)?;
+        let mut arrays = Vec::new();
+        while let Some(array) = unsafe { reader.next() } {
+            arrays.push(array.map_err(polars_error)?);
+        }
+        Ok((reader.field().clone(), arrays))
+    } else if producer.hasattr("__arrow_c_array__")? {
+        let capsules = producer.call_method1("__arrow_c_array__", (producer.py().None(),))?;
+        let (schema_capsule, array_capsule): (Bound<PyAny>, Bound<PyAny>) = capsules.extract()?;
+
+        // The schema is only read, so it stays in its capsule to be released
+        let schema_capsule = schema_capsule.cast::<PyCapsule>()?;
+        let field = unsafe {
+            ffi::import_field_from_c(&*(schema_capsule.pointer() as *const ffi::ArrowSchema))
+        }
+        .map_err(polars_error)?;
+
+        let array = unsafe {
+            let array = take_from_capsule(&array_capsule, "arrow_array", ffi::ArrowArray::empty())?;
+            ffi::import_array_from_c(array, field.dtype.clone())
+        }
+        .map_err(polars_error)?;
+        Ok((field, vec![array]))
+    } else {
+        Err(PyTypeError::new_err(format!(
+            "Expected an object implementing __arrow_c_stream__ or __arrow_c_array__, but got {}",
+            producer.get_type().name()?
+        )))
+    }
 }
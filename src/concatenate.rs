@@ -1,4 +1,5 @@
-use crate::data_frame::{PyDataFrame, DUMMY_NAME};
+use crate::config;
+use crate::data_frame::{polars_io_error, PyDataFrame, DUMMY_NAME};
 use crate::error::{
     DuplicateColumnError, HasGroupsError, UnmatchedColumnsError, UnmatchedGroupLevelsError,
     UnmatchedHeightError,
@@ -41,22 +42,21 @@ pub fn concatenate_rows(
     }
 
     // Perform vertical concatenation
-    let concatenated = concat(
-        validated_lazy_frames,
-        UnionArgs {
-            parallel: true,
-            rechunk: true,
-            ..Default::default()
-        },
-    )
-    .unwrap()
-    .collect()
-    .unwrap();
+    let concatenated = py
+        .detach(|| {
+            let concatenated_lf = concat(
+                validated_lazy_frames,
+                UnionArgs {
+                    parallel: true,
+                    rechunk: true,
+                    ..Default::default()
+                },
+            )?;
+            config::collect(concatenated_lf, None)
+        })
+        .map_err(polars_io_error)?;
 
-    Ok(PyDataFrame {
-        polars_data_frame: concatenated,
-        group_levels: df.group_levels.clone(),
-    })
+    Ok(PyDataFrame::new(concatenated, df.group_levels.clone()))
 }
 
 #[pyfunction]
@@ -122,8 +122,5 @@ pub fn concatenate_columns(
     let concatenated = concat_df_horizontal(&dfs, false, false, false)
         .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string()))?;
 
-    Ok(PyDataFrame {
-        polars_data_frame: concatenated,
-        group_levels: vec![],
-    })
+    Ok(PyDataFrame::new(concatenated, vec![]))
 }
@@ -0,0 +1,100 @@
+use polars::prelude::{DataFrame, Engine, LazyFrame, PolarsResult};
+use polars_core::POOL;
+use pyo3::exceptions::PyRuntimeError;
+use pyo3::prelude::*;
+use std::num::NonZeroUsize;
+use std::sync::atomic::{AtomicBool, Ordering};
+use std::sync::Mutex;
+
+const MAX_THREADS_VARIABLE: &str = "POLARS_MAX_THREADS";
+const CHUNK_SIZE_VARIABLE: &str = "POLARS_IDEAL_MORSEL_SIZE";
+
+// Engine used by collections that do not ask for one, which includes every
+// eager verb
+static STREAMING: AtomicBool = AtomicBool::new(false);
+
+// Rows per batch in the streaming engine, or None for the Polars default
+static STREAMING_CHUNK_SIZE: Mutex<Option<usize>> = Mutex::new(None);
+
+// Polars reads the chunk size when the streaming engine first runs, so
+// changing it afterward would silently do nothing
+static STREAMING_STARTED: AtomicBool = AtomicBool::new(false);
+
+/// The engine to collect with, given the choice of the caller, if any
+pub fn engine(streaming: Option<bool>) -> Engine {
+    if streaming.unwrap_or_else(|| STREAMING.load(Ordering::Relaxed)) {
+        STREAMING_STARTED.store(true, Ordering::Relaxed);
+        Engine::Streaming
+    } else {
+        Engine::Auto
+    }
+}
+
+/// Run a plan on the engine chosen by the caller, if any, or else on the
+/// default engine
+pub fn collect(polars_lazy_frame: LazyFrame, streaming: Option<bool>) -> PolarsResult<DataFrame> {
+    polars_lazy_frame.collect_with_engine(engine(streaming))
+}
+
+#[pyfunction]
+pub fn default_streaming() -> bool {
+    STREAMING.load(Ordering::Relaxed)
+}
+
+#[pyfunction]
+pub fn set_default_streaming(streaming: bool) {
+    STREAMING.store(streaming, Ordering::Relaxed);
+}
+
+#[pyfunction]
+/// The number of rows per batch in the streaming engine, or None for the
+/// Polars default
+pub fn streaming_chunk_size() -> Option<usize> {
+    let size = *STREAMING_CHUNK_SIZE.lock().unwrap();
+    size.or_else(|| {
+        std::env::var(CHUNK_SIZE_VARIABLE)
+            .ok()
+            .and_then(|size| size.parse().ok())
+    })
+}
+
+#[pyfunction]
+pub fn set_streaming_chunk_size(size: usize) -> PyResult<()> {
+    let mut current_size = STREAMING_CHUNK_SIZE.lock().unwrap();
+    if *current_size == Some(size) {
+        return Ok(());
+    }
+    if STREAMING_STARTED.load(Ordering::Relaxed) {
+        return Err(PyRuntimeError::new_err(
+            "The streaming chunk size cannot be changed after the streaming engine has run",
+        ));
+    }
+    // The streaming engine only takes its chunk size from the environment,
+    // so it is set here, once, before the engine has run, instead of when a
+    // query starts on some other thread
+    std::env::set_var(CHUNK_SIZE_VARIABLE, size.to_string());
+    *current_size = Some(size);
+    Ok(())
+}
+
+#[pyfunction]
+/// The number of threads in the Polars thread pool, without starting it
+pub fn max_threads() -> usize {
+    // The pool reads POLARS_MAX_THREADS when it starts, and tabeline only
+    // sets it when starting the pool right away
+    std::env::var(MAX_THREADS_VARIABLE)
+        .ok()
+        .and_then(|max_threads| max_threads.parse().ok())
+        .unwrap_or_else(|| {
+            std::thread::available_parallelism()
+                .map(NonZeroUsize::get)
+                .unwrap_or(1)
+        })
+}
+
+#[pyfunction]
+/// The number of threads in the Polars thread pool, starting it if necessary
+pub fn thread_pool_size(py: Python) -> usize {
+    // The pool reads POLARS_MAX_THREADS when it starts
+    py.detach(|| POOL.current_num_threads())
+}
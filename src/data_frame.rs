@@ -1,26 +1,29 @@
 use crate::array::PyArray;
-use crate::arrow::{
-    polars_arrow_array_from_pyarrow, record_batches_from_polars_arrow_record_batch,
-};
-use crate::data_type::DataType;
+use crate::arrow::{array_capsules, arrays_from_arrow_producer, schema_capsule, stream_capsule};
+use crate::config;
 use crate::error::{
-    ColumnAlreadyExistsError, DuplicateColumnError, FilterTypeError, GroupColumnError,
-    HasGroupsError, IncompatibleLengthError, IndexOutOfBoundsError, NoGroupsError,
-    NonexistentColumnError, RenameExistingError, SummarizeTypeError,
+    python_exception, HasGroupsError, IncompatibleLengthError, IndexOutOfBoundsError,
+    NoGroupsError, NonexistentColumnError,
 };
-use crate::py_scalar::PyScalar;
-use crate::typed_expression::{DataFrameType, ExpressionType, TypedExpression};
+use crate::from_sequence::column_from_sequence;
+use crate::group_index::{GroupIndex, GROUP_ID_NAME};
+use crate::lazy_data_frame::{unused_name, PyLazyDataFrame};
+use crate::py_scalar::{py_objects_from_series, PyScalar};
+use crate::typed_expression::DataFrameType;
 use crate::workarounds::{dummy_column, prepend_dummy_column};
 use crate::{GroupIndexOutOfBoundsError, PyExpression};
-use polars::datatypes::DataType as PolarsDataType;
-use polars::error::PolarsError;
+use flate2::write::GzEncoder;
+use polars::prelude::DataFrame as PolarsDataFrame;
 use polars::prelude::*;
 use polars::series::Series;
-use polars::{frame::UniqueKeepStrategy, prelude::DataFrame as PolarsDataFrame};
-use polars_arrow::array::StructArray;
-use pyo3::types::{PyDict, PyTuple};
+use polars_arrow::array::{new_empty_array, Array as ArrowArray, StructArray};
+use polars_arrow::datatypes::{ArrowDataType, Field as ArrowField};
+use pyo3::types::{PyCapsule, PyDict, PyList, PyString, PyTuple};
 use pyo3::{prelude::*, IntoPyObjectExt};
 use std::collections::{HashMap, HashSet};
+use std::io::{BufWriter, Write};
+use std::num::NonZeroUsize;
+use std::sync::{Arc, OnceLock};
 
 pub const DUMMY_NAME: &str = "_dummy";
 
@@ -29,6 +32,11 @@ pub const DUMMY_NAME: &str = "_dummy";
 pub struct PyDataFrame {
     pub(crate) polars_data_frame: PolarsDataFrame,
     pub(crate) group_levels: Vec<Vec<String>>,
+    // Computed on first use and carried along by verbs that keep the schema
+    pub(crate) schema_fingerprint: OnceLock<u64>,
+    // Built on first use and shared with derived data frames that keep the
+    // same rows and groups
+    pub(crate) group_index: Arc<OnceLock<GroupIndex>>,
 }
 
 #[pymethods]
@@ -58,10 +66,59 @@ impl PyDataFrame {
             polars_columns.push(array.polars_column.with_name(name.into()));
         }
 
-        Ok(PyDataFrame {
-            polars_data_frame: PolarsDataFrame::new(height, polars_columns).unwrap(),
-            group_levels: vec![],
-        })
+        Ok(PyDataFrame::new(
+            PolarsDataFrame::new(height, polars_columns).unwrap(),
+            vec![],
+        ))
+    }
+
+    #[staticmethod]
+    #[pyo3(signature = (columns, /))]
+    fn from_dict(columns: &Bound<'_, PyDict>, py: Python) -> PyResult<PyDataFrame> {
+        let mut names = Vec::with_capacity(columns.len());
+        let mut elements = Vec::with_capacity(columns.len());
+        for (name, column_elements) in columns.iter() {
+            names.push(name.extract::<String>()?);
+            elements.push(column_elements.unbind());
+        }
+
+        // Converting from Python objects needs the interpreter, so columns can
+        // only be converted at the same time when there is no GIL to contend
+        let converted = if elements.len() > 1 && !is_gil_enabled(py) {
+            py.detach(|| column_from_elements_concurrently(&elements))
+        } else {
+            elements
+                .iter()
+                .map(|column_elements| column_from_elements(column_elements.bind(py)))
+                .collect()
+        };
+
+        let mut height = None;
+        let mut polars_columns = Vec::with_capacity(names.len() + 1);
+        for (name, polars_column) in names.into_iter().zip(converted) {
+            let polars_column = polars_column?;
+            match height {
+                None => height = Some(polars_column.len()),
+                Some(height) if polars_column.len() != height => {
+                    return Err(python_exception(
+                        py,
+                        "IncompatibleLengthError",
+                        (height, polars_column.len(), name),
+                    ));
+                }
+                Some(_) => {}
+            }
+            polars_columns.push(polars_column.with_name(name.into()));
+        }
+
+        // Default height when no columns are provided
+        let height = height.unwrap_or(0);
+        polars_columns.insert(0, dummy_column(height));
+
+        Ok(PyDataFrame::new(
+            PolarsDataFrame::new(height, polars_columns).unwrap(),
+            vec![],
+        ))
     }
 
     fn to_tuple_list(&self) -> PyResult<Vec<(String, PyArray)>> {
@@ -117,6 +174,11 @@ impl PyDataFrame {
         PyTuple::new(py, tuples)
     }
 
+    #[getter]
+    fn has_group_index(&self) -> bool {
+        self.group_index.get().is_some()
+    }
+
     #[pyo3(signature = (column_name, /))]
     fn column(&self, column_name: String, py: Python) -> PyResult<PyArray> {
         let col_names = vec![column_name.as_str()];
@@ -158,6 +220,48 @@ impl PyDataFrame {
         Ok(dict)
     }
 
+    /// Up to `length` rows starting at `start`, each as a tuple, or as a dict
+    /// from column name to value if `named`. Each column is converted as a
+    /// whole before the rows are assembled.
+    #[pyo3(signature = (start, length, named))]
+    fn rows<'py>(
+        &self,
+        start: usize,
+        length: usize,
+        named: bool,
+        py: Python<'py>,
+    ) -> PyResult<Bound<'py, PyList>> {
+        let sliced = self.polars_data_frame.slice(start as i64, length);
+
+        let mut names = Vec::new();
+        let mut columns = Vec::new();
+        for column in sliced.columns() {
+            if column.name() == DUMMY_NAME {
+                // Skip dummy column
+                continue;
+            }
+            names.push(PyString::new(py, column.name()));
+            columns.push(py_objects_from_series(column.as_materialized_series(), py)?.into_iter());
+        }
+
+        let rows = (0..sliced.height())
+            .map(|_| {
+                if named {
+                    let dict = PyDict::new(py);
+                    for (name, values) in names.iter().zip(columns.iter_mut()) {
+                        dict.set_item(name, values.next().unwrap())?;
+                    }
+                    Ok(dict.into_any())
+                } else {
+                    let values = columns.iter_mut().map(|values| values.next().unwrap());
+                    Ok(PyTuple::new(py, values)?.into_any())
+                }
+            })
+            .collect::<PyResult<Vec<_>>>()?;
+
+        PyList::new(py, rows)
+    }
+
     #[pyo3(signature = (start, stop, step))]
     fn slice_range0(
         &self,
@@ -169,21 +273,15 @@ impl PyDataFrame {
         // Implements the slice row operation of __get_item__
         self.validate_no_group_levels(py)?;
 
-        let result = self
-            .polars_data_frame
-            .clone()
-            .lazy()
-            .select([all()
-                .as_expr()
-                .slice(start as i64, (stop - start) as i64)
-                .gather_every(step, 0)])
-            .collect()
-            .unwrap();
+        let polars_lazy_frame = self.polars_data_frame.clone().lazy().select([all()
+            .as_expr()
+            .slice(start as i64, (stop - start) as i64)
+            .gather_every(step, 0)]);
+        let result = py
+            .detach(|| config::collect(polars_lazy_frame, None))
+            .map_err(polars_io_error)?;
 
-        Ok(PyDataFrame {
-            polars_data_frame: result,
-            group_levels: vec![],
-        })
+        Ok(PyDataFrame::new(result, vec![]))
     }
 
     fn slice0(&self, indexes: Vec<i64>, py: Python) -> PyResult<PyDataFrame> {
@@ -205,18 +303,7 @@ impl PyDataFrame {
             }
         }
 
-        match self.impl_slice(indexes) {
-            Ok(df) => Ok(df),
-            Err(e) => match e {
-                PolarsError::OutOfBounds(message) => Err(PyErr::from_value(
-                    GroupIndexOutOfBoundsError {
-                        message: message.to_string(),
-                    }
-                    .into_bound_py_any(py)?,
-                )),
-                _ => panic!("{:?}", e),
-            },
-        }
+        self.impl_slice(&indexes, false, py)
     }
 
     #[pyo3(signature = (indexes, /))]
@@ -239,314 +326,92 @@ impl PyDataFrame {
             }
         }
 
-        match self.impl_slice(
-            indexes
-                .iter()
-                .map(|&i| i.checked_sub(1).expect("Index underflow"))
-                .collect(),
-        ) {
-            Ok(df) => Ok(df),
-            Err(e) => match e {
-                PolarsError::OutOfBounds(message) => Err(PyErr::from_value(
-                    GroupIndexOutOfBoundsError {
-                        message: message.to_string(),
-                    }
-                    .into_bound_py_any(py)?,
-                )),
-                _ => panic!("{:?}", e),
-            },
+        let indexes: Vec<i64> = indexes
+            .iter()
+            .map(|&i| i.checked_sub(1).expect("Index underflow"))
+            .collect();
+
+        self.impl_slice(&indexes, true, py)
+    }
+
+    #[pyo3(signature = ())]
+    pub fn lazy(&self) -> PyLazyDataFrame {
+        PyLazyDataFrame {
+            polars_lazy_frame: self.polars_data_frame.clone().lazy(),
+            polars_schema: self.polars_data_frame.schema().clone(),
+            group_levels: self.group_levels.clone(),
+            schema_fingerprint: OnceLock::from(self.schema_fingerprint()),
+            group_ids_name: None,
         }
     }
 
     #[pyo3(signature = (predicate, /))]
     fn filter(&self, predicate: &PyExpression, py: Python) -> PyResult<PyDataFrame> {
-        // Validate the predicate expression
-        let df_type = DataFrameType::from_data_frame(self);
-        let typed_predicate = predicate.validate(&df_type, py)?;
-
-        // Assert that predicate is Boolean
-        if typed_predicate.expression_type().data_type() != DataType::Boolean {
-            return Err(PyErr::from_value(
-                FilterTypeError {
-                    actual_type: typed_predicate.expression_type().data_type(),
-                }
-                .into_bound_py_any(py)?,
-            ));
-        }
-
-        let flattened_groups: Vec<&str> = self.iter_group_names().collect();
-
-        let polars_expression = typed_predicate.to_polars();
-        let grouped_expression = polars_expression.over(flattened_groups.as_slice());
-
-        let filtered_df = self
-            .polars_data_frame
-            .clone()
-            .lazy()
-            .filter(grouped_expression)
-            .collect()
-            .unwrap();
-
-        Ok(PyDataFrame {
-            polars_data_frame: filtered_df,
-            group_levels: self.group_levels.clone(),
-        })
+        self.lazy_with_group_ids(py)?
+            .filter(predicate, py)?
+            .collect(None, py)
     }
 
     #[pyo3(signature = (columns, /))]
     fn distinct(&self, columns: Vec<String>, py: Python) -> PyResult<PyDataFrame> {
-        let column_names: Vec<&str> = columns.iter().map(|s| s.as_str()).collect();
-        self.validate_column_names_unique(&column_names, py)?;
-        self.validate_column_names_exist_vec(&column_names, py)?;
-
-        // Create set of selected columns
-        let selected_set: HashSet<&str> = column_names.iter().copied().collect();
-
-        // Get unmentioned group columns
-        // unique_stable requires them to be String for some reason
-        let unmentioned_groups: Vec<String> = self
-            .iter_group_names()
-            .filter(|&col| !selected_set.contains(col))
-            .map(|s| s.to_string())
-            .collect();
-
-        // Combine group columns and selected columns
-        let mut columns_to_distinct = unmentioned_groups;
-        columns_to_distinct.extend(columns);
-
-        // Get distinct rows
-        let distinct_df = self
-            .polars_data_frame
-            .unique_stable(Some(&columns_to_distinct), UniqueKeepStrategy::First, None)
-            .unwrap();
-
-        Ok(PyDataFrame {
-            polars_data_frame: distinct_df,
-            group_levels: self.group_levels.clone(),
-        })
+        self.lazy_with_group_ids(py)?
+            .distinct(columns, py)?
+            .collect(None, py)
     }
 
     #[pyo3(signature = ())]
-    fn unique(&self) -> PyDataFrame {
-        let unique_df = self
-            .polars_data_frame
-            .unique_stable(None, UniqueKeepStrategy::First, None)
-            .unwrap();
-
-        PyDataFrame {
-            polars_data_frame: unique_df,
-            group_levels: self.group_levels.clone(),
-        }
+    fn unique(&self, py: Python) -> PyResult<PyDataFrame> {
+        self.lazy().unique()?.collect(None, py)
     }
 
     #[pyo3(signature = (columns, /))]
     fn sort(&self, columns: Vec<String>, py: Python) -> PyResult<PyDataFrame> {
-        let column_names: Vec<&str> = columns.iter().map(|s| s.as_str()).collect();
-        self.validate_column_names_unique(&column_names, py)?;
-        self.validate_column_names_exist_vec(&column_names, py)?;
-        self.validate_group_names_not_used(&column_names, py)?;
-
-        let flattened_groups: Vec<&str> = self.iter_group_names().collect();
-
-        let polars_columns = columns.iter().map(col).collect::<Vec<_>>();
-
-        let polars_expression = all()
-            .as_expr()
-            .sort_by(polars_columns, Default::default())
-            .over(flattened_groups.as_slice());
-
-        let sorted_df = self
-            .polars_data_frame
-            .clone()
-            .lazy()
-            .select(&[polars_expression])
-            .collect()
-            .unwrap();
-
-        Ok(PyDataFrame {
-            polars_data_frame: sorted_df,
-            group_levels: self.group_levels.clone(),
-        })
+        self.lazy_with_group_ids(py)?
+            .sort(columns, py)?
+            .collect(None, py)
     }
 
     #[pyo3(signature = (columns, /))]
     fn cluster(&self, columns: Vec<String>, py: Python) -> PyResult<PyDataFrame> {
-        let column_names: Vec<&str> = columns.iter().map(|s| s.as_str()).collect();
-        self.validate_column_names_unique(&column_names, py)?;
-        self.validate_column_names_exist_vec(&column_names, py)?;
-        self.validate_group_names_not_used(&column_names, py)?;
-
-        let flattened_groups: Vec<&str> = self.iter_group_names().collect();
-
-        // Combine group columns and selected columns
-        let mut window_columns = flattened_groups.clone();
-        window_columns.extend(column_names);
-
-        let clustered_df = self
-            .polars_data_frame
-            .clone()
-            .lazy()
-            .with_column(arange(0.into(), len(), 1, PolarsDataType::Int32).alias("_index"))
-            .with_column(col("_index").min().over(window_columns))
-            .select(&[all()
-                .as_expr()
-                .sort_by([col("_index")], Default::default())
-                .over(flattened_groups.as_slice())])
-            .drop(cols(["_index"]))
-            .collect()
-            .unwrap();
-
-        Ok(PyDataFrame {
-            polars_data_frame: clustered_df,
-            group_levels: self.group_levels.clone(),
-        })
+        self.lazy_with_group_ids(py)?
+            .cluster(columns, py)?
+            .collect(None, py)
     }
 
     #[pyo3(signature = (columns, /))]
     fn select(&self, columns: Vec<String>, py: Python) -> PyResult<PyDataFrame> {
-        let column_names: Vec<&str> = columns.iter().map(|s| s.as_str()).collect();
-        self.validate_column_names_unique(&column_names, py)?;
-        self.validate_column_names_exist_vec(&column_names, py)?;
-
-        // Create sets for lookup
-        let select_set: HashSet<&str> = column_names.iter().copied().collect();
-        let group_set: HashSet<&str> = self.iter_group_names().collect();
-
-        // Find unmentioned group columns that appear in the original column order
-        let unmentioned_groups: Vec<&str> = self
-            .iter_column_names()
-            .filter(|&col| group_set.contains(col) && !select_set.contains(col))
-            .collect();
-
-        // Combine unmentioned groups and selected columns in order
-        let mut columns_to_select = vec![];
-        columns_to_select.extend(unmentioned_groups);
-        columns_to_select.extend(column_names.iter());
-
-        // Keep only the selected columns
-        let selected_df = self.polars_data_frame.select(columns_to_select).unwrap();
-
-        Ok(PyDataFrame {
-            polars_data_frame: selected_df,
-            group_levels: self.group_levels.clone(),
-        })
+        Ok(self
+            .lazy()
+            .select(columns, py)?
+            .collect(None, py)?
+            .with_group_index_of(self))
     }
 
     #[pyo3(signature = (columns, /))]
     fn deselect(&self, columns: Vec<String>, py: Python) -> PyResult<PyDataFrame> {
-        let column_names: Vec<&str> = columns.iter().map(|s| s.as_str()).collect();
-        self.validate_column_names_unique(&column_names, py)?;
-        self.validate_column_names_exist_vec(&column_names, py)?;
-        self.validate_group_names_not_used(&column_names, py)?;
-
-        // Drop the selected columns
-        let dropped_df = self.polars_data_frame.drop_many(column_names);
-
-        Ok(PyDataFrame {
-            polars_data_frame: dropped_df,
-            group_levels: self.group_levels.clone(),
-        })
+        Ok(self
+            .lazy()
+            .deselect(columns, py)?
+            .collect(None, py)?
+            .with_group_index_of(self))
     }
 
     #[pyo3(signature = (columns, /))]
     fn rename(&self, columns: Vec<(String, String)>, py: Python) -> PyResult<PyDataFrame> {
-        let from_names: Vec<&str> = columns.iter().map(|(_, c)| c.as_str()).collect();
-        self.validate_column_names_unique(&from_names, py)?;
-        self.validate_column_names_exist_vec(&from_names, py)?;
-
-        let to_names: Vec<&str> = columns.iter().map(|(c, _)| c.as_str()).collect();
-        self.validate_column_names_unique(&to_names, py)?;
-
-        // Do not allow renaming to existing columns
-        let mut existing_columns: HashSet<&str> = self
-            .iter_column_names()
-            .filter(|&name| name != DUMMY_NAME)
-            .collect();
-
-        for name in &from_names {
-            existing_columns.remove(name);
-        }
-
-        for (to_name, from_name) in &columns {
-            if existing_columns.contains(to_name.as_str()) {
-                return Err(PyErr::from_value(
-                    RenameExistingError {
-                        old_column: from_name.clone(),
-                        new_column: to_name.clone(),
-                    }
-                    .into_bound_py_any(py)?,
-                ));
-            }
-        }
-
-        let column_mapping: HashMap<&str, &str> = columns
-            .iter()
-            .map(|(old, new)| (new.as_str(), old.as_str()))
-            .collect();
-
-        let renamed_df = self
-            .polars_data_frame
-            .clone()
+        Ok(self
             .lazy()
-            .rename(from_names, to_names, true)
-            .collect()
-            .unwrap();
-
-        let renamed_group_levels: Vec<Vec<String>> = self
-            .group_levels
-            .iter()
-            .map(|level| {
-                level
-                    .iter()
-                    .map(|col| {
-                        column_mapping
-                            .get(col.as_str())
-                            .map_or(col.clone(), |&new_name| new_name.to_string())
-                    })
-                    .collect()
-            })
-            .collect();
-
-        Ok(PyDataFrame {
-            polars_data_frame: renamed_df,
-            group_levels: renamed_group_levels,
-        })
+            .rename(columns, py)?
+            .collect(None, py)?
+            .with_group_index_of(self))
     }
 
     #[pyo3(signature = (mutators, /))]
     fn mutate(&self, mutators: Vec<(String, PyExpression)>, py: Python) -> PyResult<PyDataFrame> {
-        let mutated_names: Vec<&str> = mutators.iter().map(|(c, _)| c.as_str()).collect();
-        self.validate_group_names_not_used(&mutated_names, py)?;
-
-        // Sequentially validate expressions
-        let mut df_type = DataFrameType::from_data_frame(self);
-        let mut typed_mutators = Vec::new();
-        for (column, expression) in &mutators {
-            let typed_expression = expression.validate(&df_type, py)?;
-            let result_dt = typed_expression.expression_type().data_type();
-            let typed_expression = typed_expression.cast_if_needed(result_dt);
-            df_type = df_type.with_column(column.clone(), typed_expression.expression_type());
-            typed_mutators.push((column.clone(), typed_expression));
-        }
-
-        let flattened_groups: Vec<&str> = self.iter_group_names().collect();
-
-        let mut polars_df = self.polars_data_frame.clone().lazy();
-
-        for (column, typed_expr) in typed_mutators {
-            let polars_expression = typed_expr.to_polars();
-            let grouped_expression = polars_expression.over(flattened_groups.as_slice());
-            let named_expression = grouped_expression.alias(&column);
-
-            polars_df = polars_df.with_column(named_expression);
-        }
-
-        let mutated_df = polars_df.collect().unwrap();
-
-        Ok(PyDataFrame {
-            polars_data_frame: mutated_df,
-            group_levels: self.group_levels.clone(),
-        })
+        Ok(self
+            .lazy_with_group_ids(py)?
+            .mutate(mutators, py)?
+            .collect(None, py)?
+            .with_group_index_of(self))
     }
 
     #[pyo3(signature = (mutators, /))]
@@ -555,60 +420,23 @@ impl PyDataFrame {
         mutators: Vec<(String, PyExpression)>,
         py: Python,
     ) -> PyResult<PyDataFrame> {
-        let transmuted_names: Vec<&str> = mutators.iter().map(|(c, _)| c.as_str()).collect();
-        self.validate_group_names_not_used(&transmuted_names, py)?;
-
-        // Sequentially validate expressions
-        let mut df_type = DataFrameType::from_data_frame(self);
-        let mut typed_mutators = Vec::new();
-        for (column, expression) in &mutators {
-            let typed_expression = expression.validate(&df_type, py)?;
-            let result_dt = typed_expression.expression_type().data_type();
-            let typed_expression = typed_expression.cast_if_needed(result_dt);
-            df_type = df_type.with_column(column.clone(), typed_expression.expression_type());
-            typed_mutators.push((column.clone(), typed_expression));
-        }
-
-        let flattened_groups: Vec<&str> = self.iter_group_names().collect();
-
-        let mut polars_df = self.polars_data_frame.clone().lazy();
-
-        for (column, typed_expr) in typed_mutators {
-            let polars_expression = typed_expr.to_polars();
-            let grouped_expression = polars_expression.over(flattened_groups.as_slice());
-            let named_expression = grouped_expression.alias(&column);
-
-            polars_df = polars_df.with_column(named_expression);
-        }
-
-        let mut all_columns: Vec<&str> = flattened_groups;
-        all_columns.extend(transmuted_names);
-
-        let transmuted_df = polars_df
-            .select(all_columns.into_iter().map(col).collect::<Vec<Expr>>())
-            .collect()
-            .unwrap();
-
-        Ok(PyDataFrame {
-            polars_data_frame: transmuted_df,
-            group_levels: self.group_levels.clone(),
-        })
+        Ok(self
+            .lazy_with_group_ids(py)?
+            .transmute(mutators, py)?
+            .collect(None, py)?
+            .with_group_index_of(self))
     }
 
     #[pyo3(signature = (group_level, /))]
     fn group_by(&self, group_level: Vec<String>, py: Python<'_>) -> PyResult<PyDataFrame> {
-        let column_names: Vec<&str> = group_level.iter().map(|s| s.as_str()).collect();
-        self.validate_column_names_unique(&column_names, py)?;
-        self.validate_column_names_exist_vec(&column_names, py)?;
-        self.validate_group_names_not_used(&column_names, py)?;
-
-        // Append the new group level
-        let mut new_group_levels = self.group_levels.clone();
-        new_group_levels.push(group_level);
+        // Grouping only changes metadata, so there is nothing to collect
+        let grouped = self.lazy().group_by(group_level, py)?;
 
         Ok(PyDataFrame {
             polars_data_frame: self.polars_data_frame.clone(),
-            group_levels: new_group_levels,
+            group_levels: grouped.group_levels,
+            schema_fingerprint: self.schema_fingerprint.clone(),
+            group_index: Arc::new(OnceLock::new()),
         })
     }
 
@@ -619,6 +447,8 @@ impl PyDataFrame {
         Ok(PyDataFrame {
             polars_data_frame: self.polars_data_frame.clone(),
             group_levels: new_group_levels,
+            schema_fingerprint: self.schema_fingerprint.clone(),
+            group_index: Arc::new(OnceLock::new()),
         })
     }
 
@@ -627,113 +457,23 @@ impl PyDataFrame {
         PyDataFrame {
             polars_data_frame: self.polars_data_frame.clone(),
             group_levels: vec![],
+            schema_fingerprint: self.schema_fingerprint.clone(),
+            group_index: Arc::new(OnceLock::new()),
         }
     }
 
     #[pyo3(signature = (columns, /))]
     fn summarize(&self, columns: Vec<(String, PyExpression)>, py: Python) -> PyResult<PyDataFrame> {
-        let summarized_names: Vec<&str> = columns.iter().map(|(c, _)| c.as_str()).collect();
-        self.validate_group_names_not_used(&summarized_names, py)?;
-        let new_group_levels = self.drop_one_group_level(py)?;
-
-        // Sequentially validate expressions
-        let mut df_type = DataFrameType::from_data_frame(self);
-        let mut typed_columns = Vec::new();
-        for (name, column) in &columns {
-            let typed = column.validate(&df_type, py)?;
-
-            // Assert that each expression is scalar (a reduction)
-            if let ExpressionType::Array(_) = typed.expression_type() {
-                return Err(PyErr::from_value(
-                    SummarizeTypeError {
-                        column: name.clone(),
-                    }
-                    .into_bound_py_any(py)?,
-                ));
-            }
-
-            let result_dt = typed.expression_type().data_type();
-            let typed = typed.cast_if_needed(result_dt);
-            df_type = df_type.with_column(name.clone(), typed.expression_type());
-            typed_columns.push((name.clone(), typed));
-        }
-
-        let flattened_groups: Vec<&str> = self.iter_group_names().collect();
-
-        // There is no way to sequentially evaluate expressions in a group_by
-        // context, so each reducer must be substituted into subsequent reducers:
-        // https://stackoverflow.com/q/71120396/
-        let mut substituted_columns = Vec::<(String, TypedExpression)>::new();
-        let typed_columns_vec: Vec<(String, TypedExpression)> = typed_columns;
-        let mut substitutions = HashMap::<&str, TypedExpression>::new();
-        for (name, typed) in &typed_columns_vec {
-            substituted_columns.push((name.clone(), typed.substitute(&substitutions)));
-            substitutions.insert(name.as_str(), typed.clone());
-        }
-
-        let mut polars_expressions = vec![];
-        for (column, typed_expr) in substituted_columns {
-            let polars_expression = typed_expr.to_polars();
-            let named_expression = polars_expression.alias(&column);
-
-            polars_expressions.push(named_expression);
-        }
-
-        let summarized_df = self
-            .polars_data_frame
-            .clone()
-            .lazy()
-            .group_by_stable(flattened_groups)
-            .agg(polars_expressions)
-            .collect()
-            .unwrap();
-
-        Ok(PyDataFrame {
-            polars_data_frame: summarized_df,
-            group_levels: new_group_levels,
-        })
+        self.lazy_with_group_ids(py)?
+            .summarize(columns, py)?
+            .collect(None, py)
     }
 
     #[pyo3(signature = (key, value))]
     fn spread(&self, key: String, value: String, py: Python) -> PyResult<PyDataFrame> {
-        let produced_column_names = vec![key.as_str(), value.as_str()];
-        self.validate_column_names_unique(&produced_column_names, py)?;
-        self.validate_column_names_exist_vec(&produced_column_names, py)?;
-        self.validate_group_names_not_used(&produced_column_names, py)?;
-        let new_group_levels = self.drop_one_group_level(py)?;
-
-        let flattened_groups: Vec<&str> = self.iter_group_names().collect();
-
-        let on_columns = self
-            .polars_data_frame
-            .column(&key)
-            .unwrap()
-            .unique()
-            .unwrap()
-            .sort(Default::default())
-            .unwrap()
-            .into_frame();
-
-        let pivot_df = self
-            .polars_data_frame
-            .clone()
-            .lazy()
-            .pivot(
-                cols([key]),
-                std::sync::Arc::new(on_columns),
-                cols(flattened_groups),
-                cols([value]),
-                element().first(),
-                true,
-                "_".into(),
-            )
-            .collect()
-            .unwrap();
-
-        Ok(PyDataFrame {
-            polars_data_frame: pivot_df,
-            group_levels: new_group_levels,
-        })
+        self.lazy_with_group_ids(py)?
+            .spread(key, value, py)?
+            .collect(None, py)
     }
 
     #[pyo3(signature = (key, value, columns))]
@@ -744,54 +484,9 @@ impl PyDataFrame {
         columns: Vec<String>,
         py: Python,
     ) -> PyResult<PyDataFrame> {
-        let consumed_column_names: Vec<&str> = columns.iter().map(|s| s.as_str()).collect();
-        self.validate_column_names_unique(&consumed_column_names, py)?;
-        self.validate_column_names_exist_vec(&consumed_column_names, py)?;
-        self.validate_group_names_not_used(&consumed_column_names, py)?;
-        for name in self.iter_column_names() {
-            if name == key.as_str() || name == value.as_str() {
-                return Err(PyErr::from_value(
-                    ColumnAlreadyExistsError {
-                        column_name: name.to_string(),
-                    }
-                    .into_bound_py_any(py)?,
-                ));
-            }
-        }
-
-        let consumed_column_set: HashSet<&str> = consumed_column_names.iter().copied().collect();
-        let unpivot_columns: Vec<&str> = self
-            .iter_column_names()
-            .filter(|&col| !consumed_column_set.contains(col))
-            .collect();
-
-        let unpivot_df = self
-            .polars_data_frame
-            .clone()
-            .lazy()
-            .unpivot(UnpivotArgsDSL {
-                index: cols(unpivot_columns.clone()),
-                on: Some(cols(consumed_column_names)),
-                variable_name: Some(key.clone().into()),
-                value_name: Some(value.into()),
-            })
-            .collect()
-            .unwrap();
-
-        let existing_group_columns: HashSet<&str> = self.iter_group_names().collect();
-        let new_group_level: Vec<String> = unpivot_columns
-            .iter()
-            .copied()
-            .filter(|&col| !existing_group_columns.contains(col))
-            .map(|s| s.to_string())
-            .collect();
-        let mut group_levels = self.group_levels.clone();
-        group_levels.push(new_group_level);
-
-        Ok(PyDataFrame {
-            polars_data_frame: unpivot_df,
-            group_levels,
-        })
+        self.lazy()
+            .gather(key, value, columns, py)?
+            .collect(None, py)
     }
 
     #[pyo3(signature = (other, by, /))]
@@ -801,33 +496,9 @@ impl PyDataFrame {
         by: Vec<(String, String)>,
         py: Python,
     ) -> PyResult<PyDataFrame> {
-        let (left_columns, right_columns) = self.validate_join_by(&by, other, py)?;
-
-        let joined_df = self
-            .polars_data_frame
-            .clone()
-            .join(
-                &other.polars_data_frame,
-                left_columns,
-                right_columns,
-                JoinArgs {
-                    how: JoinType::Inner,
-                    validation: JoinValidation::ManyToMany,
-                    suffix: None,
-                    slice: None,
-                    nulls_equal: true,
-                    coalesce: JoinCoalesce::CoalesceColumns,
-                    maintain_order: MaintainOrderJoin::LeftRight,
-                    build_side: None,
-                },
-                None,
-            )
-            .unwrap();
-
-        Ok(PyDataFrame {
-            polars_data_frame: joined_df,
-            group_levels: vec![],
-        })
+        self.lazy()
+            .inner_join(&other.lazy(), by, py)?
+            .collect(None, py)
     }
 
     #[pyo3(signature = (other, by, /))]
@@ -837,33 +508,9 @@ impl PyDataFrame {
         by: Vec<(String, String)>,
         py: Python,
     ) -> PyResult<PyDataFrame> {
-        let (left_columns, right_columns) = self.validate_join_by(&by, other, py)?;
-
-        let joined_df = self
-            .polars_data_frame
-            .clone()
-            .join(
-                &other.polars_data_frame,
-                left_columns,
-                right_columns,
-                JoinArgs {
-                    how: JoinType::Full,
-                    validation: JoinValidation::ManyToMany,
-                    suffix: None,
-                    slice: None,
-                    nulls_equal: true,
-                    coalesce: JoinCoalesce::CoalesceColumns,
-                    maintain_order: MaintainOrderJoin::LeftRight,
-                    build_side: None,
-                },
-                None,
-            )
-            .unwrap();
-
-        Ok(PyDataFrame {
-            polars_data_frame: joined_df,
-            group_levels: vec![],
-        })
+        self.lazy()
+            .outer_join(&other.lazy(), by, py)?
+            .collect(None, py)
     }
 
     #[pyo3(signature = (other, by, /))]
@@ -873,36 +520,12 @@ impl PyDataFrame {
         by: Vec<(String, String)>,
         py: Python,
     ) -> PyResult<PyDataFrame> {
-        let (left_columns, right_columns) = self.validate_join_by(&by, other, py)?;
-
-        let joined_df = self
-            .polars_data_frame
-            .clone()
-            .join(
-                &other.polars_data_frame,
-                left_columns,
-                right_columns,
-                JoinArgs {
-                    how: JoinType::Left,
-                    validation: JoinValidation::ManyToMany,
-                    suffix: None,
-                    slice: None,
-                    nulls_equal: true,
-                    coalesce: JoinCoalesce::CoalesceColumns,
-                    maintain_order: MaintainOrderJoin::LeftRight,
-                    build_side: None,
-                },
-                None,
-            )
-            .unwrap();
-
-        Ok(PyDataFrame {
-            polars_data_frame: joined_df,
-            group_levels: vec![],
-        })
+        self.lazy()
+            .left_join(&other.lazy(), by, py)?
+            .collect(None, py)
     }
 
-    fn __str__(&self) -> String {
+    fn __str__(&self, py: Python) -> PyResult<String> {
         let levels_str = if !self.group_levels.is_empty() {
             format!(
                 "group_levels: {}\n",
@@ -915,94 +538,278 @@ impl PyDataFrame {
         } else {
             String::new()
         };
-        format!(
-            "{}{}",
-            levels_str,
-            self.polars_data_frame
-                .clone()
-                .lazy()
-                .drop(cols([DUMMY_NAME]))
-                .collect()
-                .unwrap()
-        )
+        // Formatting reads every value shown, so other threads run meanwhile
+        let polars_lazy_frame = self
+            .polars_data_frame
+            .clone()
+            .lazy()
+            .drop(cols([DUMMY_NAME]));
+        let table = py
+            .detach(|| config::collect(polars_lazy_frame, None).map(|table| table.to_string()))
+            .map_err(polars_io_error)?;
+        Ok(format!("{}{}", levels_str, table))
     }
 
     #[staticmethod]
-    #[pyo3(signature = (path, /))]
-    fn read_csv(path: String) -> PyResult<PyDataFrame> {
-        let polars_data_frame = CsvReadOptions::default()
+    #[pyo3(signature = (
+        path,
+        /,
+        columns = None,
+        dtypes = None,
+        n_rows = None,
+        infer_schema_length = Some(100),
+        n_threads = None,
+    ))]
+    fn read_csv(
+        path: String,
+        columns: Option<Vec<String>>,
+        dtypes: Option<HashMap<String, crate::data_type::DataType>>,
+        n_rows: Option<usize>,
+        infer_schema_length: Option<usize>,
+        n_threads: Option<usize>,
+        py: Python,
+    ) -> PyResult<PyDataFrame> {
+        let columns = columns.map(|columns| {
+            columns
+                .into_iter()
+                .map(PlSmallStr::from)
+                .collect::<Arc<[PlSmallStr]>>()
+        });
+        let schema_overwrite = dtypes.map(|dtypes| {
+            Arc::new(
+                dtypes
+                    .into_iter()
+                    .map(|(name, data_type)| Field::new(name.into(), data_type.into()))
+                    .collect::<Schema>(),
+            )
+        });
+
+        let options = CsvReadOptions::default()
             .with_has_header(true)
-            .try_into_reader_with_file_path(Some(path.into()))
-            .unwrap()
-            .finish()
-            .unwrap();
+            .with_columns(columns)
+            .with_schema_overwrite(schema_overwrite)
+            .with_n_rows(n_rows)
+            .with_infer_schema_length(infer_schema_length)
+            .with_n_threads(n_threads);
+
+        // Parsing does not touch any Python objects, so other threads may run
+        let polars_data_frame = py
+            .detach(|| {
+                options
+                    .try_into_reader_with_file_path(Some(path.into()))?
+                    .finish()
+            })
+            .map_err(polars_io_error)?;
 
-        Ok(PyDataFrame {
-            polars_data_frame: prepend_dummy_column(polars_data_frame),
-            group_levels: vec![],
-        })
+        Ok(PyDataFrame::new(
+            prepend_dummy_column(polars_data_frame),
+            vec![],
+        ))
     }
 
-    #[pyo3(signature = (path, /))]
-    fn write_csv(&self, path: String, py: Python) -> PyResult<()> {
+    #[pyo3(signature = (
+        path,
+        /,
+        compression = None,
+        compression_level = None,
+        batch_size = 1024,
+        n_threads = None,
+    ))]
+    fn write_csv(
+        &self,
+        path: String,
+        compression: Option<&str>,
+        compression_level: Option<i32>,
+        batch_size: usize,
+        n_threads: Option<usize>,
+        py: Python,
+    ) -> PyResult<()> {
         self.validate_no_group_levels(py)?;
 
-        let buffer = std::fs::File::create(path).unwrap();
+        let compression = CsvCompression::new(compression, compression_level)?;
+        let batch_size = NonZeroUsize::new(batch_size).ok_or_else(|| {
+            PyErr::new::<pyo3::exceptions::PyValueError, _>("batch_size must be positive")
+        })?;
+        let mut polars_data_frame = self.polars_data_frame.drop(DUMMY_NAME).unwrap();
+
+        py.detach(|| {
+            let buffer = BufWriter::new(std::fs::File::create(path)?);
+            match compression {
+                CsvCompression::Uncompressed => {
+                    write_csv_batches(buffer, &mut polars_data_frame, batch_size, n_threads)
+                }
+                CsvCompression::Gzip(level) => {
+                    let mut encoder = GzEncoder::new(buffer, flate2::Compression::new(level));
+                    write_csv_batches(&mut encoder, &mut polars_data_frame, batch_size, n_threads)?;
+                    encoder.finish()?;
+                    Ok(())
+                }
+                CsvCompression::Zstd(level) => {
+                    let mut encoder = zstd::Encoder::new(buffer, level)?;
+                    write_csv_batches(&mut encoder, &mut polars_data_frame, batch_size, n_threads)?;
+                    encoder.finish()?;
+                    Ok(())
+                }
+            }
+        })
+        .map_err(polars_io_error)
+    }
 
-        CsvWriter::new(buffer)
-            .include_header(true)
-            .finish(&mut self.polars_data_frame.drop(DUMMY_NAME).unwrap().clone())
-            .unwrap();
+    #[pyo3(signature = (path, /, compression = "zstd", compression_level = None, row_group_size = None))]
+    fn write_parquet(
+        &self,
+        path: String,
+        compression: &str,
+        compression_level: Option<i32>,
+        row_group_size: Option<usize>,
+        py: Python,
+    ) -> PyResult<()> {
+        self.validate_no_group_levels(py)?;
 
-        Ok(())
+        let compression = parquet_compression(compression, compression_level)?;
+        let mut polars_data_frame = self.polars_data_frame.drop(DUMMY_NAME).unwrap();
+
+        // Min/max statistics are written for every column chunk so that scans
+        // can skip row groups that a filter rules out
+        py.detach(|| {
+            let buffer = std::fs::File::create(path)?;
+            ParquetWriter::new(buffer)
+                .with_compression(compression)
+                .with_statistics(StatisticsOptions::full())
+                .with_row_group_size(row_group_size)
+                .finish(&mut polars_data_frame)
+                .map(|_| ())
+        })
+        .map_err(polars_io_error)
     }
 
     #[staticmethod]
-    #[pyo3(signature = (record_batch, /))]
-    fn from_pyarrow_record_batch(record_batch: &Bound<PyAny>) -> PyResult<PyDataFrame> {
-        // Get the height from pyarrow because StructArray.len is private for some reason
-        let height = record_batch.getattr("num_rows")?.extract::<usize>()?;
+    #[pyo3(signature = (path, /, memory_map = true))]
+    fn read_ipc(path: String, memory_map: bool, py: Python) -> PyResult<PyDataFrame> {
+        // A memory-mapped file is not copied; the columns point straight into
+        // the mapping and the operating system pages them in when touched
+        let polars_data_frame = py
+            .detach(|| {
+                let file = std::fs::File::open(&path)?;
+                IpcReader::new(file)
+                    .memory_mapped(memory_map.then(|| path.clone().into()))
+                    .finish()
+            })
+            .map_err(polars_io_error)?;
+
+        Ok(PyDataFrame::new(
+            prepend_dummy_column(polars_data_frame),
+            vec![],
+        ))
+    }
 
-        // Import the array
-        let polars_arrow_array = polars_arrow_array_from_pyarrow(record_batch)?;
+    #[pyo3(signature = (path, /))]
+    fn write_ipc(&self, path: String, py: Python) -> PyResult<()> {
+        self.validate_no_group_levels(py)?;
 
-        // Convert to struct array
-        let array_struct = polars_arrow_array
-            .as_any()
-            .downcast_ref::<StructArray>()
-            .unwrap();
+        let mut polars_data_frame = self.polars_data_frame.drop(DUMMY_NAME).unwrap();
+
+        // Written uncompressed so that the file can be memory-mapped back
+        py.detach(|| {
+            let buffer = std::fs::File::create(path)?;
+            IpcWriter::new(buffer).finish(&mut polars_data_frame)
+        })
+        .map_err(polars_io_error)
+    }
+
+    #[staticmethod]
+    #[pyo3(signature = (producer, /))]
+    fn from_arrow(producer: &Bound<'_, PyAny>) -> PyResult<PyDataFrame> {
+        let (field, arrays) = arrays_from_arrow_producer(producer)?;
+        let ArrowDataType::Struct(fields) = field.dtype.to_logical_type() else {
+            return Err(PyErr::new::<pyo3::exceptions::PyTypeError, _>(format!(
+                "Expected Arrow data of struct type, such as a table or record batch, but got {:?}",
+                field.dtype
+            )));
+        };
+
+        // Each struct array is a batch of rows; its children become chunks
+        let mut height = 0;
+        let mut column_chunks: Vec<Vec<ArrayRef>> = vec![Vec::new(); fields.len()];
+        for array in arrays {
+            let batch = array.as_any().downcast_ref::<StructArray>().unwrap();
+            height += ArrowArray::len(batch);
+            for (chunks, values) in column_chunks.iter_mut().zip(batch.values()) {
+                chunks.push(values.clone());
+            }
+        }
 
-        // Convert to Columns
         let mut columns = vec![dummy_column(height)];
-        for (field, array) in array_struct.fields().iter().zip(array_struct.values()) {
-            let series = Series::try_from((field.name.clone(), array.clone())).unwrap();
+        for (field, mut chunks) in fields.iter().zip(column_chunks) {
+            if chunks.is_empty() {
+                chunks.push(new_empty_array(field.dtype.clone()));
+            }
+            let series = Series::try_from((field.name.clone(), chunks))
+                .map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(e.to_string()))?;
             columns.push(series.into_column());
         }
 
-        // Convert to DataFrame
-        Ok(PyDataFrame {
-            polars_data_frame: DataFrame::new(height, columns).unwrap(),
-            group_levels: vec![],
-        })
+        let polars_data_frame = DataFrame::new(height, columns)
+            .map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(e.to_string()))?;
+        Ok(PyDataFrame::new(polars_data_frame, vec![]))
+    }
+
+    #[pyo3(signature = ())]
+    fn __arrow_c_schema__<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyCapsule>> {
+        schema_capsule(py, &self.arrow_field())
     }
 
-    fn to_pyarrow_record_batches(&self) -> PyResult<Vec<Py<PyAny>>> {
-        // Inspired by polars_python::dataframe::PyDataFrame::to_pandas
-        Python::attach(|py| {
-            let pyarrow = py.import("pyarrow")?;
+    #[pyo3(signature = (requested_schema = None))]
+    fn __arrow_c_array__<'py>(
+        &self,
+        requested_schema: Option<&Bound<'py, PyAny>>,
+        py: Python<'py>,
+    ) -> PyResult<(Bound<'py, PyCapsule>, Bound<'py, PyCapsule>)> {
+        // The requested schema is a hint that producers may ignore
+        let _ = requested_schema;
+
+        let field = self.arrow_field();
+        let arrays = self
+            .polars_data_frame
+            .columns()
+            .iter()
+            .filter(|column| column.name() != DUMMY_NAME)
+            .map(|column| {
+                column
+                    .as_materialized_series()
+                    .rechunk()
+                    .to_arrow(0, CompatLevel::newest())
+            })
+            .collect();
+        let array = StructArray::new(field.dtype.clone(), self.height(), arrays, None);
+
+        array_capsules(py, array.boxed(), &field)
+    }
 
-            let rbs = self
-                .polars_data_frame
-                .iter_chunks(CompatLevel::oldest(), true)
-                .map(|rb| {
-                    let pyarrow_record_batch =
-                        record_batches_from_polars_arrow_record_batch(&pyarrow, rb)?;
+    #[pyo3(signature = (requested_schema = None))]
+    fn __arrow_c_stream__<'py>(
+        &self,
+        requested_schema: Option<&Bound<'py, PyAny>>,
+        py: Python<'py>,
+    ) -> PyResult<Bound<'py, PyCapsule>> {
+        let _ = requested_schema;
+
+        let field = self.arrow_field();
+
+        // Batches share the chunks of the columns, which must line up
+        let mut polars_data_frame = self.polars_data_frame.clone();
+        polars_data_frame.align_chunks_par();
+        let batches = polars_data_frame
+            .iter_chunks(CompatLevel::newest(), true)
+            .map(|batch| {
+                let height = batch.height();
+                // Drop the dummy column, which is always first
+                let arrays = batch.into_arrays().into_iter().skip(1).collect();
+                StructArray::new(field.dtype.clone(), height, arrays, None).boxed()
+            })
+            .collect();
 
-                    Ok(pyarrow_record_batch.unbind())
-                })
-                .collect::<PyResult<_>>()?;
-            Ok(rbs)
-        })
+        stream_capsule(py, batches, field)
     }
 }
 
@@ -1018,6 +825,77 @@ impl PartialEq for PyDataFrame {
 }
 
 impl PyDataFrame {
+    pub(crate) fn new(polars_data_frame: PolarsDataFrame, group_levels: Vec<Vec<String>>) -> Self {
+        PyDataFrame {
+            polars_data_frame,
+            group_levels,
+            schema_fingerprint: OnceLock::new(),
+            group_index: Arc::new(OnceLock::new()),
+        }
+    }
+
+    /// The Arrow field of a struct whose children are the columns, without
+    /// the dummy column
+    fn arrow_field(&self) -> ArrowField {
+        let fields = self
+            .polars_data_frame
+            .schema()
+            .iter_fields()
+            .filter(|field| field.name() != DUMMY_NAME)
+            .map(|field| field.to_arrow(CompatLevel::newest()))
+            .collect();
+        ArrowField::new("".into(), ArrowDataType::Struct(fields), false)
+    }
+
+    pub(crate) fn group_index(&self) -> PolarsResult<&GroupIndex> {
+        if let Some(group_index) = self.group_index.get() {
+            return Ok(group_index);
+        }
+
+        let flattened_groups: Vec<&str> = self.iter_group_names().collect();
+        let group_index = GroupIndex::new(&self.polars_data_frame, &flattened_groups)?;
+        // Another thread may have built the same index meanwhile
+        Ok(self.group_index.get_or_init(|| group_index))
+    }
+
+    /// A lazy frame whose grouped verbs partition by the group ids of the
+    /// group index instead of hashing the group columns again
+    fn lazy_with_group_ids(&self, py: Python) -> PyResult<PyLazyDataFrame> {
+        let mut lazy = self.lazy();
+        if self.group_levels.iter().all(|level| level.is_empty()) {
+            // There is only one group
+            return Ok(lazy);
+        }
+
+        let group_ids = py
+            .detach(|| self.group_index().map(|index| index.group_ids.clone()))
+            .map_err(polars_io_error)?;
+        let group_ids_name = unused_name(GROUP_ID_NAME, |name| {
+            self.polars_data_frame.schema().contains(name)
+        });
+        let mut polars_data_frame = self.polars_data_frame.clone();
+        polars_data_frame
+            .with_column(group_ids.with_name(group_ids_name.as_str().into()))
+            .map_err(polars_io_error)?;
+
+        lazy.polars_lazy_frame = polars_data_frame.lazy();
+        lazy.group_ids_name = Some(group_ids_name);
+        Ok(lazy)
+    }
+
+    /// Share the group index with a data frame derived from this one by a
+    /// verb that does not change the rows or the groups.
+    fn with_group_index_of(mut self, original: &PyDataFrame) -> Self {
+        self.group_index = original.group_index.clone();
+        self
+    }
+
+    pub(crate) fn schema_fingerprint(&self) -> u64 {
+        *self
+            .schema_fingerprint
+            .get_or_init(|| DataFrameType::fingerprint_schema(self.polars_data_frame.schema()))
+    }
+
     pub(crate) fn iter_column_names(&self) -> impl Iterator<Item = &str> {
         // Contains dummy column
         self.polars_data_frame
@@ -1042,23 +920,6 @@ impl PyDataFrame {
             })
     }
 
-    fn validate_column_names_unique(&self, column_names: &[&str], py: Python<'_>) -> PyResult<()> {
-        let mut seen_columns = HashSet::new();
-
-        for column_name in column_names {
-            if !seen_columns.insert(column_name) {
-                return Err(PyErr::from_value(
-                    DuplicateColumnError {
-                        column_name: column_name.to_string(),
-                    }
-                    .into_bound_py_any(py)?,
-                ));
-            }
-        }
-
-        Ok(())
-    }
-
     fn validate_column_names_exist_vec(
         &self,
         column_names: &[&str],
@@ -1087,28 +948,6 @@ impl PyDataFrame {
         Ok(())
     }
 
-    fn validate_group_names_not_used(&self, column_names: &[&str], py: Python<'_>) -> PyResult<()> {
-        let group_levels_set: HashSet<&str> = self
-            .group_levels
-            .iter()
-            .flat_map(|level| level.iter())
-            .map(|s| s.as_str())
-            .collect();
-
-        for column_name in column_names {
-            if group_levels_set.contains(column_name) {
-                return Err(PyErr::from_value(
-                    GroupColumnError {
-                        column_name: column_name.to_string(),
-                    }
-                    .into_bound_py_any(py)?,
-                ));
-            }
-        }
-
-        Ok(())
-    }
-
     fn iter_group_names(&self) -> impl Iterator<Item = &str> {
         // WORKAROUND: Many operations fail if the group columns are empty
         // Always include the dummy column as a group column to ensure that
@@ -1128,61 +967,73 @@ impl PyDataFrame {
         }
     }
 
-    fn impl_slice(&self, indexes: Vec<i64>) -> Result<PyDataFrame, PolarsError> {
-        if indexes.is_empty() {
-            // WORKAROUND: Polars explodes an empty list into a null instead of
-            // no rows. Return no rows instead.
-            // https://github.com/pola-rs/polars/issues/6723
-            Ok(PyDataFrame {
-                polars_data_frame: self.polars_data_frame.head(Some(0)),
-                group_levels: self.group_levels.clone(),
-            })
+    fn impl_slice(&self, indexes: &[i64], one_indexed: bool, py: Python) -> PyResult<PyDataFrame> {
+        // Indexes are zero-based here and already known to be within the height
+        let Some(&max_index) = indexes.iter().max() else {
+            return Ok(PyDataFrame::new(
+                self.polars_data_frame.head(Some(0)),
+                self.group_levels.clone(),
+            ));
+        };
+        let max_index = max_index as usize;
+
+        // Number of times each position within a group is requested
+        let mut multiplicities = vec![0; max_index + 1];
+        for &index in indexes {
+            multiplicities[index as usize] += 1;
+        }
+
+        // Rows to take, in their original order like every other verb on
+        // groups, repeated as many times as they are requested
+        let mut rows: Vec<IdxSize> = Vec::with_capacity(indexes.len());
+        if self.group_levels.iter().all(|level| level.is_empty()) {
+            // There is only one group, so the position is the row index
+            for (row, &multiplicity) in multiplicities.iter().enumerate() {
+                rows.extend(std::iter::repeat_n(row as IdxSize, multiplicity));
+            }
         } else {
-            // There is no easy way to slice by groups in Polars. Using
-            // `gather` on a group causes the sliced columns to be a column of
-            // lists that must be exploded at the end. The exploding results
-            // in clustering, so getting back the original row order requires
-            // tagging each row with an index and sorting the result by that.
-            // https://stackoverflow.com/q/71373783/
-
-            let flattened_groups: Vec<&str> = self.iter_group_names().collect();
-
-            // Get non-group columns
-            let group_set: HashSet<&str> = flattened_groups.iter().copied().collect();
-            let mut non_group_columns: Vec<&str> = self
-                .iter_column_names()
-                .filter(|&col| !group_set.contains(col))
-                .collect();
-            non_group_columns.push("_index");
-
-            let result =
-                self.polars_data_frame
-                    .clone()
-                    .lazy()
-                    .with_column(arange(0.into(), len(), 1, PolarsDataType::Int32).alias("_index"))
-                    .group_by_stable(flattened_groups)
-                    .agg([all().as_expr().gather(Expr::Literal(LiteralValue::Series(
-                        SpecialEq::new(Series::new("".into(), &indexes)),
-                    )))])
-                    .explode(
-                        cols(non_group_columns),
-                        ExplodeOptions {
-                            empty_as_null: false,
-                            keep_nulls: false,
-                        },
-                    )
-                    .sort(["_index"], Default::default())
-                    .drop(cols(["_index"]))
-                    .collect();
-
-            match result {
-                Ok(polars_data_frame) => Ok(PyDataFrame {
-                    polars_data_frame,
-                    group_levels: self.group_levels.clone(),
-                }),
-                Err(e) => Err(e),
+            let group_index = py.detach(|| self.group_index()).map_err(polars_io_error)?;
+
+            let mut row_multiplicities = vec![0; self.height()];
+            for group_id in 0..group_index.n_groups() {
+                let group_rows = group_index.rows_of_group(group_id);
+                if group_rows.len() <= max_index {
+                    let shown_index = if one_indexed {
+                        max_index + 1
+                    } else {
+                        max_index
+                    };
+                    return Err(PyErr::from_value(
+                        GroupIndexOutOfBoundsError {
+                            message: format!(
+                                "Index {} is out of bounds for a group of length {}",
+                                shown_index,
+                                group_rows.len()
+                            ),
+                        }
+                        .into_bound_py_any(py)?,
+                    ));
+                }
+                for (position, &multiplicity) in multiplicities.iter().enumerate() {
+                    row_multiplicities[group_rows[position] as usize] += multiplicity;
+                }
+            }
+
+            for (row, &multiplicity) in row_multiplicities.iter().enumerate() {
+                rows.extend(std::iter::repeat_n(row as IdxSize, multiplicity));
             }
         }
+
+        let polars_data_frame = py.detach(|| {
+            self.polars_data_frame
+                .take(&IdxCa::from_vec("".into(), rows))
+                .unwrap()
+        });
+
+        Ok(PyDataFrame::new(
+            polars_data_frame,
+            self.group_levels.clone(),
+        ))
     }
 
     fn validate_no_group_levels(&self, py: Python) -> PyResult<()> {
@@ -1197,34 +1048,152 @@ impl PyDataFrame {
 
         Ok(())
     }
+}
 
-    fn validate_join_by<'by>(
-        &self,
-        by: &'by [(String, String)],
-        other: &PyDataFrame,
-        py: Python,
-    ) -> PyResult<(Vec<&'by str>, Vec<&'by str>)> {
-        // Check for duplicate column names in the join keys
-        let left_names: Vec<&str> = by.iter().map(|(l, _)| l.as_str()).collect();
-        self.validate_column_names_unique(&left_names, py)?;
-        self.validate_column_names_exist_vec(&left_names, py)?;
-
-        let right_names: Vec<&str> = by.iter().map(|(_, r)| r.as_str()).collect();
-        other.validate_column_names_unique(&right_names, py)?;
-        other.validate_column_names_exist_vec(&right_names, py)?;
-
-        // Error on any group levels for now
-        // TODO: Implement joining on grouped data frames
-        self.validate_no_group_levels(py)?;
-        other.validate_no_group_levels(py)?;
+/// Convert the elements of one column of `PyDataFrame.from_dict`, which are
+/// either a `PyArray` or a sequence of Python scalars.
+fn column_from_elements(elements: &Bound<'_, PyAny>) -> PyResult<Column> {
+    match elements.cast::<PyArray>() {
+        Ok(array) => Ok(array.get().polars_column.clone()),
+        Err(_) => column_from_sequence(elements, None),
+    }
+}
+
+/// Convert columns on as many threads as there are cores, each attached to
+/// the interpreter. Only worthwhile when the interpreter has no GIL.
+fn column_from_elements_concurrently(elements: &[Py<PyAny>]) -> Vec<PyResult<Column>> {
+    let n_threads = std::thread::available_parallelism()
+        .map(NonZeroUsize::get)
+        .unwrap_or(1)
+        .min(elements.len());
+    let chunk_size = elements.len().div_ceil(n_threads);
+
+    std::thread::scope(|scope| {
+        let handles = elements
+            .chunks(chunk_size)
+            .map(|chunk| {
+                scope.spawn(move || {
+                    Python::attach(|py| {
+                        chunk
+                            .iter()
+                            .map(|column_elements| column_from_elements(column_elements.bind(py)))
+                            .collect::<Vec<_>>()
+                    })
+                })
+            })
+            .collect::<Vec<_>>();
 
-        // Prepend the dummy column so that it does not get duplicated
-        let mut left_names_with_dummy = vec![DUMMY_NAME];
-        left_names_with_dummy.extend(left_names);
+        handles
+            .into_iter()
+            .flat_map(|handle| handle.join().unwrap())
+            .collect()
+    })
+}
 
-        let mut right_names_with_dummy = vec![DUMMY_NAME];
-        right_names_with_dummy.extend(right_names);
+/// Whether this interpreter has a GIL; false only on a free-threaded build
+/// running with the GIL disabled
+fn is_gil_enabled(py: Python) -> bool {
+    py.import("sys")
+        .and_then(|sys| sys.call_method0("_is_gil_enabled"))
+        .and_then(|enabled| enabled.extract::<bool>())
+        .unwrap_or(true)
+}
+
+/// Convert a Polars error from reading or writing a file into a Python
+/// exception, so that a missing file raises FileNotFoundError and a malformed
+/// file raises ValueError rather than a panic.
+pub(crate) fn polars_io_error(error: PolarsError) -> PyErr {
+    match error {
+        PolarsError::IO { error, .. } => {
+            PyErr::from(std::io::Error::new(error.kind(), error.to_string()))
+        }
+        error => PyErr::new::<pyo3::exceptions::PyValueError, _>(error.to_string()),
+    }
+}
+
+enum CsvCompression {
+    Uncompressed,
+    Gzip(u32),
+    Zstd(i32),
+}
+
+impl CsvCompression {
+    fn new(name: Option<&str>, level: Option<i32>) -> PyResult<Self> {
+        let invalid_level = |level: i32| {
+            Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(format!(
+                "Invalid compression level {level} for {}",
+                name.unwrap_or("uncompressed")
+            )))
+        };
+
+        match (name, level) {
+            (None, None) => Ok(CsvCompression::Uncompressed),
+            (Some("gzip"), None) => Ok(CsvCompression::Gzip(6)),
+            (Some("gzip"), Some(level @ 0..=9)) => Ok(CsvCompression::Gzip(level as u32)),
+            (Some("zstd"), None) => Ok(CsvCompression::Zstd(zstd::DEFAULT_COMPRESSION_LEVEL)),
+            (Some("zstd"), Some(level)) if zstd::compression_level_range().contains(&level) => {
+                Ok(CsvCompression::Zstd(level))
+            }
+            (None | Some("gzip" | "zstd"), Some(level)) => invalid_level(level),
+            (Some(name), _) => Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(format!(
+                "Unknown CSV compression {name}; expected gzip or zstd"
+            ))),
+        }
+    }
+}
+
+/// Write a CSV with a header, serializing `batch_size` rows at a time on
+/// `n_threads` threads (the Polars pool by default).
+fn write_csv_batches<W: Write>(
+    buffer: W,
+    polars_data_frame: &mut PolarsDataFrame,
+    batch_size: NonZeroUsize,
+    n_threads: Option<usize>,
+) -> PolarsResult<()> {
+    let mut writer = CsvWriter::new(buffer)
+        .include_header(true)
+        .with_batch_size(batch_size);
+    if let Some(n_threads) = n_threads {
+        writer = writer.n_threads(n_threads);
+    }
+    writer.finish(polars_data_frame)
+}
 
-        Ok((left_names_with_dummy, right_names_with_dummy))
+fn parquet_compression(name: &str, level: Option<i32>) -> PyResult<ParquetCompression> {
+    let invalid_level =
+        |error: PolarsError| PyErr::new::<pyo3::exceptions::PyValueError, _>(error.to_string());
+    let unsupported_level = || {
+        Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(format!(
+            "Compression {name} does not take a level"
+        )))
+    };
+
+    match (name, level) {
+        ("uncompressed", None) => Ok(ParquetCompression::Uncompressed),
+        ("snappy", None) => Ok(ParquetCompression::Snappy),
+        ("lz4", None) => Ok(ParquetCompression::Lz4Raw),
+        ("uncompressed" | "snappy" | "lz4", Some(_)) => unsupported_level(),
+        ("gzip", level) => Ok(ParquetCompression::Gzip(
+            level
+                .map(|level| GzipLevel::try_new(level as u8))
+                .transpose()
+                .map_err(invalid_level)?,
+        )),
+        ("brotli", level) => Ok(ParquetCompression::Brotli(
+            level
+                .map(|level| BrotliLevel::try_new(level as u32))
+                .transpose()
+                .map_err(invalid_level)?,
+        )),
+        ("zstd", level) => Ok(ParquetCompression::Zstd(
+            level
+                .map(ZstdLevel::try_new)
+                .transpose()
+                .map_err(invalid_level)?,
+        )),
+        _ => Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(format!(
+            "Unknown Parquet compression {name}; expected one of uncompressed, snappy, gzip, \
+             lz4, zstd, or brotli"
+        ))),
     }
 }
@@ -25,6 +25,8 @@ mod unmatched_columns_error;
 mod unmatched_group_levels_error;
 mod unmatched_height_error;
 
+use pyo3::prelude::*;
+
 pub use arrays_not_equal_error::ArraysNotEqualError;
 pub use column_already_exists_error::ColumnAlreadyExistsError;
 pub use data_frames_not_equal_error::DataFramesNotEqualError;
@@ -51,3 +53,20 @@ pub use unknown_variable_error::UnknownVariableError;
 pub use unmatched_columns_error::UnmatchedColumnsError;
 pub use unmatched_group_levels_error::UnmatchedGroupLevelsError;
 pub use unmatched_height_error::UnmatchedHeightError;
+
+/// Construct one of the exceptions that `tabeline.exceptions` defines in
+/// Python rather than in Rust
+pub fn python_exception<'py, A>(py: Python<'py>, name: &str, args: A) -> PyErr
+where
+    A: pyo3::call::PyCallArgs<'py>,
+{
+    let error = py
+        .import("tabeline.exceptions")
+        .and_then(|exceptions| exceptions.getattr(name))
+        .and_then(|error_type| error_type.call1(args));
+
+    match error {
+        Ok(error) => PyErr::from_value(error),
+        Err(error) => error,
+    }
+}
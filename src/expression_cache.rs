@@ -0,0 +1,147 @@
+use crate::expression::Expression;
+use crate::typed_expression::{ExpressionType, TypedExpression};
+use once_cell::sync::Lazy;
+use polars::prelude::{Expr, SchemaRef};
+use pyo3::prelude::*;
+use std::collections::HashMap;
+use std::hash::{Hash, Hasher};
+use std::sync::atomic::{AtomicU64, Ordering};
+use std::sync::{Arc, Mutex};
+
+// Once full, the least recently used half of the cache is evicted
+const CAPACITY: usize = 4096;
+
+#[derive(Debug, Clone)]
+pub struct CacheKey {
+    // Interned, so that building a key does not walk the expression
+    expression_id: u64,
+    // The key is hashed by the fingerprint of the schema, but two schemas can
+    // share a fingerprint, so the schema itself is compared on a hit
+    schema_fingerprint: u64,
+    schema: SchemaRef,
+    // Columns added by earlier expressions of the same verb
+    added_columns: Vec<(String, ExpressionType)>,
+    group_names: Vec<String>,
+}
+
+impl CacheKey {
+    pub fn new(
+        expression_id: u64,
+        schema_fingerprint: u64,
+        schema: &SchemaRef,
+        added_columns: &[(String, ExpressionType)],
+        group_names: &[&str],
+    ) -> Self {
+        CacheKey {
+            expression_id,
+            schema_fingerprint,
+            schema: schema.clone(),
+            added_columns: added_columns.to_vec(),
+            group_names: group_names.iter().map(|name| name.to_string()).collect(),
+        }
+    }
+}
+
+impl PartialEq for CacheKey {
+    fn eq(&self, other: &Self) -> bool {
+        self.schema_fingerprint == other.schema_fingerprint
+            && self.expression_id == other.expression_id
+            && self.group_names == other.group_names
+            && self.added_columns == other.added_columns
+            && (Arc::ptr_eq(&self.schema, &other.schema) || self.schema == other.schema)
+    }
+}
+
+impl Eq for CacheKey {}
+
+impl Hash for CacheKey {
+    fn hash<H: Hasher>(&self, state: &mut H) {
+        self.expression_id.hash(state);
+        self.schema_fingerprint.hash(state);
+        self.group_names.hash(state);
+    }
+}
+
+/// An expression that has been validated against a schema, cast to its
+/// result type, and compiled to Polars.
+#[derive(Debug, Clone)]
+pub struct CompiledExpression {
+    pub typed_expression: TypedExpression,
+    /// The expression without any window over the groups
+    pub polars_expression: Expr,
+    /// The expression evaluated within each group
+    pub grouped_polars_expression: Expr,
+}
+
+struct CacheEntry {
+    compiled: CompiledExpression,
+    last_used: u64,
+}
+
+#[derive(Default)]
+struct Cache {
+    entries: HashMap<CacheKey, CacheEntry>,
+    // Counts lookups, to order the entries by when they were last used
+    clock: u64,
+}
+
+static COMPILED_EXPRESSIONS: Lazy<Mutex<Cache>> = Lazy::new(|| Mutex::new(Cache::default()));
+
+pub fn get(key: &CacheKey) -> Option<CompiledExpression> {
+    let mut cache = COMPILED_EXPRESSIONS.lock().unwrap();
+    cache.clock += 1;
+    let clock = cache.clock;
+    cache.entries.get_mut(key).map(|entry| {
+        entry.last_used = clock;
+        entry.compiled.clone()
+    })
+}
+
+pub fn insert(key: CacheKey, compiled: CompiledExpression) {
+    let mut cache = COMPILED_EXPRESSIONS.lock().unwrap();
+    if cache.entries.len() >= CAPACITY {
+        // Evicting half at a time keeps the cost of eviction constant per
+        // insertion
+        let mut last_uses: Vec<u64> = cache.entries.values().map(|e| e.last_used).collect();
+        let (_, &mut median, _) = last_uses.select_nth_unstable(CAPACITY / 2);
+        cache.entries.retain(|_, entry| entry.last_used > median);
+    }
+    let last_used = cache.clock;
+    cache.entries.insert(
+        key,
+        CacheEntry {
+            compiled,
+            last_used,
+        },
+    );
+}
+
+// Expressions with the same content get the same id. Ids are never reused, so
+// forgetting one only costs a cache miss.
+static EXPRESSION_IDS: Lazy<Mutex<HashMap<String, u64>>> = Lazy::new(|| Mutex::new(HashMap::new()));
+static NEXT_EXPRESSION_ID: AtomicU64 = AtomicU64::new(0);
+
+/// The id of an expression, which is the same for every expression with the
+/// same content
+pub fn intern(expression: &Expression) -> u64 {
+    // Expression contains floats, so it is not Hash; its Debug text is exact
+    let text = format!("{:?}", expression);
+    let mut ids = EXPRESSION_IDS.lock().unwrap();
+    if ids.len() >= CAPACITY && !ids.contains_key(&text) {
+        ids.clear();
+    }
+    *ids.entry(text)
+        .or_insert_with(|| NEXT_EXPRESSION_ID.fetch_add(1, Ordering::Relaxed))
+}
+
+#[pyfunction]
+/// The number of compiled expressions in the cache
+pub fn compiled_expression_cache_size() -> usize {
+    COMPILED_EXPRESSIONS.lock().unwrap().entries.len()
+}
+
+#[pyfunction]
+pub fn clear_compiled_expression_cache() {
+    COMPILED_EXPRESSIONS.lock().unwrap().entries.clear();
+    EXPRESSION_IDS.lock().unwrap().clear();
+}
@@ -0,0 +1,423 @@
+use polars::prelude::*;
+use polars_arrow::array::{
+    MutableArray, MutableBinaryViewArray, MutableBooleanArray, MutablePrimitiveArray,
+};
+use pyo3::types::{PyBool, PyFloat, PyInt, PyString, PyType};
+use pyo3::{prelude::*, IntoPyObjectExt};
+
+use crate::data_type::PolarsDataType;
+use crate::error::{python_exception, IncompatibleTypeError};
+use crate::DataType;
+
+/// The Python types that an element of a sequence is distinguished by
+#[derive(Debug, Clone, Copy, PartialEq)]
+enum ElementType {
+    NoneType,
+    Bool,
+    Int,
+    Float,
+    Str,
+}
+
+impl ElementType {
+    /// Classify an element, checking bool before int because bool is a
+    /// subclass of int
+    fn of(item: &Bound<'_, PyAny>) -> Option<ElementType> {
+        if item.is_none() {
+            Some(ElementType::NoneType)
+        } else if item.is_instance_of::<PyBool>() {
+            Some(ElementType::Bool)
+        } else if item.is_instance_of::<PyInt>() {
+            Some(ElementType::Int)
+        } else if item.is_instance_of::<PyFloat>() {
+            Some(ElementType::Float)
+        } else if item.is_instance_of::<PyString>() {
+            Some(ElementType::Str)
+        } else {
+            None
+        }
+    }
+
+    fn py_type(self, py: Python<'_>) -> Bound<'_, PyType> {
+        match self {
+            ElementType::NoneType => py.None().into_bound(py).get_type(),
+            ElementType::Bool => py.get_type::<PyBool>(),
+            ElementType::Int => py.get_type::<PyInt>(),
+            ElementType::Float => py.get_type::<PyFloat>(),
+            ElementType::Str => py.get_type::<PyString>(),
+        }
+    }
+}
+
+const ANY_ELEMENT: &[ElementType] = &[
+    ElementType::Bool,
+    ElementType::Int,
+    ElementType::Float,
+    ElementType::Str,
+    ElementType::NoneType,
+];
+const BOOLEAN_ELEMENT: &[ElementType] = &[ElementType::Bool, ElementType::NoneType];
+const NUMBER_ELEMENT: &[ElementType] =
+    &[ElementType::Int, ElementType::Float, ElementType::NoneType];
+const STRING_ELEMENT: &[ElementType] = &[ElementType::Str, ElementType::NoneType];
+const NOTHING_ELEMENT: &[ElementType] = &[ElementType::NoneType];
+
+fn incompatible_element_type_error(
+    expected: &[ElementType],
+    item: &Bound<'_, PyAny>,
+    location: usize,
+) -> PyErr {
+    let py = item.py();
+    let expected_types = expected
+        .iter()
+        .map(|element_type| element_type.py_type(py))
+        .collect::<Vec<_>>();
+    python_exception(
+        py,
+        "IncompatibleElementTypeError",
+        (expected_types, item, location),
+    )
+}
+
+/// Extract an element that has already been classified as compatible. This
+/// only fails if the value does not fit in the type, such as 300 as an i8.
+fn extract<T>(item: &Bound<'_, PyAny>, data_type: DataType, location: usize) -> PyResult<T>
+where
+    for<'py> T: FromPyObject<'py, 'py>,
+{
+    match item.extract::<T>() {
+        Ok(value) => Ok(value),
+        Err(_) => Err(PyErr::from_value(
+            IncompatibleTypeError {
+                expected_type: data_type,
+                item: item.clone().unbind(),
+                location,
+            }
+            .into_bound_py_any(item.py())?,
+        )),
+    }
+}
+
+fn extract_str<'a>(
+    item: &'a Bound<'_, PyAny>,
+    data_type: DataType,
+    location: usize,
+) -> PyResult<std::borrow::Cow<'a, str>> {
+    match item.cast::<PyString>().map(|string| string.to_str()) {
+        Ok(Ok(value)) => Ok(value.into()),
+        _ => Err(PyErr::from_value(
+            IncompatibleTypeError {
+                expected_type: data_type,
+                item: item.clone().unbind(),
+                location,
+            }
+            .into_bound_py_any(item.py())?,
+        )),
+    }
+}
+
+fn nothing_column(length: usize) -> Column {
+    Column::new_scalar(
+        "".into(),
+        Scalar::new(PolarsDataType::Null, AnyValue::Null),
+        length,
+    )
+}
+
+fn primitive_column<T: PolarsNumericType>(values: MutablePrimitiveArray<T::Native>) -> Column {
+    ChunkedArray::<T>::with_chunk("".into(), values.into())
+        .into_series()
+        .into_column()
+}
+
+fn boolean_column(values: MutableBooleanArray) -> Column {
+    BooleanChunked::with_chunk("".into(), values.into())
+        .into_series()
+        .into_column()
+}
+
+fn string_column(values: MutableBinaryViewArray<str>) -> Column {
+    StringChunked::with_chunk("".into(), values.freeze())
+        .into_series()
+        .into_column()
+}
+
+/// The array built so far while inferring the data type of a sequence
+enum Inferred {
+    Nothing(usize),
+    Boolean(MutableBooleanArray),
+    Integer64(MutablePrimitiveArray<i64>),
+    Float64(MutablePrimitiveArray<f64>),
+    String(MutableBinaryViewArray<str>),
+}
+
+impl Inferred {
+    fn push(self, item: &Bound<'_, PyAny>, location: usize, capacity: usize) -> PyResult<Self> {
+        let element_type = ElementType::of(item);
+        Ok(match (self, element_type) {
+            (Inferred::Nothing(length), Some(ElementType::NoneType)) => {
+                Inferred::Nothing(length + 1)
+            }
+            (Inferred::Nothing(length), Some(ElementType::Bool)) => {
+                let mut values = MutableBooleanArray::with_capacity(capacity);
+                values.extend_constant(length, None);
+                values.push(Some(extract(item, DataType::Boolean, location)?));
+                Inferred::Boolean(values)
+            }
+            (Inferred::Nothing(length), Some(ElementType::Int)) => {
+                let mut values = MutablePrimitiveArray::with_capacity(capacity);
+                values.extend_constant(length, None);
+                values.push(Some(extract(item, DataType::Integer64, location)?));
+                Inferred::Integer64(values)
+            }
+            (Inferred::Nothing(length), Some(ElementType::Float)) => {
+                let mut values = MutablePrimitiveArray::with_capacity(capacity);
+                values.extend_constant(length, None);
+                values.push(Some(extract(item, DataType::Float64, location)?));
+                Inferred::Float64(values)
+            }
+            (Inferred::Nothing(length), Some(ElementType::Str)) => {
+                let mut values = MutableBinaryViewArray::<str>::with_capacity(capacity);
+                values.extend_constant(length, None::<&str>);
+                values.push_value(extract_str(item, DataType::String, location)?);
+                Inferred::String(values)
+            }
+            (Inferred::Nothing(_), None) => {
+                return Err(incompatible_element_type_error(ANY_ELEMENT, item, location))
+            }
+
+            (Inferred::Boolean(mut values), Some(ElementType::NoneType)) => {
+                values.push_null();
+                Inferred::Boolean(values)
+            }
+            (Inferred::Boolean(mut values), Some(ElementType::Bool)) => {
+                values.push(Some(extract(item, DataType::Boolean, location)?));
+                Inferred::Boolean(values)
+            }
+            (Inferred::Boolean(_), _) => {
+                return Err(incompatible_element_type_error(
+                    BOOLEAN_ELEMENT,
+                    item,
+                    location,
+                ))
+            }
+
+            (Inferred::Integer64(mut values), Some(ElementType::NoneType)) => {
+                values.push_null();
+                Inferred::Integer64(values)
+            }
+            (Inferred::Integer64(mut values), Some(ElementType::Bool | ElementType::Int)) => {
+                values.push(Some(extract(item, DataType::Integer64, location)?));
+                Inferred::Integer64(values)
+            }
+            (Inferred::Integer64(integers), Some(ElementType::Float)) => {
+                // Promote the integers seen so far to floats
+                let mut values = MutablePrimitiveArray::with_capacity(capacity);
+                let validity = integers.validity();
+                for (i, &integer) in integers.values().iter().enumerate() {
+                    let is_valid = validity.is_none_or(|validity| validity.get(i));
+                    values.push(is_valid.then_some(integer as f64));
+                }
+                values.push(Some(extract(item, DataType::Float64, location)?));
+                Inferred::Float64(values)
+            }
+            (Inferred::Integer64(_), _) => {
+                return Err(incompatible_element_type_error(
+                    NUMBER_ELEMENT,
+                    item,
+                    location,
+                ))
+            }
+
+            (Inferred::Float64(mut values), Some(ElementType::NoneType)) => {
+                values.push_null();
+                Inferred::Float64(values)
+            }
+            (
+                Inferred::Float64(mut values),
+                Some(ElementType::Bool | ElementType::Int | ElementType::Float),
+            ) => {
+                values.push(Some(extract(item, DataType::Float64, location)?));
+                Inferred::Float64(values)
+            }
+            (Inferred::Float64(_), _) => {
+                return Err(incompatible_element_type_error(
+                    NUMBER_ELEMENT,
+                    item,
+                    location,
+                ))
+            }
+
+            (Inferred::String(mut values), Some(ElementType::NoneType)) => {
+                values.push_null();
+                Inferred::String(values)
+            }
+            (Inferred::String(mut values), Some(ElementType::Str)) => {
+                values.push_value(extract_str(item, DataType::String, location)?);
+                Inferred::String(values)
+            }
+            (Inferred::String(_), _) => {
+                return Err(incompatible_element_type_error(
+                    STRING_ELEMENT,
+                    item,
+                    location,
+                ))
+            }
+        })
+    }
+
+    fn into_column(self) -> Column {
+        match self {
+            Inferred::Nothing(length) => nothing_column(length),
+            Inferred::Boolean(values) => boolean_column(values),
+            Inferred::Integer64(values) => primitive_column::<Int64Type>(values),
+            Inferred::Float64(values) => primitive_column::<Float64Type>(values),
+            Inferred::String(values) => string_column(values),
+        }
+    }
+}
+
+fn infer_column(elements: &Bound<'_, PyAny>, capacity: usize) -> PyResult<Column> {
+    let mut inferred = Inferred::Nothing(0);
+    for (i, item) in elements.try_iter()?.enumerate() {
+        inferred = inferred.push(&item?, i, capacity)?;
+    }
+    Ok(inferred.into_column())
+}
+
+fn nothing_column_of(elements: &Bound<'_, PyAny>) -> PyResult<Column> {
+    let mut length = 0;
+    for (i, item) in elements.try_iter()?.enumerate() {
+        let item = item?;
+        if !item.is_none() {
+            return Err(incompatible_element_type_error(NOTHING_ELEMENT, &item, i));
+        }
+        length += 1;
+    }
+    Ok(nothing_column(length))
+}
+
+fn boolean_column_of(elements: &Bound<'_, PyAny>, capacity: usize) -> PyResult<Column> {
+    let mut values = MutableBooleanArray::with_capacity(capacity);
+    for (i, item) in elements.try_iter()?.enumerate() {
+        let item = item?;
+        match ElementType::of(&item) {
+            Some(ElementType::NoneType) => values.push_null(),
+            Some(ElementType::Bool) => values.push(Some(extract(&item, DataType::Boolean, i)?)),
+            _ => return Err(incompatible_element_type_error(BOOLEAN_ELEMENT, &item, i)),
+        }
+    }
+    Ok(boolean_column(values))
+}
+
+/// Build a numeric column, accepting `accepted` Python types in addition to
+/// None
+fn primitive_column_of<T>(
+    elements: &Bound<'_, PyAny>,
+    data_type: DataType,
+    accepted: &[ElementType],
+    capacity: usize,
+) -> PyResult<Column>
+where
+    T: PolarsNumericType,
+    for<'py> T::Native: FromPyObject<'py, 'py>,
+{
+    let mut values = MutablePrimitiveArray::<T::Native>::with_capacity(capacity);
+    for (i, item) in elements.try_iter()?.enumerate() {
+        let item = item?;
+        match ElementType::of(&item) {
+            Some(ElementType::NoneType) => values.push_null(),
+            Some(element_type) if accepted.contains(&element_type) => {
+                values.push(Some(extract(&item, data_type, i)?))
+            }
+            _ => return Err(incompatible_element_type_error(NUMBER_ELEMENT, &item, i)),
+        }
+    }
+    Ok(primitive_column::<T>(values))
+}
+
+fn integer_column_of<T>(
+    elements: &Bound<'_, PyAny>,
+    data_type: DataType,
+    capacity: usize,
+) -> PyResult<Column>
+where
+    T: PolarsNumericType,
+    for<'py> T::Native: FromPyObject<'py, 'py>,
+{
+    let accepted = [ElementType::Bool, ElementType::Int];
+    primitive_column_of::<T>(elements, data_type, &accepted, capacity)
+}
+
+fn float_column_of<T>(
+    elements: &Bound<'_, PyAny>,
+    data_type: DataType,
+    capacity: usize,
+) -> PyResult<Column>
+where
+    T: PolarsNumericType,
+    for<'py> T::Native: FromPyObject<'py, 'py>,
+{
+    let accepted = [ElementType::Bool, ElementType::Int, ElementType::Float];
+    primitive_column_of::<T>(elements, data_type, &accepted, capacity)
+}
+
+fn string_column_of(elements: &Bound<'_, PyAny>, capacity: usize) -> PyResult<Column> {
+    let mut values = MutableBinaryViewArray::<str>::with_capacity(capacity);
+    for (i, item) in elements.try_iter()?.enumerate() {
+        let item = item?;
+        match ElementType::of(&item) {
+            Some(ElementType::NoneType) => values.push_null(),
+            Some(ElementType::Str) => values.push_value(extract_str(&item, DataType::String, i)?),
+            _ => return Err(incompatible_element_type_error(STRING_ELEMENT, &item, i)),
+        }
+    }
+    Ok(string_column(values))
+}
+
+/// Build a column from a Python iterable in a single pass, inferring the data
+/// type if it is not given. Each element is checked and appended directly to
+/// an Arrow builder.
+pub fn column_from_sequence(
+    elements: &Bound<'_, PyAny>,
+    data_type: Option<DataType>,
+) -> PyResult<Column> {
+    let capacity = elements.len().unwrap_or(0);
+
+    match data_type {
+        None => infer_column(elements, capacity),
+        Some(DataType::Nothing) => nothing_column_of(elements),
+        Some(DataType::Boolean) => boolean_column_of(elements, capacity),
+        Some(data_type @ DataType::Integer8) => {
+            integer_column_of::<Int8Type>(elements, data_type, capacity)
+        }
+        Some(data_type @ DataType::Integer16) => {
+            integer_column_of::<Int16Type>(elements, data_type, capacity)
+        }
+        Some(data_type @ DataType::Integer32) => {
+            integer_column_of::<Int32Type>(elements, data_type, capacity)
+        }
+        Some(data_type @ DataType::Integer64) => {
+            integer_column_of::<Int64Type>(elements, data_type, capacity)
+        }
+        Some(data_type @ DataType::Whole8) => {
+            integer_column_of::<UInt8Type>(elements, data_type, capacity)
+        }
+        Some(data_type @ DataType::Whole16) => {
+            integer_column_of::<UInt16Type>(elements, data_type, capacity)
+        }
+        Some(data_type @ DataType::Whole32) => {
+            integer_column_of::<UInt32Type>(elements, data_type, capacity)
+        }
+        Some(data_type @ DataType::Whole64) => {
+            integer_column_of::<UInt64Type>(elements, data_type, capacity)
+        }
+        Some(data_type @ DataType::Float32) => {
+            float_column_of::<Float32Type>(elements, data_type, capacity)
+        }
+        Some(data_type @ DataType::Float64) => {
+            float_column_of::<Float64Type>(elements, data_type, capacity)
+        }
+        Some(DataType::String) => string_column_of(elements, capacity),
+    }
+}
@@ -113,4 +113,18 @@ impl Function for IfElse {
     fn name(&self) -> &'static str {
         "if_else"
     }
+
+    fn is_elementwise(&self) -> bool {
+        self.condition.is_elementwise()
+            && self.then_branch.is_elementwise()
+            && self.else_branch.is_elementwise()
+    }
+
+    fn arguments(&self) -> Vec<&TypedExpression> {
+        vec![
+            self.condition.as_ref(),
+            self.then_branch.as_ref(),
+            self.else_branch.as_ref(),
+        ]
+    }
 }
@@ -69,6 +69,14 @@ impl Function for ToBoolean {
     fn name(&self) -> &'static str {
         "to_boolean"
     }
+
+    fn is_elementwise(&self) -> bool {
+        self.argument.is_elementwise()
+    }
+
+    fn arguments(&self) -> Vec<&TypedExpression> {
+        vec![self.argument.as_ref()]
+    }
 }
 
 #[derive(Debug, Clone, PartialEq)]
@@ -131,6 +139,14 @@ impl Function for ToInteger {
     fn name(&self) -> &'static str {
         "to_integer"
     }
+
+    fn is_elementwise(&self) -> bool {
+        self.argument.is_elementwise()
+    }
+
+    fn arguments(&self) -> Vec<&TypedExpression> {
+        vec![self.argument.as_ref()]
+    }
 }
 
 #[derive(Debug, Clone, PartialEq)]
@@ -193,6 +209,14 @@ impl Function for ToFloat {
     fn name(&self) -> &'static str {
         "to_float"
     }
+
+    fn is_elementwise(&self) -> bool {
+        self.argument.is_elementwise()
+    }
+
+    fn arguments(&self) -> Vec<&TypedExpression> {
+        vec![self.argument.as_ref()]
+    }
 }
 
 #[derive(Debug, Clone, PartialEq)]
@@ -255,4 +279,12 @@ impl Function for ToString {
     fn name(&self) -> &'static str {
         "to_string"
     }
+
+    fn is_elementwise(&self) -> bool {
+        self.argument.is_elementwise()
+    }
+
+    fn arguments(&self) -> Vec<&TypedExpression> {
+        vec![self.argument.as_ref()]
+    }
 }
@@ -117,6 +117,19 @@ impl Function for PMax {
     fn name(&self) -> &'static str {
         "pmax"
     }
+
+    fn is_elementwise(&self) -> bool {
+        self.arguments
+            .iter()
+            .all(|argument| argument.is_elementwise())
+    }
+
+    fn arguments(&self) -> Vec<&TypedExpression> {
+        self.arguments
+            .iter()
+            .map(|argument| argument.as_ref())
+            .collect()
+    }
 }
 
 #[derive(Debug, Clone, PartialEq)]
@@ -225,4 +238,17 @@ impl Function for PMin {
     fn name(&self) -> &'static str {
         "pmin"
     }
+
+    fn is_elementwise(&self) -> bool {
+        self.arguments
+            .iter()
+            .all(|argument| argument.is_elementwise())
+    }
+
+    fn arguments(&self) -> Vec<&TypedExpression> {
+        self.arguments
+            .iter()
+            .map(|argument| argument.as_ref())
+            .collect()
+    }
 }
@@ -70,6 +70,14 @@ impl Function for IsNull {
     fn name(&self) -> &'static str {
         "is_null"
     }
+
+    fn is_elementwise(&self) -> bool {
+        self.argument.is_elementwise()
+    }
+
+    fn arguments(&self) -> Vec<&TypedExpression> {
+        vec![self.argument.as_ref()]
+    }
 }
 
 #[derive(Debug, Clone, PartialEq)]
@@ -144,6 +152,14 @@ impl Function for IsNan {
     fn name(&self) -> &'static str {
         "is_nan"
     }
+
+    fn is_elementwise(&self) -> bool {
+        self.argument.is_elementwise()
+    }
+
+    fn arguments(&self) -> Vec<&TypedExpression> {
+        vec![self.argument.as_ref()]
+    }
 }
 
 #[derive(Debug, Clone, PartialEq)]
@@ -218,4 +234,12 @@ impl Function for IsFinite {
     fn name(&self) -> &'static str {
         "is_finite"
     }
+
+    fn is_elementwise(&self) -> bool {
+        self.argument.is_elementwise()
+    }
+
+    fn arguments(&self) -> Vec<&TypedExpression> {
+        vec![self.argument.as_ref()]
+    }
 }
@@ -195,4 +195,12 @@ impl Function for Interp {
     fn name(&self) -> &'static str {
         "interp"
     }
+
+    fn is_elementwise(&self) -> bool {
+        false
+    }
+
+    fn arguments(&self) -> Vec<&TypedExpression> {
+        vec![self.t.as_ref(), self.ts.as_ref(), self.ys.as_ref()]
+    }
 }
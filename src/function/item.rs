@@ -69,6 +69,14 @@ impl Function for First {
     fn name(&self) -> &'static str {
         "first"
     }
+
+    fn is_elementwise(&self) -> bool {
+        false
+    }
+
+    fn arguments(&self) -> Vec<&TypedExpression> {
+        vec![self.argument.as_ref()]
+    }
 }
 
 #[derive(Debug, Clone, PartialEq)]
@@ -133,4 +141,12 @@ impl Function for Last {
     fn name(&self) -> &'static str {
         "last"
     }
+
+    fn is_elementwise(&self) -> bool {
+        false
+    }
+
+    fn arguments(&self) -> Vec<&TypedExpression> {
+        vec![self.argument.as_ref()]
+    }
 }
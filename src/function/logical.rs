@@ -77,6 +77,14 @@ impl Function for Any {
     fn name(&self) -> &'static str {
         "any"
     }
+
+    fn is_elementwise(&self) -> bool {
+        false
+    }
+
+    fn arguments(&self) -> Vec<&TypedExpression> {
+        vec![self.argument.as_ref()]
+    }
 }
 
 #[derive(Debug, Clone, PartialEq)]
@@ -148,4 +156,12 @@ impl Function for All {
     fn name(&self) -> &'static str {
         "all"
     }
+
+    fn is_elementwise(&self) -> bool {
+        false
+    }
+
+    fn arguments(&self) -> Vec<&TypedExpression> {
+        vec![self.argument.as_ref()]
+    }
 }
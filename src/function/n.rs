@@ -63,4 +63,12 @@ impl Function for N {
     fn name(&self) -> &'static str {
         "n"
     }
+
+    fn is_elementwise(&self) -> bool {
+        false
+    }
+
+    fn arguments(&self) -> Vec<&TypedExpression> {
+        vec![]
+    }
 }
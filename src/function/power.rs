@@ -79,6 +79,14 @@ impl Function for Sqrt {
     fn name(&self) -> &'static str {
         "sqrt"
     }
+
+    fn is_elementwise(&self) -> bool {
+        self.argument.is_elementwise()
+    }
+
+    fn arguments(&self) -> Vec<&TypedExpression> {
+        vec![self.argument.as_ref()]
+    }
 }
 
 #[derive(Debug, Clone, PartialEq)]
@@ -150,6 +158,14 @@ impl Function for Exp {
     fn name(&self) -> &'static str {
         "exp"
     }
+
+    fn is_elementwise(&self) -> bool {
+        self.argument.is_elementwise()
+    }
+
+    fn arguments(&self) -> Vec<&TypedExpression> {
+        vec![self.argument.as_ref()]
+    }
 }
 
 #[derive(Debug, Clone, PartialEq)]
@@ -253,4 +269,12 @@ impl Function for Pow {
     fn name(&self) -> &'static str {
         "pow"
     }
+
+    fn is_elementwise(&self) -> bool {
+        self.base.is_elementwise() && self.exponent.is_elementwise()
+    }
+
+    fn arguments(&self) -> Vec<&TypedExpression> {
+        vec![self.base.as_ref(), self.exponent.as_ref()]
+    }
 }
@@ -73,6 +73,14 @@ impl Function for Max {
     fn name(&self) -> &'static str {
         "max"
     }
+
+    fn is_elementwise(&self) -> bool {
+        false
+    }
+
+    fn arguments(&self) -> Vec<&TypedExpression> {
+        vec![self.argument.as_ref()]
+    }
 }
 
 #[derive(Debug, Clone, PartialEq)]
@@ -138,4 +146,12 @@ impl Function for Min {
     fn name(&self) -> &'static str {
         "min"
     }
+
+    fn is_elementwise(&self) -> bool {
+        false
+    }
+
+    fn arguments(&self) -> Vec<&TypedExpression> {
+        vec![self.argument.as_ref()]
+    }
 }
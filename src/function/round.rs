@@ -82,6 +82,14 @@ macro_rules! impl_round_function {
             fn name(&self) -> &'static str {
                 $fn_name
             }
+
+            fn is_elementwise(&self) -> bool {
+                self.argument.is_elementwise()
+            }
+
+            fn arguments(&self) -> Vec<&TypedExpression> {
+                vec![self.argument.as_ref()]
+            }
         }
     };
 }
@@ -63,6 +63,14 @@ impl Function for RowIndex0 {
     fn name(&self) -> &'static str {
         "row_index0"
     }
+
+    fn is_elementwise(&self) -> bool {
+        false
+    }
+
+    fn arguments(&self) -> Vec<&TypedExpression> {
+        vec![]
+    }
 }
 
 #[derive(Debug, Clone, PartialEq)]
@@ -124,4 +132,12 @@ impl Function for RowIndex1 {
     fn name(&self) -> &'static str {
         "row_index1"
     }
+
+    fn is_elementwise(&self) -> bool {
+        false
+    }
+
+    fn arguments(&self) -> Vec<&TypedExpression> {
+        vec![]
+    }
 }
@@ -105,4 +105,12 @@ impl Function for Same {
     fn name(&self) -> &'static str {
         "same"
     }
+
+    fn is_elementwise(&self) -> bool {
+        false
+    }
+
+    fn arguments(&self) -> Vec<&TypedExpression> {
+        vec![self.argument.as_ref()]
+    }
 }
@@ -75,4 +75,12 @@ impl Function for Abs {
     fn name(&self) -> &'static str {
         "abs"
     }
+
+    fn is_elementwise(&self) -> bool {
+        self.argument.is_elementwise()
+    }
+
+    fn arguments(&self) -> Vec<&TypedExpression> {
+        vec![self.argument.as_ref()]
+    }
 }
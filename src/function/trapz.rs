@@ -155,4 +155,12 @@ impl Function for Trapz {
     fn name(&self) -> &'static str {
         "trapz"
     }
+
+    fn is_elementwise(&self) -> bool {
+        false
+    }
+
+    fn arguments(&self) -> Vec<&TypedExpression> {
+        vec![self.t.as_ref(), self.y.as_ref()]
+    }
 }
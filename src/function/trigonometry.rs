@@ -86,6 +86,14 @@ macro_rules! impl_trig_function {
             fn name(&self) -> &'static str {
                 $fn_name
             }
+
+            fn is_elementwise(&self) -> bool {
+                self.argument.is_elementwise()
+            }
+
+            fn arguments(&self) -> Vec<&TypedExpression> {
+                vec![self.argument.as_ref()]
+            }
         }
     };
 }
@@ -0,0 +1,84 @@
+use crate::config;
+use polars::prelude::*;
+
+/// Name of the column of group ids that grouped verbs partition by, unless a
+/// data frame already has a column by that name
+pub const GROUP_ID_NAME: &str = "_group_id";
+
+/// The groups of a grouped data frame, computed once and shared by every data
+/// frame that has the same rows in the same order and the same groups.
+#[derive(Debug)]
+pub struct GroupIndex {
+    /// Group of each row, numbered in order of first appearance. Verbs
+    /// partition by this one column instead of hashing the group columns.
+    pub group_ids: IdxCa,
+    /// Start of each group in `group_rows`, followed by the height
+    pub group_offsets: Vec<IdxSize>,
+    /// Row indexes, ordered by group and then by original order
+    pub group_rows: Vec<IdxSize>,
+}
+
+impl GroupIndex {
+    pub fn new(polars_data_frame: &DataFrame, group_names: &[&str]) -> PolarsResult<Self> {
+        // Hashing the group columns once gives the first row of each row's
+        // group; everything else follows from counting
+        let first_row = arange(0.into(), len(), 1, IDX_DTYPE)
+            .min()
+            .over(group_names)
+            .alias("_first_row");
+        let first_rows_lf = polars_data_frame.clone().lazy().select([first_row]);
+        let first_rows_df = config::collect(first_rows_lf, None)?;
+        let first_rows = first_rows_df
+            .column("_first_row")?
+            .as_materialized_series()
+            .idx()?;
+
+        // The first row of a group comes before the rest of the group, so its
+        // group has already been numbered by the time the others are reached
+        let mut group_ids: Vec<IdxSize> = Vec::with_capacity(polars_data_frame.height());
+        let mut group_lengths: Vec<IdxSize> = Vec::new();
+        for (row, first_row) in first_rows.into_no_null_iter().enumerate() {
+            let group_id = if first_row as usize == row {
+                group_lengths.push(0);
+                (group_lengths.len() - 1) as IdxSize
+            } else {
+                group_ids[first_row as usize]
+            };
+            group_lengths[group_id as usize] += 1;
+            group_ids.push(group_id);
+        }
+
+        let mut group_offsets: Vec<IdxSize> = Vec::with_capacity(group_lengths.len() + 1);
+        let mut offset = 0;
+        group_offsets.push(offset);
+        for length in group_lengths {
+            offset += length;
+            group_offsets.push(offset);
+        }
+
+        let mut next_slots: Vec<IdxSize> = group_offsets[..group_offsets.len() - 1].to_vec();
+        let mut group_rows: Vec<IdxSize> = vec![0; group_ids.len()];
+        for (row, &group_id) in group_ids.iter().enumerate() {
+            let slot = &mut next_slots[group_id as usize];
+            group_rows[*slot as usize] = row as IdxSize;
+            *slot += 1;
+        }
+
+        Ok(GroupIndex {
+            group_ids: IdxCa::from_vec(GROUP_ID_NAME.into(), group_ids),
+            group_offsets,
+            group_rows,
+        })
+    }
+
+    pub fn n_groups(&self) -> usize {
+        self.group_offsets.len() - 1
+    }
+
+    /// The rows of a group in their original order
+    pub fn rows_of_group(&self, group_id: usize) -> &[IdxSize] {
+        let start = self.group_offsets[group_id] as usize;
+        let end = self.group_offsets[group_id + 1] as usize;
+        &self.group_rows[start..end]
+    }
+}
@@ -0,0 +1,1145 @@
+use crate::config;
+use crate::data_frame::{polars_io_error, PyDataFrame, DUMMY_NAME};
+use crate::data_type::DataType;
+use crate::error::{
+    ColumnAlreadyExistsError, DuplicateColumnError, FilterTypeError, GroupColumnError,
+    NoGroupsError, NonexistentColumnError, RenameExistingError, SummarizeTypeError,
+    UnmatchedGroupLevelsError,
+};
+use crate::expression_cache::{self, CacheKey, CompiledExpression};
+use crate::typed_expression::{DataFrameType, ExpressionType, TypedExpression};
+use crate::workarounds::{prepend_dummy_column, prepend_dummy_column_lazy};
+use crate::PyExpression;
+use polars::datatypes::DataType as PolarsDataType;
+use polars::frame::UniqueKeepStrategy;
+use polars::prelude::*;
+use pyo3::types::PyTuple;
+use pyo3::{prelude::*, IntoPyObjectExt};
+use std::borrow::Cow;
+use std::collections::{HashMap, HashSet};
+use std::sync::{Arc, OnceLock};
+
+/// A data frame whose verbs are recorded into a single Polars plan.
+///
+/// Each verb validates its arguments against the schema of the plan so far
+/// and appends to the plan without executing it. Nothing is computed until
+/// `collect` is called, at which point Polars optimizes and runs the whole
+/// chain at once.
+#[pyclass(frozen, from_py_object)]
+#[derive(Clone)]
+pub struct PyLazyDataFrame {
+    pub(crate) polars_lazy_frame: LazyFrame,
+    pub(crate) polars_schema: SchemaRef,
+    pub(crate) group_levels: Vec<Vec<String>>,
+    pub(crate) schema_fingerprint: OnceLock<u64>,
+    // The name of a trailing column of group ids from the group index of a
+    // data frame, if the plan has one, which the verbs partition by instead of
+    // the group columns. It is not part of the schema, and every verb drops it.
+    pub(crate) group_ids_name: Option<String>,
+}
+
+#[pymethods]
+impl PyLazyDataFrame {
+    #[getter]
+    pub fn width(&self) -> usize {
+        // Subtract 1 for the dummy column
+        self.polars_schema.len() - 1
+    }
+
+    #[getter]
+    fn column_names<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyTuple>> {
+        let col_names: Vec<&str> = self
+            .iter_column_names()
+            // Skip dummy column
+            .filter(|&name| name != DUMMY_NAME)
+            .collect();
+
+        PyTuple::new(py, &col_names)
+    }
+
+    #[getter]
+    fn group_levels<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyTuple>> {
+        let mut tuples: Vec<Bound<'py, PyTuple>> = vec![];
+
+        for level in &self.group_levels {
+            let tuple = PyTuple::new(py, level.iter().map(|s| s.as_str()))?;
+            tuples.push(tuple);
+        }
+
+        PyTuple::new(py, tuples)
+    }
+
+    #[pyo3(signature = (streaming=None))]
+    pub fn collect(&self, streaming: Option<bool>, py: Python) -> PyResult<PyDataFrame> {
+        // Every verb was validated while it was recorded, so running the plan
+        // touches no Python objects and other threads can run meanwhile
+        let polars_lazy_frame = self.polars_lazy_frame.clone();
+        // The streaming engine processes the plan in batches, so sources that
+        // are scanned from disk never have to fit in memory all at once
+        let polars_data_frame = py
+            .detach(|| config::collect(polars_lazy_frame, streaming))
+            .map_err(polars_io_error)?;
+
+        // The collected data frame has the schema of the plan
+        Ok(PyDataFrame {
+            polars_data_frame,
+            group_levels: self.group_levels.clone(),
+            schema_fingerprint: self.schema_fingerprint.clone(),
+            group_index: Arc::new(OnceLock::new()),
+        })
+    }
+
+    #[staticmethod]
+    #[pyo3(signature = (path, /))]
+    pub fn scan_csv(path: String) -> PyResult<PyLazyDataFrame> {
+        // Nothing is read but the header until the plan is collected. Columns
+        // and rows that the plan does not need are skipped by the reader.
+        let polars_lazy_frame = LazyCsvReader::new(PlPath::new(&path))
+            .with_has_header(true)
+            .finish()
+            .map_err(polars_io_error)?;
+
+        PyLazyDataFrame::new(prepend_dummy_column_lazy(polars_lazy_frame), vec![])
+    }
+
+    #[staticmethod]
+    #[pyo3(signature = (path, /))]
+    pub fn scan_parquet(path: String) -> PyResult<PyLazyDataFrame> {
+        // Filters are pushed into the reader, which compares them against the
+        // statistics of each row group and skips the groups that cannot match
+        let polars_lazy_frame =
+            LazyFrame::scan_parquet(PlPath::new(&path), ScanArgsParquet::default())
+                .map_err(polars_io_error)?;
+
+        PyLazyDataFrame::new(prepend_dummy_column_lazy(polars_lazy_frame), vec![])
+    }
+
+    #[pyo3(signature = (optimized=true, physical=false))]
+    fn explain(&self, optimized: bool, physical: bool) -> PyResult<String> {
+        if physical {
+            // Polars only exposes the physical plan of the streaming engine,
+            // as a graph in the DOT language
+            self.polars_lazy_frame.to_dot_streaming_phys(optimized)
+        } else {
+            self.polars_lazy_frame.explain(optimized)
+        }
+        .map_err(polars_io_error)
+    }
+
+    #[pyo3(signature = (streaming=None))]
+    fn profile(&self, streaming: Option<bool>, py: Python) -> PyResult<(PyDataFrame, PyDataFrame)> {
+        // Run the plan the same way as collect, so that the timings are of the
+        // execution that collect would do
+        let streaming = matches!(config::engine(streaming), Engine::Streaming);
+        let polars_lazy_frame = self.polars_lazy_frame.clone().with_new_streaming(streaming);
+        let (polars_data_frame, timings) = py
+            .detach(|| polars_lazy_frame.profile())
+            .map_err(polars_io_error)?;
+
+        let result = PyDataFrame {
+            polars_data_frame,
+            group_levels: self.group_levels.clone(),
+            schema_fingerprint: self.schema_fingerprint.clone(),
+            group_index: Arc::new(OnceLock::new()),
+        };
+
+        // Timings have columns node, start, and end, in microseconds
+        let timings = PyDataFrame::new(prepend_dummy_column(timings), vec![]);
+
+        Ok((result, timings))
+    }
+
+    #[pyo3(signature = (predicate, /))]
+    pub fn filter(&self, predicate: &PyExpression, py: Python) -> PyResult<PyLazyDataFrame> {
+        // Validate the predicate expression
+        let compiled_predicate = self.compile_expression(
+            predicate,
+            self.schema_fingerprint(),
+            &[],
+            &mut None,
+            || DataFrameType::from_schema(&self.polars_schema),
+            py,
+        )?;
+        let typed_predicate = &compiled_predicate.typed_expression;
+
+        // Assert that predicate is Boolean
+        if typed_predicate.expression_type().data_type() != DataType::Boolean {
+            return Err(PyErr::from_value(
+                FilterTypeError {
+                    actual_type: typed_predicate.expression_type().data_type(),
+                }
+                .into_bound_py_any(py)?,
+            ));
+        }
+
+        let filtered_lf = self.drop_group_ids(
+            self.polars_lazy_frame
+                .clone()
+                .filter(compiled_predicate.grouped_polars_expression),
+        );
+
+        PyLazyDataFrame::new(filtered_lf, self.group_levels.clone())
+    }
+
+    #[pyo3(signature = (columns, /))]
+    pub fn distinct(&self, columns: Vec<String>, py: Python) -> PyResult<PyLazyDataFrame> {
+        let column_names: Vec<&str> = columns.iter().map(|s| s.as_str()).collect();
+        self.validate_column_names_unique(&column_names, py)?;
+        self.validate_column_names_exist_vec(&column_names, py)?;
+
+        // Create set of selected columns
+        let selected_set: HashSet<&str> = column_names.iter().copied().collect();
+
+        // Get unmentioned group columns
+        let unmentioned_groups: Vec<&str> = self
+            .group_keys()
+            .into_iter()
+            .filter(|&col| !selected_set.contains(col))
+            .collect();
+
+        // Combine group columns and selected columns
+        let mut columns_to_distinct = unmentioned_groups;
+        columns_to_distinct.extend(column_names);
+
+        // Get distinct rows
+        let distinct_lf = self.drop_group_ids(
+            self.polars_lazy_frame
+                .clone()
+                .unique_stable(Some(cols(columns_to_distinct)), UniqueKeepStrategy::First),
+        );
+
+        PyLazyDataFrame::new(distinct_lf, self.group_levels.clone())
+    }
+
+    #[pyo3(signature = ())]
+    pub fn unique(&self) -> PyResult<PyLazyDataFrame> {
+        let unique_lf = self
+            .polars_lazy_frame
+            .clone()
+            .unique_stable(None, UniqueKeepStrategy::First);
+
+        PyLazyDataFrame::new(unique_lf, self.group_levels.clone())
+    }
+
+    #[pyo3(signature = (columns, /))]
+    pub fn sort(&self, columns: Vec<String>, py: Python) -> PyResult<PyLazyDataFrame> {
+        let column_names: Vec<&str> = columns.iter().map(|s| s.as_str()).collect();
+        self.validate_column_names_unique(&column_names, py)?;
+        self.validate_column_names_exist_vec(&column_names, py)?;
+        self.validate_group_names_not_used(&column_names, py)?;
+
+        let group_keys = self.group_keys();
+
+        let polars_columns = columns.iter().map(col).collect::<Vec<_>>();
+
+        let polars_expression = all()
+            .as_expr()
+            .sort_by(polars_columns, Default::default())
+            .over(group_keys.as_slice());
+
+        let sorted_lf =
+            self.drop_group_ids(self.polars_lazy_frame.clone().select(&[polars_expression]));
+
+        PyLazyDataFrame::new(sorted_lf, self.group_levels.clone())
+    }
+
+    #[pyo3(signature = (columns, /))]
+    pub fn cluster(&self, columns: Vec<String>, py: Python) -> PyResult<PyLazyDataFrame> {
+        let column_names: Vec<&str> = columns.iter().map(|s| s.as_str()).collect();
+        self.validate_column_names_unique(&column_names, py)?;
+        self.validate_column_names_exist_vec(&column_names, py)?;
+        self.validate_group_names_not_used(&column_names, py)?;
+
+        let group_keys = self.group_keys();
+
+        // Combine group columns and selected columns
+        let mut window_columns = group_keys.clone();
+        window_columns.extend(column_names);
+
+        let clustered_lf = self.drop_group_ids(
+            self.polars_lazy_frame
+                .clone()
+                .with_column(arange(0.into(), len(), 1, PolarsDataType::Int32).alias("_index"))
+                .with_column(col("_index").min().over(window_columns))
+                .select(&[all()
+                    .as_expr()
+                    .sort_by([col("_index")], Default::default())
+                    .over(group_keys.as_slice())])
+                .drop(cols(["_index"])),
+        );
+
+        PyLazyDataFrame::new(clustered_lf, self.group_levels.clone())
+    }
+
+    #[pyo3(signature = (columns, /))]
+    pub fn select(&self, columns: Vec<String>, py: Python) -> PyResult<PyLazyDataFrame> {
+        let column_names: Vec<&str> = columns.iter().map(|s| s.as_str()).collect();
+        self.validate_column_names_unique(&column_names, py)?;
+        self.validate_column_names_exist_vec(&column_names, py)?;
+
+        // Create sets for lookup
+        let select_set: HashSet<&str> = column_names.iter().copied().collect();
+        let group_set: HashSet<&str> = self.iter_group_names().collect();
+
+        // Find unmentioned group columns that appear in the original column order
+        let unmentioned_groups: Vec<&str> = self
+            .iter_column_names()
+            .filter(|&col| group_set.contains(col) && !select_set.contains(col))
+            .collect();
+
+        // Combine unmentioned groups and selected columns in order
+        let mut columns_to_select = vec![];
+        columns_to_select.extend(unmentioned_groups);
+        columns_to_select.extend(column_names.iter());
+
+        // Keep only the selected columns
+        let selected_lf = self.polars_lazy_frame.clone().select(
+            columns_to_select
+                .into_iter()
+                .map(col)
+                .collect::<Vec<Expr>>(),
+        );
+
+        PyLazyDataFrame::new(selected_lf, self.group_levels.clone())
+    }
+
+    #[pyo3(signature = (columns, /))]
+    pub fn deselect(&self, columns: Vec<String>, py: Python) -> PyResult<PyLazyDataFrame> {
+        let column_names: Vec<&str> = columns.iter().map(|s| s.as_str()).collect();
+        self.validate_column_names_unique(&column_names, py)?;
+        self.validate_column_names_exist_vec(&column_names, py)?;
+        self.validate_group_names_not_used(&column_names, py)?;
+
+        // Drop the selected columns
+        let dropped_lf = self.polars_lazy_frame.clone().drop(cols(column_names));
+
+        PyLazyDataFrame::new(dropped_lf, self.group_levels.clone())
+    }
+
+    #[pyo3(signature = (columns, /))]
+    pub fn rename(&self, columns: Vec<(String, String)>, py: Python) -> PyResult<PyLazyDataFrame> {
+        let from_names: Vec<&str> = columns.iter().map(|(_, c)| c.as_str()).collect();
+        self.validate_column_names_unique(&from_names, py)?;
+        self.validate_column_names_exist_vec(&from_names, py)?;
+
+        let to_names: Vec<&str> = columns.iter().map(|(c, _)| c.as_str()).collect();
+        self.validate_column_names_unique(&to_names, py)?;
+
+        // Do not allow renaming to existing columns
+        let mut existing_columns: HashSet<&str> = self
+            .iter_column_names()
+            .filter(|&name| name != DUMMY_NAME)
+            .collect();
+
+        for name in &from_names {
+            existing_columns.remove(name);
+        }
+
+        for (to_name, from_name) in &columns {
+            if existing_columns.contains(to_name.as_str()) {
+                return Err(PyErr::from_value(
+                    RenameExistingError {
+                        old_column: from_name.clone(),
+                        new_column: to_name.clone(),
+                    }
+                    .into_bound_py_any(py)?,
+                ));
+            }
+        }
+
+        let column_mapping: HashMap<&str, &str> = columns
+            .iter()
+            .map(|(old, new)| (new.as_str(), old.as_str()))
+            .collect();
+
+        let renamed_lf = self
+            .polars_lazy_frame
+            .clone()
+            .rename(from_names, to_names, true);
+
+        let renamed_group_levels: Vec<Vec<String>> = self
+            .group_levels
+            .iter()
+            .map(|level| {
+                level
+                    .iter()
+                    .map(|col| {
+                        column_mapping
+                            .get(col.as_str())
+                            .map_or(col.clone(), |&new_name| new_name.to_string())
+                    })
+                    .collect()
+            })
+            .collect();
+
+        PyLazyDataFrame::new(renamed_lf, renamed_group_levels)
+    }
+
+    #[pyo3(signature = (mutators, /))]
+    pub fn mutate(
+        &self,
+        mutators: Vec<(String, PyExpression)>,
+        py: Python,
+    ) -> PyResult<PyLazyDataFrame> {
+        let mutated_names: Vec<&str> = mutators.iter().map(|(c, _)| c.as_str()).collect();
+        self.validate_group_names_not_used(&mutated_names, py)?;
+        let source = self.with_group_ids_avoiding(&mutated_names);
+
+        let compiled_mutators = source.compile_expressions(&mutators, py)?;
+
+        let polars_lf = source.with_mutators(source.polars_lazy_frame.clone(), &compiled_mutators);
+        let polars_lf = source.drop_group_ids(polars_lf);
+
+        PyLazyDataFrame::new(polars_lf, self.group_levels.clone())
+    }
+
+    #[pyo3(signature = (mutators, /))]
+    pub fn transmute(
+        &self,
+        mutators: Vec<(String, PyExpression)>,
+        py: Python,
+    ) -> PyResult<PyLazyDataFrame> {
+        let transmuted_names: Vec<&str> = mutators.iter().map(|(c, _)| c.as_str()).collect();
+        self.validate_group_names_not_used(&transmuted_names, py)?;
+        let source = self.with_group_ids_avoiding(&transmuted_names);
+
+        let compiled_mutators = source.compile_expressions(&mutators, py)?;
+
+        let flattened_groups: Vec<&str> = self.iter_group_names().collect();
+
+        let polars_lf = source.with_mutators(source.polars_lazy_frame.clone(), &compiled_mutators);
+
+        let mut all_columns: Vec<&str> = flattened_groups;
+        all_columns.extend(transmuted_names);
+
+        let transmuted_lf =
+            polars_lf.select(all_columns.into_iter().map(col).collect::<Vec<Expr>>());
+
+        PyLazyDataFrame::new(transmuted_lf, self.group_levels.clone())
+    }
+
+    #[pyo3(signature = (group_level, /))]
+    pub fn group_by(&self, group_level: Vec<String>, py: Python<'_>) -> PyResult<PyLazyDataFrame> {
+        let column_names: Vec<&str> = group_level.iter().map(|s| s.as_str()).collect();
+        self.validate_column_names_unique(&column_names, py)?;
+        self.validate_column_names_exist_vec(&column_names, py)?;
+        self.validate_group_names_not_used(&column_names, py)?;
+
+        // Append the new group level
+        let mut new_group_levels = self.group_levels.clone();
+        new_group_levels.push(group_level);
+
+        Ok(PyLazyDataFrame {
+            polars_lazy_frame: self.polars_lazy_frame.clone(),
+            polars_schema: self.polars_schema.clone(),
+            group_levels: new_group_levels,
+            // Grouping does not change the schema
+            schema_fingerprint: self.schema_fingerprint.clone(),
+            group_ids_name: None,
+        })
+    }
+
+    #[pyo3(signature = ())]
+    pub fn ungroup(&self, py: Python) -> PyResult<PyLazyDataFrame> {
+        let new_group_levels = self.drop_one_group_level(py)?;
+
+        Ok(PyLazyDataFrame {
+            polars_lazy_frame: self.polars_lazy_frame.clone(),
+            polars_schema: self.polars_schema.clone(),
+            group_levels: new_group_levels,
+            // Grouping does not change the schema
+            schema_fingerprint: self.schema_fingerprint.clone(),
+            group_ids_name: None,
+        })
+    }
+
+    #[pyo3(signature = (columns, /))]
+    pub fn summarize(
+        &self,
+        columns: Vec<(String, PyExpression)>,
+        py: Python,
+    ) -> PyResult<PyLazyDataFrame> {
+        let summarized_names: Vec<&str> = columns.iter().map(|(c, _)| c.as_str()).collect();
+        self.validate_group_names_not_used(&summarized_names, py)?;
+        let new_group_levels = self.drop_one_group_level(py)?;
+        let source = self.with_group_ids_avoiding(&summarized_names);
+
+        let compiled_columns = source.compile_expressions(&columns, py)?;
+
+        // Assert that each expression is scalar (a reduction)
+        for (name, compiled) in &compiled_columns {
+            if let ExpressionType::Array(_) = compiled.typed_expression.expression_type() {
+                return Err(PyErr::from_value(
+                    SummarizeTypeError {
+                        column: name.clone(),
+                    }
+                    .into_bound_py_any(py)?,
+                ));
+            }
+        }
+
+        let flattened_groups: Vec<&str> = self.iter_group_names().collect();
+        let group_keys = source.group_keys();
+
+        // There is no way to sequentially evaluate expressions in a group_by
+        // context: https://stackoverflow.com/q/71120396/
+        // Instead, summarize in phases. Reducers over the original columns are
+        // aggregated once, and expressions that only combine earlier results
+        // are evaluated afterward on the aggregated frame. An expression that
+        // mixes both, like `mean(x - a)` or `a / n()`, is evaluated within each
+        // group of the original rows, where the earlier results it reads have
+        // been broadcast to columns of their own. It reads those columns by
+        // name, so no definition is ever inlined into another. The columns are
+        // named so as not to overwrite any other column.
+        let broadcast_names: Vec<String> = (0..compiled_columns.len())
+            .map(|index| {
+                unused_name(&format!("_summary_{index}"), |name| {
+                    source.polars_schema.contains(name) || group_keys.contains(&name)
+                })
+            })
+            .collect();
+
+        // The earlier results that each expression reads, by variable name and
+        // index of the latest definition
+        let mut definitions = HashMap::<&str, usize>::new();
+        let mut references: Vec<Vec<(&str, usize)>> = vec![];
+        let mut is_mixed: Vec<bool> = vec![];
+        for (index, (name, compiled)) in compiled_columns.iter().enumerate() {
+            let typed = &compiled.typed_expression;
+            let variable_names = typed.variable_names();
+            let read: Vec<(&str, usize)> = variable_names
+                .iter()
+                .filter_map(|&variable| {
+                    definitions
+                        .get(variable)
+                        .map(|&reference| (variable, reference))
+                })
+                .collect();
+            is_mixed.push(
+                !read.is_empty() && !(typed.is_elementwise() && read.len() == variable_names.len()),
+            );
+            references.push(read);
+            definitions.insert(name.as_str(), index);
+        }
+
+        // Mixed expressions are broadcast, and so is everything they read
+        let mut is_broadcast = is_mixed.clone();
+        for index in (0..compiled_columns.len()).rev() {
+            if is_broadcast[index] {
+                for &(_, reference) in &references[index] {
+                    is_broadcast[reference] = true;
+                }
+            }
+        }
+
+        let mut rows_lf = source.polars_lazy_frame.clone();
+        let mut aggregations = vec![];
+        if source.group_ids_name.is_some() {
+            // The group columns are constant within each group
+            aggregations.extend(flattened_groups.iter().map(|&name| col(name).first()));
+        }
+        let mut post_aggregations = vec![];
+        for (index, (name, compiled)) in compiled_columns.iter().enumerate() {
+            if is_broadcast[index] {
+                let substitutions: HashMap<&str, TypedExpression> = references[index]
+                    .iter()
+                    .map(|&(variable, reference)| {
+                        let broadcast_variable = TypedExpression::Variable {
+                            name: broadcast_names[reference].clone(),
+                            expression_type: compiled_columns[reference]
+                                .1
+                                .typed_expression
+                                .expression_type(),
+                        };
+                        (variable, broadcast_variable)
+                    })
+                    .collect();
+                let broadcast_expression = compiled
+                    .typed_expression
+                    .substitute(&substitutions)
+                    .to_polars()
+                    .over(group_keys.as_slice());
+                rows_lf = rows_lf
+                    .with_column(broadcast_expression.alias(broadcast_names[index].as_str()));
+            }
+
+            if is_mixed[index] {
+                // Every row of the group holds the same value
+                aggregations.push(col(broadcast_names[index].as_str()).first().alias(name));
+            } else if references[index].is_empty() {
+                aggregations.push(compiled.polars_expression.clone().alias(name));
+            } else {
+                post_aggregations.push((name.clone(), compiled.clone()));
+            }
+        }
+
+        let aggregated_lf = rows_lf
+            .group_by_stable(group_keys.as_slice())
+            .agg(aggregations);
+
+        let mut all_columns: Vec<&str> = flattened_groups;
+        all_columns.extend(summarized_names);
+
+        let summarized_lf = source
+            .with_mutators(aggregated_lf, &post_aggregations)
+            .select(all_columns.into_iter().map(col).collect::<Vec<Expr>>());
+
+        PyLazyDataFrame::new(summarized_lf, new_group_levels)
+    }
+
+    #[pyo3(signature = (key, value))]
+    pub fn spread(&self, key: String, value: String, py: Python) -> PyResult<PyLazyDataFrame> {
+        let produced_column_names = vec![key.as_str(), value.as_str()];
+        self.validate_column_names_unique(&produced_column_names, py)?;
+        self.validate_column_names_exist_vec(&produced_column_names, py)?;
+        self.validate_group_names_not_used(&produced_column_names, py)?;
+        let new_group_levels = self.drop_one_group_level(py)?;
+
+        let flattened_groups: Vec<&str> = self.iter_group_names().collect();
+
+        // The output columns of a pivot depend on the data, so the distinct
+        // keys have to be computed up front. Polars prunes this query down to
+        // just the upstream work needed to produce the key column.
+        let keys_lazy_frame = self
+            .polars_lazy_frame
+            .clone()
+            .select([col(key.as_str()).unique().sort(Default::default())]);
+        let on_columns = py
+            .detach(|| config::collect(keys_lazy_frame, None))
+            .map_err(polars_io_error)?;
+
+        // The pivot creates a column named after each key, which must not
+        // overwrite the group ids
+        let source = match &self.group_ids_name {
+            Some(_) => {
+                let spread_names: Vec<String> = on_columns
+                    .column(key.as_str())
+                    .and_then(|keys| keys.cast(&PolarsDataType::String))
+                    .map_err(polars_io_error)?
+                    .str()
+                    .map_err(polars_io_error)?
+                    .iter()
+                    .map(|name| name.unwrap_or("null").to_string())
+                    .collect();
+                let spread_names: Vec<&str> = spread_names.iter().map(String::as_str).collect();
+                self.with_group_ids_avoiding(&spread_names)
+            }
+            None => Cow::Borrowed(self),
+        };
+
+        let group_keys = source.group_keys();
+        let pivot_lf = source.polars_lazy_frame.clone().pivot(
+            cols([key]),
+            Arc::new(on_columns),
+            cols(group_keys),
+            cols([value]),
+            element().first(),
+            true,
+            "_".into(),
+        );
+
+        let pivot_lf = match &source.group_ids_name {
+            Some(group_ids_name) => {
+                // Put back the group columns, which are constant within each group
+                let group_columns: Vec<Expr> = flattened_groups
+                    .iter()
+                    .map(|&name| col(name).first())
+                    .collect();
+                let groups_lf = source
+                    .polars_lazy_frame
+                    .clone()
+                    .group_by_stable([col(group_ids_name.as_str())])
+                    .agg(group_columns);
+                source.drop_group_ids(groups_lf.join(
+                    pivot_lf,
+                    [col(group_ids_name.as_str())],
+                    [col(group_ids_name.as_str())],
+                    JoinArgs {
+                        how: JoinType::Left,
+                        validation: JoinValidation::ManyToMany,
+                        suffix: None,
+                        slice: None,
+                        nulls_equal: false,
+                        coalesce: JoinCoalesce::CoalesceColumns,
+                        maintain_order: MaintainOrderJoin::Left,
+                        build_side: None,
+                    },
+                ))
+            }
+            None => pivot_lf,
+        };
+
+        PyLazyDataFrame::new(pivot_lf, new_group_levels)
+    }
+
+    #[pyo3(signature = (key, value, columns))]
+    pub fn gather(
+        &self,
+        key: String,
+        value: String,
+        columns: Vec<String>,
+        py: Python,
+    ) -> PyResult<PyLazyDataFrame> {
+        let consumed_column_names: Vec<&str> = columns.iter().map(|s| s.as_str()).collect();
+        self.validate_column_names_unique(&consumed_column_names, py)?;
+        self.validate_column_names_exist_vec(&consumed_column_names, py)?;
+        self.validate_group_names_not_used(&consumed_column_names, py)?;
+        for name in self.iter_column_names() {
+            if name == key.as_str() || name == value.as_str() {
+                return Err(PyErr::from_value(
+                    ColumnAlreadyExistsError {
+                        column_name: name.to_string(),
+                    }
+                    .into_bound_py_any(py)?,
+                ));
+            }
+        }
+
+        let consumed_column_set: HashSet<&str> = consumed_column_names.iter().copied().collect();
+        let unpivot_columns: Vec<&str> = self
+            .iter_column_names()
+            .filter(|&col| !consumed_column_set.contains(col))
+            .collect();
+
+        let unpivot_lf = self.polars_lazy_frame.clone().unpivot(UnpivotArgsDSL {
+            index: cols(unpivot_columns.clone()),
+            on: Some(cols(consumed_column_names)),
+            variable_name: Some(key.clone().into()),
+            value_name: Some(value.into()),
+        });
+
+        let existing_group_columns: HashSet<&str> = self.iter_group_names().collect();
+        let new_group_level: Vec<String> = unpivot_columns
+            .iter()
+            .copied()
+            .filter(|&col| !existing_group_columns.contains(col))
+            .map(|s| s.to_string())
+            .collect();
+        let mut group_levels = self.group_levels.clone();
+        group_levels.push(new_group_level);
+
+        PyLazyDataFrame::new(unpivot_lf, group_levels)
+    }
+
+    #[pyo3(signature = (other, by, /))]
+    pub fn inner_join(
+        &self,
+        other: &PyLazyDataFrame,
+        by: Vec<(String, String)>,
+        py: Python,
+    ) -> PyResult<PyLazyDataFrame> {
+        self.join(other, &by, JoinType::Inner, py)
+    }
+
+    #[pyo3(signature = (other, by, /))]
+    pub fn outer_join(
+        &self,
+        other: &PyLazyDataFrame,
+        by: Vec<(String, String)>,
+        py: Python,
+    ) -> PyResult<PyLazyDataFrame> {
+        self.join(other, &by, JoinType::Full, py)
+    }
+
+    #[pyo3(signature = (other, by, /))]
+    pub fn left_join(
+        &self,
+        other: &PyLazyDataFrame,
+        by: Vec<(String, String)>,
+        py: Python,
+    ) -> PyResult<PyLazyDataFrame> {
+        self.join(other, &by, JoinType::Left, py)
+    }
+}
+
+impl PyLazyDataFrame {
+    pub(crate) fn new(
+        mut polars_lazy_frame: LazyFrame,
+        group_levels: Vec<Vec<String>>,
+    ) -> PyResult<PyLazyDataFrame> {
+        // Resolving the schema only type-checks the plan; it does not run it,
+        // but a scan reads the header or metadata of its file
+        let polars_schema = polars_lazy_frame
+            .collect_schema()
+            .map_err(polars_io_error)?;
+
+        Ok(PyLazyDataFrame {
+            polars_lazy_frame,
+            polars_schema,
+            group_levels,
+            schema_fingerprint: OnceLock::new(),
+            group_ids_name: None,
+        })
+    }
+
+    /// The columns that identify the group of each row
+    fn group_keys(&self) -> Vec<&str> {
+        match &self.group_ids_name {
+            Some(group_ids_name) => vec![group_ids_name.as_str()],
+            None => self.iter_group_names().collect(),
+        }
+    }
+
+    fn drop_group_ids(&self, polars_lf: LazyFrame) -> LazyFrame {
+        match &self.group_ids_name {
+            Some(group_ids_name) => polars_lf.drop(cols([group_ids_name.as_str()])),
+            None => polars_lf,
+        }
+    }
+
+    /// This data frame with its column of group ids renamed, if necessary, so
+    /// that a verb can create columns with the given names without
+    /// overwriting it
+    fn with_group_ids_avoiding(&self, names: &[&str]) -> Cow<'_, PyLazyDataFrame> {
+        match &self.group_ids_name {
+            Some(group_ids_name) if names.contains(&group_ids_name.as_str()) => {
+                let new_name = unused_name(group_ids_name, |name| {
+                    names.contains(&name) || self.polars_schema.contains(name)
+                });
+                let polars_lazy_frame = self.polars_lazy_frame.clone().rename(
+                    [group_ids_name.as_str()],
+                    [new_name.as_str()],
+                    true,
+                );
+
+                Cow::Owned(PyLazyDataFrame {
+                    polars_lazy_frame,
+                    polars_schema: self.polars_schema.clone(),
+                    group_levels: self.group_levels.clone(),
+                    schema_fingerprint: self.schema_fingerprint.clone(),
+                    group_ids_name: Some(new_name),
+                })
+            }
+            _ => Cow::Borrowed(self),
+        }
+    }
+
+    pub(crate) fn schema_fingerprint(&self) -> u64 {
+        *self
+            .schema_fingerprint
+            .get_or_init(|| DataFrameType::fingerprint_schema(&self.polars_schema))
+    }
+
+    pub(crate) fn iter_column_names(&self) -> impl Iterator<Item = &str> {
+        // Contains dummy column
+        self.polars_schema.iter_names().map(|name| name.as_str())
+    }
+
+    /// Validate a list of named expressions in order, where each can refer to
+    /// the ones before it by name, and compile them for the groups of this
+    /// data frame.
+    fn compile_expressions(
+        &self,
+        expressions: &[(String, PyExpression)],
+        py: Python,
+    ) -> PyResult<Vec<(String, CompiledExpression)>> {
+        let mut fingerprint = self.schema_fingerprint();
+        let mut added_columns: Vec<(String, ExpressionType)> = Vec::new();
+        // Only built if some expression is not in the cache
+        let mut df_type: Option<DataFrameType> = None;
+        let mut compiled_expressions: Vec<(String, CompiledExpression)> = Vec::new();
+        for (name, expression) in expressions {
+            let compiled = self.compile_expression(
+                expression,
+                fingerprint,
+                &added_columns,
+                &mut df_type,
+                || {
+                    compiled_expressions.iter().fold(
+                        DataFrameType::from_schema(&self.polars_schema),
+                        |df_type, (name, compiled)| {
+                            df_type.with_column(
+                                name.clone(),
+                                compiled.typed_expression.expression_type(),
+                            )
+                        },
+                    )
+                },
+                py,
+            )?;
+
+            let expression_type = compiled.typed_expression.expression_type();
+            fingerprint =
+                DataFrameType::fingerprint_with_column(fingerprint, name, expression_type);
+            df_type = df_type.map(|df_type| df_type.with_column(name.clone(), expression_type));
+            added_columns.push((name.clone(), expression_type));
+            compiled_expressions.push((name.clone(), compiled));
+        }
+
+        Ok(compiled_expressions)
+    }
+
+    /// Validate, cast, and compile an expression against the schema of this
+    /// data frame with the given columns added, whose fingerprint is given,
+    /// reusing an earlier result if there is one.
+    fn compile_expression(
+        &self,
+        expression: &PyExpression,
+        fingerprint: u64,
+        added_columns: &[(String, ExpressionType)],
+        df_type: &mut Option<DataFrameType>,
+        build_df_type: impl FnOnce() -> DataFrameType,
+        py: Python,
+    ) -> PyResult<CompiledExpression> {
+        let group_names = self.group_keys();
+        let key = CacheKey::new(
+            expression.id(),
+            fingerprint,
+            &self.polars_schema,
+            added_columns,
+            &group_names,
+        );
+        if let Some(compiled) = expression_cache::get(&key) {
+            return Ok(compiled);
+        }
+
+        let df_type = df_type.get_or_insert_with(build_df_type);
+        let typed_expression = expression.validate(df_type, py)?;
+        let result_dt = typed_expression.expression_type().data_type();
+        let typed_expression = typed_expression.cast_if_needed(result_dt);
+
+        let polars_expression = typed_expression.to_polars();
+        let grouped_polars_expression = if typed_expression.is_elementwise() {
+            // Each row depends only on itself, so partitioning by group cannot change the result
+            polars_expression.clone()
+        } else {
+            polars_expression.clone().over(group_names.as_slice())
+        };
+
+        let compiled = CompiledExpression {
+            typed_expression,
+            polars_expression,
+            grouped_polars_expression,
+        };
+        expression_cache::insert(key, compiled.clone());
+
+        Ok(compiled)
+    }
+
+    fn with_mutators(
+        &self,
+        mut polars_lf: LazyFrame,
+        compiled_mutators: &[(String, CompiledExpression)],
+    ) -> LazyFrame {
+        for layer in layer_mutators(compiled_mutators) {
+            let named_expressions: Vec<Expr> = layer
+                .into_iter()
+                .map(|(column, compiled)| compiled.grouped_polars_expression.clone().alias(column))
+                .collect();
+            polars_lf = polars_lf.with_columns(named_expressions);
+        }
+        polars_lf
+    }
+
+    fn join(
+        &self,
+        other: &PyLazyDataFrame,
+        by: &[(String, String)],
+        how: JoinType,
+        py: Python,
+    ) -> PyResult<PyLazyDataFrame> {
+        let (left_columns, right_columns) = self.validate_join_by(by, other, py)?;
+
+        let joined_lf = self.polars_lazy_frame.clone().join(
+            other.polars_lazy_frame.clone(),
+            left_columns.into_iter().map(col).collect::<Vec<Expr>>(),
+            right_columns.into_iter().map(col).collect::<Vec<Expr>>(),
+            JoinArgs {
+                how,
+                validation: JoinValidation::ManyToMany,
+                suffix: None,
+                slice: None,
+                nulls_equal: true,
+                coalesce: JoinCoalesce::CoalesceColumns,
+                maintain_order: MaintainOrderJoin::LeftRight,
+                build_side: None,
+            },
+        );
+
+        // Rows only ever match within the same group, so the groups of this
+        // data frame carry over to the result
+        PyLazyDataFrame::new(joined_lf, self.group_levels.clone())
+    }
+
+    fn validate_column_names_unique(&self, column_names: &[&str], py: Python<'_>) -> PyResult<()> {
+        let mut seen_columns = HashSet::new();
+
+        for column_name in column_names {
+            if !seen_columns.insert(column_name) {
+                return Err(PyErr::from_value(
+                    DuplicateColumnError {
+                        column_name: column_name.to_string(),
+                    }
+                    .into_bound_py_any(py)?,
+                ));
+            }
+        }
+
+        Ok(())
+    }
+
+    fn validate_column_names_exist_vec(
+        &self,
+        column_names: &[&str],
+        py: Python<'_>,
+    ) -> PyResult<()> {
+        let existing_columns: HashSet<&str> = self.iter_column_names().collect();
+
+        for column_name in column_names {
+            match existing_columns.get(column_name) {
+                Some(_) => {}
+                None => {
+                    return Err(PyErr::from_value(
+                        NonexistentColumnError {
+                            column_name: column_name.to_string(),
+                            existing_column_names: existing_columns
+                                .iter()
+                                .map(|s| s.to_string())
+                                .collect(),
+                        }
+                        .into_bound_py_any(py)?,
+                    ));
+                }
+            }
+        }
+
+        Ok(())
+    }
+
+    fn validate_group_names_not_used(&self, column_names: &[&str], py: Python<'_>) -> PyResult<()> {
+        let group_levels_set: HashSet<&str> = self
+            .group_levels
+            .iter()
+            .flat_map(|level| level.iter())
+            .map(|s| s.as_str())
+            .collect();
+
+        for column_name in column_names {
+            if group_levels_set.contains(column_name) {
+                return Err(PyErr::from_value(
+                    GroupColumnError {
+                        column_name: column_name.to_string(),
+                    }
+                    .into_bound_py_any(py)?,
+                ));
+            }
+        }
+
+        Ok(())
+    }
+
+    fn iter_group_names(&self) -> impl Iterator<Item = &str> {
+        // WORKAROUND: Many operations fail if the group columns are empty
+        // Always include the dummy column as a group column to ensure that
+        // groups are never empty
+        std::iter::once(DUMMY_NAME).chain(
+            self.group_levels
+                .iter()
+                .flat_map(|level| level.iter().map(|s| s.as_str())),
+        )
+    }
+
+    fn drop_one_group_level(&self, py: Python) -> PyResult<Vec<Vec<String>>> {
+        if self.group_levels.is_empty() {
+            Err(PyErr::from_value(NoGroupsError {}.into_bound_py_any(py)?))
+        } else {
+            Ok(self.group_levels[..self.group_levels.len() - 1].to_vec())
+        }
+    }
+
+    fn validate_join_by<'a>(
+        &'a self,
+        by: &'a [(String, String)],
+        other: &PyLazyDataFrame,
+        py: Python,
+    ) -> PyResult<(Vec<&'a str>, Vec<&'a str>)> {
+        // Check for duplicate column names in the join keys
+        let left_names: Vec<&str> = by.iter().map(|(l, _)| l.as_str()).collect();
+        self.validate_column_names_unique(&left_names, py)?;
+        self.validate_column_names_exist_vec(&left_names, py)?;
+
+        let right_names: Vec<&str> = by.iter().map(|(_, r)| r.as_str()).collect();
+        other.validate_column_names_unique(&right_names, py)?;
+        other.validate_column_names_exist_vec(&right_names, py)?;
+
+        // The other data frame is either ungrouped or grouped the same way, so
+        // that its groups are the same as the groups of this data frame
+        if !other.group_levels.is_empty() && other.group_levels != self.group_levels {
+            return Err(PyErr::from_value(
+                UnmatchedGroupLevelsError {
+                    expected_group_levels: self.group_levels.clone(),
+                    actual_group_levels: other.group_levels.clone(),
+                }
+                .into_bound_py_any(py)?,
+            ));
+        }
+
+        // The group columns are implicit keys matched by name, so they cannot
+        // also be matched explicitly
+        let group_names: Vec<&str> = self.iter_group_names().collect();
+        self.validate_group_names_not_used(&left_names, py)?;
+        self.validate_group_names_not_used(&right_names, py)?;
+        other.validate_column_names_exist_vec(&group_names[1..], py)?;
+
+        // Keys begin with the dummy column so that it does not get duplicated
+        // and so that there is always at least one key
+        let mut left_keys = group_names.clone();
+        left_keys.extend(left_names);
+
+        let mut right_keys = group_names;
+        right_keys.extend(right_names);
+
+        Ok((left_keys, right_keys))
+    }
+}
+
+/// Split sequential mutators into layers that can each be evaluated by a single `with_columns`.
+///
+/// A mutator must come in a later layer than any mutator whose output it reads or whose output
+/// column it overwrites. It must also not come in an earlier layer than a mutator that reads the
+/// column it overwrites. Within a layer, every expression sees only the columns from before the
+/// layer, so this gives the same result as evaluating the mutators one at a time.
+fn layer_mutators(
+    compiled_mutators: &[(String, CompiledExpression)],
+) -> Vec<Vec<(&str, &CompiledExpression)>> {
+    let mut layers: Vec<Vec<(&str, &CompiledExpression)>> = Vec::new();
+    let mut writer_layers: HashMap<&str, usize> = HashMap::new();
+    let mut reader_layers: HashMap<&str, usize> = HashMap::new();
+
+    for (column, compiled) in compiled_mutators {
+        let column = column.as_str();
+        let variable_names = compiled.typed_expression.variable_names();
+
+        let mut layer = 0;
+        for name in variable_names.iter().chain(std::iter::once(&column)) {
+            if let Some(writer_layer) = writer_layers.get(name) {
+                layer = layer.max(writer_layer + 1);
+            }
+        }
+        if let Some(reader_layer) = reader_layers.get(column) {
+            layer = layer.max(*reader_layer);
+        }
+
+        if layer == layers.len() {
+            layers.push(Vec::new());
+        }
+        layers[layer].push((column, compiled));
+
+        writer_layers.insert(column, layer);
+        for name in variable_names {
+            let reader_layer = reader_layers.entry(name).or_insert(layer);
+            *reader_layer = (*reader_layer).max(layer);
+        }
+    }
+
+    layers
+}
+
+/// A name for a temporary column, based on the given one, that is not taken
+pub(crate) fn unused_name(base: &str, is_taken: impl Fn(&str) -> bool) -> String {
+    let mut name = base.to_string();
+    while is_taken(&name) {
+        name.insert(0, '_');
+    }
+    name
+}
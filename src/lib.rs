@@ -1,11 +1,16 @@
 mod array;
 mod arrow;
 mod concatenate;
+mod config;
 mod data_frame;
 mod data_type;
 mod error;
 pub mod expression;
+mod expression_cache;
+mod from_sequence;
 mod function;
+mod group_index;
+mod lazy_data_frame;
 mod py_expression;
 mod py_function;
 mod py_scalar;
@@ -26,10 +31,13 @@ pub use error::{
     TypeMismatchError, UnknownFunctionError, UnknownVariableError, UnmatchedColumnsError,
     UnmatchedGroupLevelsError, UnmatchedHeightError,
 };
+pub use lazy_data_frame::PyLazyDataFrame;
 pub use py_expression::PyExpression;
 use pyo3::prelude::*;
 
-#[pymodule(name = "_tabeline")]
+// Every pyclass is frozen or guards its state with a lock, and Polars is
+// thread-safe, so the module does not need the GIL on free-threaded builds
+#[pymodule(name = "_tabeline", gil_used = false)]
 mod extension_module {
     #[pymodule_export]
     use super::{
@@ -39,14 +47,25 @@ mod extension_module {
         GroupIndexOutOfBoundsError, HasGroupsError, IncomparableTypesError,
         IncompatibleLengthError, IncompatibleTypeError, IncompatibleTypesError,
         IndexOutOfBoundsError, NoGroupsError, NonexistentColumnError, NumericTypeNotSatisfiedError,
-        PyArray, PyDataFrame, PyExpression, RenameExistingError, SummarizeTypeError,
-        TypeMismatchError, UnknownFunctionError, UnknownVariableError, UnmatchedColumnsError,
-        UnmatchedGroupLevelsError, UnmatchedHeightError,
+        PyArray, PyDataFrame, PyExpression, PyLazyDataFrame, RenameExistingError,
+        SummarizeTypeError, TypeMismatchError, UnknownFunctionError, UnknownVariableError,
+        UnmatchedColumnsError, UnmatchedGroupLevelsError, UnmatchedHeightError,
     };
 
     #[pymodule_export]
     use super::py_function::functions;
 
+    #[pymodule_export]
+    use super::config::{
+        default_streaming, max_threads, set_default_streaming, set_streaming_chunk_size,
+        streaming_chunk_size, thread_pool_size,
+    };
+
+    #[pymodule_export]
+    use super::expression_cache::{
+        clear_compiled_expression_cache, compiled_expression_cache_size,
+    };
+
     #[pymodule_export]
     use super::testing::{
         assert_py_arrays_equal, assert_py_data_frames_equal, diff_py_arrays, diff_py_data_frames,
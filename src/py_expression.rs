@@ -1,232 +1,209 @@
-use std::sync::Arc;
+use std::sync::{Arc, OnceLock};
 
 use pyo3::{prelude::*, IntoPyObjectExt};
 
 use crate::expression::Expression;
+use crate::expression_cache;
 use crate::typed_expression::{DataFrameType, TypedExpression};
 
 #[pyclass(frozen, from_py_object)]
-#[derive(Debug, Clone, PartialEq)]
+#[derive(Debug, Clone)]
 pub struct PyExpression {
     pub expression: Expression,
+    // Identifies the expression in the cache of compiled expressions. It is
+    // computed on first use and shared by every clone, and parsed expressions
+    // are themselves cached, so it is computed once per expression text.
+    id: Arc<OnceLock<u64>>,
+}
+
+impl From<Expression> for PyExpression {
+    fn from(expression: Expression) -> Self {
+        Self {
+            expression,
+            id: Arc::new(OnceLock::new()),
+        }
+    }
+}
+
+impl PartialEq for PyExpression {
+    fn eq(&self, other: &Self) -> bool {
+        self.expression == other.expression
+    }
 }
 
 #[pymethods]
 impl PyExpression {
     #[staticmethod]
     fn null() -> Self {
-        Self {
-            expression: Expression::NullLiteral,
-        }
+        Self::from(Expression::NullLiteral)
     }
 
     #[staticmethod]
     fn boolean(value: bool) -> Self {
-        Self {
-            expression: Expression::BooleanLiteral { value },
-        }
+        Self::from(Expression::BooleanLiteral { value })
     }
 
     #[staticmethod]
     fn integer(value: i64) -> Self {
-        Self {
-            expression: Expression::IntegerLiteral { value },
-        }
+        Self::from(Expression::IntegerLiteral { value })
     }
 
     #[staticmethod]
     fn float(value: f64) -> Self {
-        Self {
-            expression: Expression::FloatLiteral { value },
-        }
+        Self::from(Expression::FloatLiteral { value })
     }
 
     #[staticmethod]
     fn string(value: String) -> Self {
-        Self {
-            expression: Expression::StringLiteral { value },
-        }
+        Self::from(Expression::StringLiteral { value })
     }
 
     #[staticmethod]
     fn variable(name: String) -> Self {
-        Self {
-            expression: Expression::Variable { name },
-        }
+        Self::from(Expression::Variable { name })
     }
 
     #[staticmethod]
     fn call(name: String, arguments: Vec<PyExpression>) -> Self {
-        Self {
-            expression: Expression::Call {
-                name,
-                arguments: arguments
-                    .into_iter()
-                    .map(|e| Arc::new(e.expression))
-                    .collect(),
-            },
-        }
+        Self::from(Expression::Call {
+            name,
+            arguments: arguments
+                .into_iter()
+                .map(|e| Arc::new(e.expression))
+                .collect(),
+        })
     }
 
     fn positive(&self) -> Self {
-        Self {
-            expression: Expression::Positive {
-                content: Arc::new(self.expression.clone()),
-            },
-        }
+        Self::from(Expression::Positive {
+            content: Arc::new(self.expression.clone()),
+        })
     }
 
     fn negative(&self) -> Self {
-        Self {
-            expression: Expression::Negative {
-                content: Arc::new(self.expression.clone()),
-            },
-        }
+        Self::from(Expression::Negative {
+            content: Arc::new(self.expression.clone()),
+        })
     }
     fn add(&self, other: &PyExpression) -> Self {
-        Self {
-            expression: Expression::Add {
-                left: Arc::new(self.expression.clone()),
-                right: Arc::new(other.expression.clone()),
-            },
-        }
+        Self::from(Expression::Add {
+            left: Arc::new(self.expression.clone()),
+            right: Arc::new(other.expression.clone()),
+        })
     }
     fn subtract(&self, other: &PyExpression) -> Self {
-        Self {
-            expression: Expression::Subtract {
-                left: Arc::new(self.expression.clone()),
-                right: Arc::new(other.expression.clone()),
-            },
-        }
+        Self::from(Expression::Subtract {
+            left: Arc::new(self.expression.clone()),
+            right: Arc::new(other.expression.clone()),
+        })
     }
 
     fn multiply(&self, other: &PyExpression) -> Self {
-        Self {
-            expression: Expression::Multiply {
-                left: Arc::new(self.expression.clone()),
-                right: Arc::new(other.expression.clone()),
-            },
-        }
+        Self::from(Expression::Multiply {
+            left: Arc::new(self.expression.clone()),
+            right: Arc::new(other.expression.clone()),
+        })
     }
 
     fn true_divide(&self, other: &PyExpression) -> Self {
-        Self {
-            expression: Expression::TrueDivide {
-                left: Arc::new(self.expression.clone()),
-                right: Arc::new(other.expression.clone()),
-            },
-        }
+        Self::from(Expression::TrueDivide {
+            left: Arc::new(self.expression.clone()),
+            right: Arc::new(other.expression.clone()),
+        })
     }
 
     fn floor_divide(&self, other: &PyExpression) -> Self {
-        Self {
-            expression: Expression::FloorDivide {
-                left: Arc::new(self.expression.clone()),
-                right: Arc::new(other.expression.clone()),
-            },
-        }
+        Self::from(Expression::FloorDivide {
+            left: Arc::new(self.expression.clone()),
+            right: Arc::new(other.expression.clone()),
+        })
     }
 
     fn modulo(&self, other: &PyExpression) -> Self {
-        Self {
-            expression: Expression::Mod {
-                left: Arc::new(self.expression.clone()),
-                right: Arc::new(other.expression.clone()),
-            },
-        }
+        Self::from(Expression::Mod {
+            left: Arc::new(self.expression.clone()),
+            right: Arc::new(other.expression.clone()),
+        })
     }
 
     fn power(&self, other: &PyExpression) -> Self {
-        Self {
-            expression: Expression::Power {
-                left: Arc::new(self.expression.clone()),
-                right: Arc::new(other.expression.clone()),
-            },
-        }
+        Self::from(Expression::Power {
+            left: Arc::new(self.expression.clone()),
+            right: Arc::new(other.expression.clone()),
+        })
     }
 
     fn equal(&self, other: &PyExpression) -> Self {
-        Self {
-            expression: Expression::Equal {
-                left: Arc::new(self.expression.clone()),
-                right: Arc::new(other.expression.clone()),
-            },
-        }
+        Self::from(Expression::Equal {
+            left: Arc::new(self.expression.clone()),
+            right: Arc::new(other.expression.clone()),
+        })
     }
 
     fn not_equal(&self, other: &PyExpression) -> Self {
-        Self {
-            expression: Expression::NotEqual {
-                left: Arc::new(self.expression.clone()),
-                right: Arc::new(other.expression.clone()),
-            },
-        }
+        Self::from(Expression::NotEqual {
+            left: Arc::new(self.expression.clone()),
+            right: Arc::new(other.expression.clone()),
+        })
     }
 
     fn greater_than_or_equal(&self, other: &PyExpression) -> Self {
-        Self {
-            expression: Expression::GreaterThanOrEqual {
-                left: Arc::new(self.expression.clone()),
-                right: Arc::new(other.expression.clone()),
-            },
-        }
+        Self::from(Expression::GreaterThanOrEqual {
+            left: Arc::new(self.expression.clone()),
+            right: Arc::new(other.expression.clone()),
+        })
     }
 
     fn less_than_or_equal(&self, other: &PyExpression) -> Self {
-        Self {
-            expression: Expression::LessThanOrEqual {
-                left: Arc::new(self.expression.clone()),
-                right: Arc::new(other.expression.clone()),
-            },
-        }
+        Self::from(Expression::LessThanOrEqual {
+            left: Arc::new(self.expression.clone()),
+            right: Arc::new(other.expression.clone()),
+        })
     }
 
     fn greater_than(&self, other: &PyExpression) -> Self {
-        Self {
-            expression: Expression::GreaterThan {
-                left: Arc::new(self.expression.clone()),
-                right: Arc::new(other.expression.clone()),
-            },
-        }
+        Self::from(Expression::GreaterThan {
+            left: Arc::new(self.expression.clone()),
+            right: Arc::new(other.expression.clone()),
+        })
     }
 
     fn less_than(&self, other: &PyExpression) -> Self {
-        Self {
-            expression: Expression::LessThan {
-                left: Arc::new(self.expression.clone()),
-                right: Arc::new(other.expression.clone()),
-            },
-        }
+        Self::from(Expression::LessThan {
+            left: Arc::new(self.expression.clone()),
+            right: Arc::new(other.expression.clone()),
+        })
     }
 
     fn not_(&self) -> Self {
-        Self {
-            expression: Expression::Not {
-                content: Arc::new(self.expression.clone()),
-            },
-        }
+        Self::from(Expression::Not {
+            content: Arc::new(self.expression.clone()),
+        })
     }
 
     fn and_(&self, other: &PyExpression) -> Self {
-        Self {
-            expression: Expression::And {
-                left: Arc::new(self.expression.clone()),
-                right: Arc::new(other.expression.clone()),
-            },
-        }
+        Self::from(Expression::And {
+            left: Arc::new(self.expression.clone()),
+            right: Arc::new(other.expression.clone()),
+        })
     }
 
     fn or_(&self, other: &PyExpression) -> Self {
-        Self {
-            expression: Expression::Or {
-                left: Arc::new(self.expression.clone()),
-                right: Arc::new(other.expression.clone()),
-            },
-        }
+        Self::from(Expression::Or {
+            left: Arc::new(self.expression.clone()),
+            right: Arc::new(other.expression.clone()),
+        })
     }
 }
 
 impl PyExpression {
+    /// The same for every expression with the same content
+    pub fn id(&self) -> u64 {
+        *self
+            .id
+            .get_or_init(|| expression_cache::intern(&self.expression))
+    }
+
     pub fn validate(&self, df_type: &DataFrameType, py: Python) -> PyResult<TypedExpression> {
         use crate::error::*;
         use crate::typed_expression::ValidationError;
@@ -1,4 +1,4 @@
-use polars::prelude::AnyValue;
+use polars::prelude::{AnyValue, DataType as PolarsDataType, Series};
 use pyo3::{exceptions::PyTypeError, prelude::*, types::PyNone, Borrowed, IntoPyObjectExt};
 use std::fmt::Display;
 
@@ -122,3 +122,34 @@ impl From<AnyValue<'_>> for PyScalar {
         }
     }
 }
+
+/// Convert every value of a series to a Python object, dispatching on the
+/// data type once rather than going through an `AnyValue` for each value.
+pub fn py_objects_from_series(series: &Series, py: Python) -> PyResult<Vec<Py<PyAny>>> {
+    fn convert<'py, T: IntoPyObject<'py>>(
+        values: impl Iterator<Item = T>,
+        py: Python<'py>,
+    ) -> PyResult<Vec<Py<PyAny>>> {
+        values.map(|value| value.into_py_any(py)).collect()
+    }
+
+    match series.dtype() {
+        PolarsDataType::Null => convert(std::iter::repeat_n(PyScalar::Null, series.len()), py),
+        PolarsDataType::Boolean => convert(series.bool().unwrap().iter(), py),
+        PolarsDataType::Int8 => convert(series.i8().unwrap().iter(), py),
+        PolarsDataType::Int16 => convert(series.i16().unwrap().iter(), py),
+        PolarsDataType::Int32 => convert(series.i32().unwrap().iter(), py),
+        PolarsDataType::Int64 => convert(series.i64().unwrap().iter(), py),
+        PolarsDataType::UInt8 => convert(series.u8().unwrap().iter(), py),
+        PolarsDataType::UInt16 => convert(series.u16().unwrap().iter(), py),
+        PolarsDataType::UInt32 => convert(series.u32().unwrap().iter(), py),
+        PolarsDataType::UInt64 => convert(series.u64().unwrap().iter(), py),
+        PolarsDataType::Float32 => convert(series.f32().unwrap().iter(), py),
+        PolarsDataType::Float64 => convert(series.f64().unwrap().iter(), py),
+        PolarsDataType::String => convert(series.str().unwrap().iter(), py),
+        _ => convert(
+            (0..series.len()).map(|i| PyScalar::from(series.get(i).unwrap())),
+            py,
+        ),
+    }
+}
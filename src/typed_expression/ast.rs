@@ -1,5 +1,6 @@
 use crate::data_type::DataType;
 use crate::typed_expression::{ExpressionType, Function, LiteralType};
+use std::collections::HashSet;
 use std::sync::Arc;
 
 #[derive(Debug, Clone, PartialEq)]
@@ -223,6 +224,88 @@ impl TypedExpression {
         }
     }
 
+    /// True if this expression contains no reductions or other functions that
+    /// look across rows, so it does not need to be evaluated per group.
+    pub fn is_elementwise(&self) -> bool {
+        match self {
+            TypedExpression::NullLiteral
+            | TypedExpression::BooleanLiteral { .. }
+            | TypedExpression::IntegerLiteral { .. }
+            | TypedExpression::FloatLiteral { .. }
+            | TypedExpression::StringLiteral { .. }
+            | TypedExpression::Variable { .. } => true,
+            TypedExpression::Positive { content, .. }
+            | TypedExpression::Negative { content, .. }
+            | TypedExpression::Not { content, .. }
+            | TypedExpression::Cast { content, .. } => content.is_elementwise(),
+            TypedExpression::Add { left, right, .. }
+            | TypedExpression::Subtract { left, right, .. }
+            | TypedExpression::Multiply { left, right, .. }
+            | TypedExpression::TrueDivide { left, right, .. }
+            | TypedExpression::FloorDivide { left, right, .. }
+            | TypedExpression::Mod { left, right, .. }
+            | TypedExpression::Power { left, right, .. }
+            | TypedExpression::Equal { left, right, .. }
+            | TypedExpression::NotEqual { left, right, .. }
+            | TypedExpression::GreaterThanOrEqual { left, right, .. }
+            | TypedExpression::LessThanOrEqual { left, right, .. }
+            | TypedExpression::GreaterThan { left, right, .. }
+            | TypedExpression::LessThan { left, right, .. }
+            | TypedExpression::And { left, right, .. }
+            | TypedExpression::Or { left, right, .. } => {
+                left.is_elementwise() && right.is_elementwise()
+            }
+            TypedExpression::Call { call } => call.is_elementwise(),
+        }
+    }
+
+    /// The names of all columns that this expression reads.
+    pub fn variable_names(&self) -> HashSet<&str> {
+        let mut names = HashSet::new();
+        self.collect_variable_names(&mut names);
+        names
+    }
+
+    fn collect_variable_names<'a>(&'a self, names: &mut HashSet<&'a str>) {
+        match self {
+            TypedExpression::NullLiteral
+            | TypedExpression::BooleanLiteral { .. }
+            | TypedExpression::IntegerLiteral { .. }
+            | TypedExpression::FloatLiteral { .. }
+            | TypedExpression::StringLiteral { .. } => {}
+            TypedExpression::Variable { name, .. } => {
+                names.insert(name.as_str());
+            }
+            TypedExpression::Positive { content, .. }
+            | TypedExpression::Negative { content, .. }
+            | TypedExpression::Not { content, .. }
+            | TypedExpression::Cast { content, .. } => content.collect_variable_names(names),
+            TypedExpression::Add { left, right, .. }
+            | TypedExpression::Subtract { left, right, .. }
+            | TypedExpression::Multiply { left, right, .. }
+            | TypedExpression::TrueDivide { left, right, .. }
+            | TypedExpression::FloorDivide { left, right, .. }
+            | TypedExpression::Mod { left, right, .. }
+            | TypedExpression::Power { left, right, .. }
+            | TypedExpression::Equal { left, right, .. }
+            | TypedExpression::NotEqual { left, right, .. }
+            | TypedExpression::GreaterThanOrEqual { left, right, .. }
+            | TypedExpression::LessThanOrEqual { left, right, .. }
+            | TypedExpression::GreaterThan { left, right, .. }
+            | TypedExpression::LessThan { left, right, .. }
+            | TypedExpression::And { left, right, .. }
+            | TypedExpression::Or { left, right, .. } => {
+                left.collect_variable_names(names);
+                right.collect_variable_names(names);
+            }
+            TypedExpression::Call { call } => {
+                for argument in call.arguments() {
+                    argument.collect_variable_names(names);
+                }
+            }
+        }
+    }
+
     pub fn to_polars(&self) -> polars::prelude::Expr {
         use polars::prelude::*;
 
@@ -1,7 +1,10 @@
-use crate::data_frame::PyDataFrame;
+use crate::data_frame::DUMMY_NAME;
 use crate::data_type::DataType;
 use crate::typed_expression::ExpressionType;
+use polars::prelude::Schema;
+use std::collections::hash_map::DefaultHasher;
 use std::collections::HashMap;
+use std::hash::{Hash, Hasher};
 
 #[derive(Debug, Clone, PartialEq, Eq)]
 pub struct DataFrameType {
@@ -21,15 +24,48 @@ impl DataFrameType {
         }
     }
 
-    pub fn from_data_frame(df: &PyDataFrame) -> Self {
+    pub fn from_schema(schema: &Schema) -> Self {
         let mut columns = HashMap::new();
-        for (name, array) in df.iter_columns() {
-            let dtype = DataType::from(array.polars_column.dtype());
+        for (name, polars_dtype) in schema.iter() {
+            if name.as_str() == DUMMY_NAME {
+                // Skip dummy column
+                continue;
+            }
+            let dtype = DataType::from(polars_dtype);
             columns.insert(name.to_string(), ExpressionType::Array(dtype));
         }
         DataFrameType { columns }
     }
 
+    /// A hash of the column names and types that `from_schema` reads.
+    ///
+    /// Schemas with equal fingerprints produce equal data frame types, so the
+    /// fingerprint can stand in for the type when caching validation.
+    pub fn fingerprint_schema(schema: &Schema) -> u64 {
+        let mut hasher = DefaultHasher::new();
+        for (name, polars_dtype) in schema.iter() {
+            if name.as_str() == DUMMY_NAME {
+                continue;
+            }
+            name.as_str().hash(&mut hasher);
+            DataType::from(polars_dtype).hash(&mut hasher);
+        }
+        hasher.finish()
+    }
+
+    /// The fingerprint of a type after `with_column` is applied to it.
+    pub fn fingerprint_with_column(
+        fingerprint: u64,
+        name: &str,
+        expression_type: ExpressionType,
+    ) -> u64 {
+        let mut hasher = DefaultHasher::new();
+        fingerprint.hash(&mut hasher);
+        name.hash(&mut hasher);
+        expression_type.hash(&mut hasher);
+        hasher.finish()
+    }
+
     pub fn column_expression_type(&self, name: &str) -> Option<ExpressionType> {
         self.columns.get(name).copied()
     }
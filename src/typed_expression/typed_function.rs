@@ -16,6 +16,13 @@ pub trait Function: Debug + Sync + Send {
     fn equals(&self, other: &dyn Function) -> bool;
 
     fn name(&self) -> &'static str;
+
+    /// True if each output row depends only on the same row of the inputs,
+    /// so the function gives the same result with or without grouping.
+    fn is_elementwise(&self) -> bool;
+
+    /// The expressions this function was called with, in order.
+    fn arguments(&self) -> Vec<&TypedExpression>;
 }
 
 impl PartialEq for dyn Function {
@@ -19,3 +19,9 @@ pub fn prepend_dummy_column(df: DataFrame) -> DataFrame {
         .hstack(df.columns())
         .unwrap()
 }
+
+pub fn prepend_dummy_column_lazy(lf: LazyFrame) -> LazyFrame {
+    // The same as prepend_dummy_column, but for a plan that has not run yet.
+    // Selecting all() keeps projection and predicate pushdown working.
+    lf.select([lit(Null {}).alias(DUMMY_NAME), all().as_expr()])
+}
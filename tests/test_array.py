@@ -3,7 +3,7 @@ import math
 import pytest
 
 from tabeline import Array, DataType
-from tabeline.exceptions import IncompatibleElementTypeError
+from tabeline.exceptions import IncompatibleElementTypeError, IncompatibleTypeError
 
 # Skip some types, otherwise there are too many tests
 numeric_types = [
@@ -171,6 +171,57 @@ def test_incompatible_type():
     assert e.value == IncompatibleElementTypeError([str, type(None)], 0, 0)
 
 
+@pytest.mark.parametrize(
+    ("elements", "data_type", "error"),
+    [
+        ([0, [], 2], None, IncompatibleElementTypeError([int, float, type(None)], [], 1)),
+        (
+            [None, {}],
+            None,
+            IncompatibleElementTypeError([bool, int, float, str, type(None)], {}, 1),
+        ),
+        ([True, 1], None, IncompatibleElementTypeError([bool, type(None)], 1, 1)),
+        ([1, 2.5, "a"], None, IncompatibleElementTypeError([int, float, type(None)], "a", 2)),
+        (["a", None, 1.5], None, IncompatibleElementTypeError([str, type(None)], 1.5, 2)),
+        ([None, 0], DataType.Nothing, IncompatibleElementTypeError([type(None)], 0, 1)),
+        ([True, 0], DataType.Boolean, IncompatibleElementTypeError([bool, type(None)], 0, 1)),
+        (
+            [0, 1.5],
+            DataType.Integer8,
+            IncompatibleElementTypeError([int, float, type(None)], 1.5, 1),
+        ),
+        (
+            [0, "a"],
+            DataType.Float32,
+            IncompatibleElementTypeError([int, float, type(None)], "a", 1),
+        ),
+    ],
+)
+def test_incompatible_element_type(elements, data_type, error):
+    with pytest.raises(IncompatibleElementTypeError) as e:
+        _ = Array.from_sequence(elements, data_type=data_type)
+
+    assert e.value == error
+
+
+def test_out_of_range_integer():
+    with pytest.raises(IncompatibleTypeError) as e:
+        _ = Array(0, 300, data_type=DataType.Integer8)
+
+    assert e.value == IncompatibleTypeError(DataType.Integer8, 300, 1)
+
+
+def test_promote_integers_to_floats():
+    array = Array.from_sequence([None, 1, None, 2, 2.5, 3])
+    assert array.data_type == DataType.Float64
+    assert list(array) == [None, 1.0, None, 2.0, 2.5, 3.0]
+
+
+def test_from_sequence_iterable():
+    array = Array.from_sequence(x * 2 for x in range(3))
+    assert array == Array(0, 2, 4)
+
+
 def test_from_sequence():
     array = Array.from_sequence([0, 1, 2])
     assert array == Array(0, 1, 2)
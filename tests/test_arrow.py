@@ -0,0 +1,76 @@
+import pytest
+
+from tabeline import Array, DataFrame, DataType
+
+pa = pytest.importorskip("pyarrow")
+
+
+@pytest.mark.parametrize(
+    "df",
+    [
+        DataFrame(x=[0, 0, 1], y=["a", "b", None], z=[True, False, True]),
+        DataFrame(x=[1.5, None, 2.5]),
+        DataFrame(x=[], y=[]),
+    ],
+)
+def test_arrow_stream_round_trip(df):
+    table = pa.table(df)
+    assert tuple(table.column_names) == df.column_names
+    assert DataFrame.from_arrow(table) == df
+
+
+def test_arrow_record_batch_round_trip():
+    df = DataFrame(x=[0, 1, 2], y=["a", "b", "c"])
+    batch = pa.record_batch(df)
+    assert batch.num_rows == 3
+    assert DataFrame.from_arrow(batch) == df
+
+
+def test_from_arrow_multiple_batches():
+    batch = pa.record_batch({"x": [0, 1], "y": ["a", "b"]})
+    table = pa.Table.from_batches([batch, batch])
+    actual = DataFrame.from_arrow(table)
+    expected = DataFrame(x=[0, 1, 0, 1], y=["a", "b", "a", "b"])
+    assert actual == expected
+
+
+def test_from_arrow_no_batches():
+    schema = pa.schema([("x", pa.int64()), ("y", pa.string())])
+    actual = DataFrame.from_arrow(schema.empty_table())
+    assert actual == DataFrame(x=Array[DataType.Integer64](), y=Array[DataType.String]())
+
+
+def test_from_arrow_not_arrow():
+    with pytest.raises(TypeError):
+        DataFrame.from_arrow([1, 2, 3])
+
+
+def test_arrow_schema():
+    df = DataFrame(x=[0, 1], y=[True, False])
+    schema = pa.schema(df)
+    assert schema.names == ["x", "y"]
+    assert schema.field("x").type == pa.int64()
+    assert schema.field("y").type == pa.bool_()
+
+
+@pytest.mark.parametrize("elements", [[0, 1, 2], [1.5, None], [True, False], ["a", "b"]])
+def test_array_to_arrow(elements):
+    array = Array(*elements)
+    actual = pa.array(array)
+    assert actual.to_pylist() == elements
+
+
+@pytest.mark.parametrize("elements", [[0, 1, 2], [1.5, None], [True, False], ["a", "b"]])
+def test_array_from_arrow(elements):
+    assert Array.from_arrow(pa.array(elements)) == Array(*elements)
+
+
+def test_array_from_arrow_chunked():
+    chunked_array = pa.chunked_array([[0, 1], [2]])
+    assert Array.from_arrow(chunked_array) == Array(0, 1, 2)
+
+
+def test_grouped_to_arrow():
+    df = DataFrame(x=[0, 0, 1], y=[1, 2, 3]).group_by("x")
+    table = pa.table(df)
+    assert table.column_names == ["x", "y"]
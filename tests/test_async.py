@@ -0,0 +1,136 @@
+import asyncio
+import tempfile
+import threading
+from pathlib import Path
+
+import pytest
+
+from tabeline import DataFrame, read_csv_async, read_ipc_async, read_parquet_async
+
+
+def test_csv_async_roundtrip():
+    df = DataFrame(x=[0, 0, 1], y=["a", "b", "b"], z=[True, False, True])
+
+    async def roundtrip(path):
+        await df.write_csv_async(path, compression="gzip")
+        return await read_csv_async(path, columns=["x", "y"])
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory).joinpath("temp.csv.gz")
+        actual = asyncio.run(roundtrip(path))
+
+    assert actual == df.select("x", "y")
+
+
+def test_parquet_async_roundtrip():
+    df = DataFrame(x=[0, 1, 2, 3], y=[1.5, None, 3.5, 4.5])
+
+    async def roundtrip(path):
+        await df.write_parquet_async(path)
+        return await read_parquet_async(path, predicate="x >= 2")
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory).joinpath("temp.parquet")
+        actual = asyncio.run(roundtrip(path))
+
+    assert actual == df.filter("x >= 2")
+
+
+def test_ipc_async_roundtrip():
+    df = DataFrame(x=[0, 1, 2], y=["a", None, "c"])
+
+    async def roundtrip(path):
+        await df.write_ipc_async(path)
+        return await read_ipc_async(path, memory_map=False)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory).joinpath("temp.arrow")
+        actual = asyncio.run(roundtrip(path))
+
+    assert actual == df
+
+
+def test_collect_async():
+    left = DataFrame(id=[0, 1, 2], x=[1, 2, 3])
+    right = DataFrame(id=[0, 0, 2], y=["a", "b", "c"])
+    lazy = left.lazy().inner_join(right, by=["id"])
+
+    actual = asyncio.run(lazy.collect_async())
+
+    assert actual == lazy.collect()
+
+
+def test_read_csv_async_missing_file():
+    with pytest.raises(FileNotFoundError):
+        asyncio.run(read_csv_async("does_not_exist.csv"))
+
+
+def test_event_loop_not_blocked(monkeypatch):
+    lazy = DataFrame(x=list(range(1_000))).lazy().mutate(y="x * 2").summarize(total="sum(y)")
+    expected = lazy.collect()
+
+    # The collection cannot proceed until the event loop has run a callback, so it would time out
+    # if it were blocking the loop
+    loop_ran = threading.Event()
+    collect = lazy.collect
+
+    def gated_collect(**kwargs):
+        assert loop_ran.wait(timeout=10)
+        return collect(**kwargs)
+
+    monkeypatch.setattr(lazy, "collect", gated_collect)
+
+    async def main():
+        asyncio.get_running_loop().call_soon(loop_ran.set)
+        return await lazy.collect_async()
+
+    actual = asyncio.run(main())
+
+    assert actual == expected
+
+
+def test_collect_async_cancelled_before_start(monkeypatch):
+    lazy = DataFrame(x=list(range(1_000))).lazy().mutate(y="x + 1")
+    calls = []
+    monkeypatch.setattr(lazy, "collect", lambda **kwargs: calls.append(kwargs))
+
+    async def main():
+        task = asyncio.create_task(lazy.collect_async())
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(main())
+
+    assert calls == []
+
+
+def test_collect_async_cancelled_while_running(monkeypatch):
+    lazy = DataFrame(x=list(range(1_000))).lazy().mutate(y="x + 1")
+    started = threading.Event()
+    release = threading.Event()
+    results = []
+    collect = lazy.collect
+
+    def gated_collect(**kwargs):
+        started.set()
+        assert release.wait(timeout=10)
+        results.append(collect(**kwargs))
+        return results[-1]
+
+    monkeypatch.setattr(lazy, "collect", gated_collect)
+
+    async def main():
+        task = asyncio.create_task(lazy.collect_async())
+        assert await asyncio.to_thread(started.wait, 10)
+        task.cancel()
+        release.set()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        return task
+
+    task = asyncio.run(main())
+
+    # The collection that had started ran to completion, but its result was discarded
+    assert len(results) == 1
+    assert task.cancelled()
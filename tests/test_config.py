@@ -0,0 +1,75 @@
+import os
+
+import pytest
+
+from tabeline import DataFrame, config
+
+
+def test_get():
+    settings = config.get()
+    assert settings.max_threads >= 1
+    assert settings.streaming is False
+
+
+def test_update_max_threads_to_current():
+    max_threads = config.get().max_threads
+    config.update(max_threads=max_threads)
+    assert config.get().max_threads == max_threads
+
+
+def test_update_max_threads_after_start():
+    # The pool has already started by the time any test runs a query
+    _ = DataFrame(x=[0, 1, 2]).filter("x > 0")
+    max_threads = config.get().max_threads
+    previous = os.environ.get("POLARS_MAX_THREADS")
+
+    with pytest.raises(RuntimeError):
+        config.update(max_threads=max_threads + 1)
+
+    assert config.get().max_threads == max_threads
+    assert os.environ.get("POLARS_MAX_THREADS") == previous
+
+
+@pytest.mark.parametrize("settings", [{"max_threads": 0}, {"streaming_chunk_size": 0}])
+def test_update_invalid(settings):
+    with pytest.raises(ValueError, match="at least 1"):
+        config.update(**settings)
+
+
+def test_context_streaming():
+    df = DataFrame(g=[0, 0, 1], x=[1, 2, 3])
+    expected = df.group_by("g").summarize(total="sum(x)")
+
+    with config.context(streaming=True) as settings:
+        assert settings.streaming is True
+        assert config.get().streaming is True
+        actual = df.group_by("g").summarize(total="sum(x)")
+        lazy_actual = df.lazy().group_by("g").summarize(total="sum(x)").collect()
+
+    assert config.get().streaming is False
+    assert actual == expected
+    assert lazy_actual == expected
+
+
+def test_context_restores_after_error():
+    with pytest.raises(KeyError), config.context(streaming=True):
+        raise KeyError("x")
+
+    assert config.get().streaming is False
+
+
+def test_collect_streaming_overrides_config():
+    df = DataFrame(x=[3, 1, 2])
+    with config.context(streaming=True):
+        actual = df.lazy().sort("x").collect(streaming=False)
+    assert actual == DataFrame(x=[1, 2, 3])
+
+
+def test_update_streaming_chunk_size_after_streaming():
+    _ = DataFrame(x=[0, 1, 2]).lazy().collect(streaming=True)
+    chunk_size = config.get().streaming_chunk_size
+
+    with pytest.raises(RuntimeError):
+        config.update(streaming_chunk_size=(chunk_size or 100_000) + 1)
+
+    assert config.get().streaming_chunk_size == chunk_size
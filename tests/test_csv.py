@@ -3,7 +3,7 @@ from pathlib import Path
 
 import pytest
 
-from tabeline import DataFrame
+from tabeline import Array, DataFrame, DataType, scan_csv
 
 
 @pytest.mark.parametrize(
@@ -19,3 +19,109 @@ def test_csv_roundtrip(df):
         df.write_csv(path)
         actual = DataFrame.read_csv(path)
     assert actual == df
+
+
+def test_scan_csv():
+    df = DataFrame(id=[0, 1, 2, 3], x=[1.5, 2.5, 3.5, 4.5], y=["a", "b", "c", "d"])
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory).joinpath("temp.csv")
+        df.write_csv(path)
+
+        lazy = scan_csv(path)
+        assert lazy.column_names == ("id", "x", "y")
+
+        pipeline = lazy.filter("id >= 2").select("id", "y")
+        expected = df.filter("id >= 2").select("id", "y")
+
+        assert pipeline.collect() == expected
+        assert pipeline.collect(streaming=True) == expected
+
+
+def test_read_csv_options():
+    df = DataFrame(id=[0, 1, 2, 3], x=[1.5, 2.5, 3.5, 4.5], y=["a", "b", "c", "d"])
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory).joinpath("temp.csv")
+        df.write_csv(path)
+
+        actual = DataFrame.read_csv(
+            path,
+            columns=["y", "id"],
+            dtypes={"id": DataType.Integer32},
+            n_rows=2,
+            n_threads=2,
+        )
+
+    expected = DataFrame(id=Array[DataType.Integer32](0, 1), y=["a", "b"])
+    assert actual == expected
+
+
+def test_read_csv_infer_whole_file():
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory).joinpath("temp.csv")
+        path.write_text("x\n1\n2\n3.5\n")
+
+        actual = DataFrame.read_csv(path, infer_schema_length=None)
+
+    assert actual == DataFrame(x=[1.0, 2.0, 3.5])
+
+
+def test_read_csv_missing_file():
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory).joinpath("missing.csv")
+        with pytest.raises(FileNotFoundError):
+            DataFrame.read_csv(path)
+
+
+def test_scan_csv_missing_file():
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory).joinpath("missing.csv")
+        with pytest.raises(FileNotFoundError):
+            scan_csv(path)
+
+
+def test_read_csv_unparsable_dtype():
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory).joinpath("temp.csv")
+        path.write_text("x\na\n")
+        with pytest.raises(ValueError):
+            DataFrame.read_csv(path, dtypes={"x": DataType.Integer64})
+
+
+@pytest.mark.parametrize(
+    ("compression", "magic"), [("gzip", b"\x1f\x8b"), ("zstd", b"\x28\xb5\x2f\xfd")]
+)
+@pytest.mark.parametrize("compression_level", [None, 1])
+def test_csv_compressed_roundtrip(compression, magic, compression_level):
+    df = DataFrame(x=list(range(100)), y=["a", "b"] * 50)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory).joinpath("temp.csv")
+        df.write_csv(
+            path,
+            compression=compression,
+            compression_level=compression_level,
+            batch_size=7,
+            n_threads=2,
+        )
+        assert path.read_bytes().startswith(magic)
+        actual = DataFrame.read_csv(path)
+    assert actual == df
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        {"compression": "bogus"},
+        {"compression": "gzip", "compression_level": 10},
+        {"compression_level": 1},
+        {"batch_size": 0},
+    ],
+)
+def test_write_csv_invalid_options(options):
+    df = DataFrame(x=[0, 1])
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory).joinpath("temp.csv")
+        with pytest.raises(ValueError):
+            df.write_csv(path, **options)
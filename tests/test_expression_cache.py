@@ -0,0 +1,126 @@
+import pytest
+from parsita import ParseError
+
+from tabeline import (
+    DataFrame,
+    clear_expression_cache,
+    expression_cache_info,
+    set_expression_cache_size,
+)
+from tabeline._expression._cache import DEFAULT_EXPRESSION_CACHE_SIZE, compile_expression
+from tabeline._tabeline import compiled_expression_cache_size
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    clear_expression_cache()
+    yield
+    set_expression_cache_size(DEFAULT_EXPRESSION_CACHE_SIZE)
+
+
+def test_expression_cache_hits():
+    df = DataFrame(t=[0, 1, 2, 3])
+    for _ in range(3):
+        _ = df.filter("t >= 1 & t <= 2")
+
+    info = expression_cache_info()
+    assert info.misses == 1
+    assert info.hits == 2
+    assert info.currsize == 1
+
+
+def test_expression_cache_returns_same_expression():
+    assert compile_expression("x + 1") is compile_expression("x + 1")
+
+
+def test_expression_cache_shared_by_verbs():
+    df = DataFrame(x=[0, 1, 2])
+    _ = df.mutate(y="x + 1")
+    _ = df.lazy().mutate(z="x + 1").collect()
+
+    info = expression_cache_info()
+    assert info.misses == 1
+    assert info.hits == 1
+
+
+def test_clear_expression_cache():
+    _ = compile_expression("x + 1")
+    clear_expression_cache()
+
+    info = expression_cache_info()
+    assert info.hits == 0
+    assert info.misses == 0
+    assert info.currsize == 0
+
+
+def test_clear_expression_cache_clears_compiled_expressions():
+    _ = DataFrame(x=[0, 1, 2]).mutate(y="x + 1")
+    assert compiled_expression_cache_size() > 0
+
+    clear_expression_cache()
+    assert compiled_expression_cache_size() == 0
+
+
+def test_compiled_expression_cache_evicts_half_when_full():
+    lazy = DataFrame(x=[0, 1, 2]).lazy()
+    for i in range(4096):
+        _ = lazy.filter(f"x != {i}")
+    assert compiled_expression_cache_size() == 4096
+
+    _ = lazy.filter("x != -1")
+    assert 1 < compiled_expression_cache_size() <= 4096 // 2 + 1
+
+
+def test_compiled_expression_reparsed_is_reused():
+    df = DataFrame(x=[0, 1, 2])
+    _ = df.mutate(y="x + 1")
+    size = compiled_expression_cache_size()
+
+    # A new parse of the same text gets the same key
+    set_expression_cache_size(0)
+    _ = df.mutate(y="x + 1")
+    assert compiled_expression_cache_size() == size
+
+
+def test_set_expression_cache_size():
+    set_expression_cache_size(2)
+    for text in ["x", "y", "z"]:
+        _ = compile_expression(text)
+
+    info = expression_cache_info()
+    assert info.maxsize == 2
+    assert info.currsize == 2
+
+
+def test_expression_cache_does_not_cache_errors():
+    with pytest.raises(ParseError):
+        _ = compile_expression("x +")
+
+    assert expression_cache_info().currsize == 0
+
+
+def test_compiled_expression_depends_on_schema():
+    integers = DataFrame(x=[0, 1, 2])
+    floats = DataFrame(x=[0.5, 1.5, 2.5])
+
+    assert integers.mutate(y="x + 1") == DataFrame(x=[0, 1, 2], y=[1, 2, 3])
+    assert floats.mutate(y="x + 1") == DataFrame(x=[0.5, 1.5, 2.5], y=[1.5, 2.5, 3.5])
+    assert integers.mutate(y="x + 1") == DataFrame(x=[0, 1, 2], y=[1, 2, 3])
+
+
+def test_compiled_expression_depends_on_groups():
+    df = DataFrame(g=[0, 0, 1], x=[1, 2, 4])
+
+    assert df.mutate(y="sum(x)") == DataFrame(g=[0, 0, 1], x=[1, 2, 4], y=[7, 7, 7])
+    assert df.group_by("g").mutate(y="sum(x)") == DataFrame(
+        g=[0, 0, 1], x=[1, 2, 4], y=[3, 3, 4]
+    ).group_by("g")
+
+
+def test_compiled_expression_depends_on_earlier_mutators():
+    df = DataFrame(x=[0, 1, 2])
+
+    assert df.mutate(y="x", z="y + 1") == DataFrame(x=[0, 1, 2], y=[0, 1, 2], z=[1, 2, 3])
+    assert df.mutate(y="x * 0.5", z="y + 1") == DataFrame(
+        x=[0, 1, 2], y=[0.0, 0.5, 1.0], z=[1.0, 1.5, 2.0]
+    )
@@ -1,6 +1,7 @@
 import pytest
 
 from tabeline import Array, DataFrame
+from tabeline.exceptions import IncompatibleLengthError
 
 
 @pytest.mark.parametrize(
@@ -42,3 +43,23 @@ def test_from_dict_to_dict_empty():
 def test_to_dict():
     df = DataFrame(x=[0, 1, 2], y=["a", "b", "c"])
     assert df.to_dict() == {"x": Array(0, 1, 2), "y": Array("a", "b", "c")}
+
+
+def test_from_dict_mixed_sources():
+    data = {"x": [0, 1, 2], "y": Array(0.5, 1.5, 2.5), "z": (s for s in ["a", "b", "c"])}
+    df = DataFrame(x=[0, 1, 2], y=[0.5, 1.5, 2.5], z=["a", "b", "c"])
+    assert DataFrame.from_dict(data) == df
+
+
+def test_from_dict_incompatible_length():
+    with pytest.raises(IncompatibleLengthError) as e:
+        _ = DataFrame.from_dict({"x": [0, 1, 2], "y": Array(0, 1), "z": [0]})
+
+    assert e.value == IncompatibleLengthError(3, 2, "y")
+
+
+def test_from_dict_many_columns():
+    data = {f"x{i}": list(range(i, i + 100)) for i in range(200)}
+    df = DataFrame.from_dict(data)
+    assert df.column_names == tuple(data)
+    assert df.to_dict() == {name: Array(*elements) for name, elements in data.items()}
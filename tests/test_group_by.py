@@ -39,3 +39,47 @@ def test_group_by_sort():
         x=[0, 1, 1, 1, 2], y=[1.0, 2.1, 3.4, 2.1, 0.0], z=[2, 1, 4, 5, 3]
     ).group_by("x")
     assert actual == expected
+
+
+@pytest.mark.parametrize(
+    "verb",
+    [
+        lambda df: df.filter("y > 1"),
+        lambda df: df.sort("y"),
+        lambda df: df.mutate(z="sum(y)"),
+        lambda df: df.transmute(z="sum(y)"),
+        lambda df: df.summarize(z="sum(y)"),
+        lambda df: df.spread("y", "w"),
+    ],
+)
+def test_grouped_verbs_build_group_index(verb):
+    df = DataFrame(x=[0, 0, 1, 1], y=[1, 2, 3, 4], w=[5, 6, 7, 8]).group_by("x")
+    assert not df.has_group_index
+
+    _ = verb(df)
+    assert df.has_group_index
+
+
+def test_grouped_verbs_keep_column_named_like_group_ids():
+    df = DataFrame(_group_id=[5, 6, 7, 8], g=[0, 0, 1, 1], x=[1, 2, 3, 4]).group_by("g")
+
+    assert df.mutate(y="sum(_group_id)") == DataFrame(
+        _group_id=[5, 6, 7, 8], g=[0, 0, 1, 1], x=[1, 2, 3, 4], y=[11, 11, 15, 15]
+    ).group_by("g")
+    assert df.filter("_group_id == max(_group_id)") == DataFrame(
+        _group_id=[6, 8], g=[0, 1], x=[2, 4]
+    ).group_by("g")
+    assert df.summarize(total="sum(_group_id)") == DataFrame(g=[0, 1], total=[11, 15])
+
+
+def test_grouped_verbs_create_column_named_like_group_ids():
+    df = DataFrame(g=[0, 0, 1, 1], x=[1, 2, 3, 4]).group_by("g")
+
+    assert df.mutate(_group_id="x * 10", y="sum(_group_id)") == DataFrame(
+        g=[0, 0, 1, 1], x=[1, 2, 3, 4], _group_id=[10, 20, 30, 40], y=[30, 30, 70, 70]
+    ).group_by("g")
+    assert df.summarize(_group_id="sum(x)") == DataFrame(g=[0, 1], _group_id=[3, 7])
+
+    spread = DataFrame(g=[0, 0, 1, 1], k=["_group_id", "b", "_group_id", "b"], v=[1, 2, 3, 4])
+    assert spread.group_by("g").spread("k", "v") == DataFrame(g=[0, 1], _group_id=[1, 3], b=[2, 4])
+
@@ -1,4 +1,7 @@
+import pytest
+
 from tabeline import DataFrame
+from tabeline.exceptions import GroupColumnError, NonexistentColumnError, UnmatchedGroupLevelsError
 
 
 def test_inner_join():
@@ -32,3 +35,80 @@ def test_match_different_names():
     expected = DataFrame(x=[0, 1, 2, 3], y=["a", "b", "c", "d"], z=["d", "c", "b", "a"])
 
     assert actual == expected
+
+
+def test_inner_join_grouped():
+    df1 = DataFrame(g=[0, 0, 1, 1], x=[0, 1, 0, 1], y=["a", "b", "c", "d"]).group_by("g")
+    df2 = DataFrame(g=[1, 0, 1, 0], x=[0, 0, 1, 2], z=["e", "f", "g", "h"])
+
+    actual = df1.inner_join(df2, by=["x"])
+
+    expected = DataFrame(
+        g=[0, 1, 1], x=[0, 0, 1], y=["a", "c", "d"], z=["f", "e", "g"]
+    ).group_by("g")
+
+    assert actual == expected
+
+
+def test_inner_join_grouped_natural():
+    df1 = DataFrame(g=[0, 0, 1], x=[0, 1, 0], y=["a", "b", "c"]).group_by("g")
+    df2 = DataFrame(g=[1, 0], x=[0, 1], z=["d", "e"]).group_by("g")
+
+    actual = df1.inner_join(df2)
+
+    expected = DataFrame(g=[0, 1], x=[1, 0], y=["b", "c"], z=["e", "d"]).group_by("g")
+
+    assert actual == expected
+
+
+def test_inner_join_grouped_matches_ungrouped():
+    df1 = DataFrame(g=[0, 0, 1, 1], h=[0, 1, 0, 1], x=[0, 1, 0, 1], y=[1, 2, 3, 4])
+    df2 = DataFrame(g=[1, 0, 1, 0], h=[0, 1, 0, 1], x=[0, 1, 0, 1], z=[5, 6, 7, 8])
+
+    actual = df1.group_by("g").group_by("h").inner_join(df2, by=["x"])
+
+    expected = df1.inner_join(df2, by=["g", "h", "x"]).group_by("g").group_by("h")
+
+    assert actual == expected
+
+
+def test_inner_join_grouped_without_keys():
+    df1 = DataFrame(g=[0, 1], x=[1, 2]).group_by("g")
+    df2 = DataFrame(g=[0, 0, 1], y=[3, 4, 5])
+
+    actual = df1.inner_join(df2, by=[])
+
+    expected = DataFrame(g=[0, 0, 1], x=[1, 1, 2], y=[3, 4, 5]).group_by("g")
+
+    assert actual == expected
+
+
+def test_inner_join_grouped_key_is_group_column():
+    df1 = DataFrame(g=[0, 1], x=[1, 2]).group_by("g")
+    df2 = DataFrame(g=[0, 1], x=[1, 2])
+
+    with pytest.raises(GroupColumnError):
+        df1.inner_join(df2, by=["g", "x"])
+
+
+def test_inner_join_grouped_missing_group_column():
+    df1 = DataFrame(g=[0, 1], x=[1, 2]).group_by("g")
+    df2 = DataFrame(x=[1, 2], y=[3, 4])
+
+    with pytest.raises(NonexistentColumnError):
+        df1.inner_join(df2, by=["x"])
+
+
+@pytest.mark.parametrize(
+    ("df1", "df2"),
+    [
+        (
+            DataFrame(g=[0], h=[0], x=[1]).group_by("g"),
+            DataFrame(g=[0], h=[0], x=[1]).group_by("h"),
+        ),
+        (DataFrame(g=[0], x=[1]), DataFrame(g=[0], x=[1]).group_by("g")),
+    ],
+)
+def test_inner_join_unmatched_group_levels(df1, df2):
+    with pytest.raises(UnmatchedGroupLevelsError):
+        df1.inner_join(df2, by=["x"])
@@ -0,0 +1,40 @@
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from tabeline import DataFrame
+from tabeline.exceptions import HasGroupsError
+
+
+@pytest.mark.parametrize(
+    "df",
+    [
+        DataFrame(x=[0, 0, 1], y=["a", "b", "b"], z=[True, False, True]),
+        DataFrame(x=[1.5, None, 3.5], y=[None, "b", None]),
+        DataFrame(x=[], y=[]),
+    ],
+)
+@pytest.mark.parametrize("memory_map", [True, False])
+def test_ipc_roundtrip(df, memory_map):
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory).joinpath("temp.arrow")
+        df.write_ipc(path)
+        actual = DataFrame.read_ipc(path, memory_map=memory_map)
+        assert actual == df
+        del actual
+
+
+def test_read_ipc_missing_file():
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory).joinpath("missing.arrow")
+        with pytest.raises(FileNotFoundError):
+            DataFrame.read_ipc(path)
+
+
+def test_write_ipc_grouped():
+    df = DataFrame(x=[0, 1]).group_by("x")
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory).joinpath("temp.arrow")
+        with pytest.raises(HasGroupsError):
+            df.write_ipc(path)
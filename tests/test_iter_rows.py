@@ -0,0 +1,49 @@
+import pytest
+
+from tabeline import Array, DataFrame, concatenate_rows
+
+
+@pytest.mark.parametrize("buffer_size", [1, 2, 512])
+def test_iter_rows(buffer_size):
+    df = DataFrame(x=[0, 1, None], y=[0.5, None, 2.5], z=["a", "b", None], w=[True, None, False])
+
+    actual = list(df.iter_rows(buffer_size=buffer_size))
+
+    assert actual == [(0, 0.5, "a", True), (1, None, "b", None), (None, 2.5, None, False)]
+
+
+def test_iter_rows_named():
+    df = DataFrame(x=[0, 1], y=["a", "b"]).group_by("x")
+
+    actual = list(df.iter_rows(named=True, buffer_size=1))
+
+    assert actual == [{"x": 0, "y": "a"}, {"x": 1, "y": "b"}]
+
+
+@pytest.mark.parametrize(
+    "df", [DataFrame(), DataFrame.columnless(height=2), DataFrame(x=[], y=[])]
+)
+def test_iter_rows_empty(df):
+    assert list(df.iter_rows()) == [()] * df.height
+    assert list(df.iter_rows(named=True)) == [{}] * df.height
+
+
+def test_iter_rows_invalid_buffer_size():
+    with pytest.raises(ValueError):
+        DataFrame(x=[0]).iter_rows(buffer_size=0)
+
+
+def test_iter_chunked_array():
+    df = concatenate_rows(DataFrame(x=list(range(5000))), DataFrame(x=[None, 5001]))
+
+    actual = list(df[:, "x"])
+
+    assert actual == [*range(5000), None, 5001]
+    assert [type(value) for value in actual[:2]] == [int, int]
+
+
+@pytest.mark.parametrize(
+    "array", [Array(True, None), Array(0.5, None), Array("a", None), Array(None, None)]
+)
+def test_iter_array_types(array):
+    assert list(array) == [array[0], array[1]]
@@ -0,0 +1,115 @@
+import pytest
+
+from tabeline import DataFrame, LazyDataFrame
+from tabeline.exceptions import GroupColumnError, UnknownVariableError
+
+
+def test_lazy_collect_roundtrip():
+    df = DataFrame(x=[0, 0, 1], y=["a", "b", "b"], z=[True, False, True])
+    actual = df.lazy().collect()
+    assert actual == df
+
+
+def test_lazy_collect_columnless():
+    df = DataFrame.columnless(height=4)
+    actual = df.lazy().collect()
+    assert actual == df
+
+
+def test_lazy_pipeline():
+    df = DataFrame(id=[0, 0, 1, 1, 2], t=[0, 1, 0, 1, 0], y=[1.0, 2.0, 3.0, 4.0, 5.0])
+
+    def pipeline(df):
+        return (
+            df.filter("t >= 0")
+            .mutate(z="y * 2")
+            .group_by("id")
+            .mutate(w="z - mean(z)")
+            .summarize(total="sum(w)", count="n()")
+            .sort("total")
+        )
+
+    lazy = pipeline(df.lazy())
+    assert isinstance(lazy, LazyDataFrame)
+    assert lazy.collect() == pipeline(df)
+
+
+def test_lazy_tracks_schema():
+    lazy = DataFrame(x=[0, 1], y=[2, 3]).lazy().mutate(z="x + y").deselect("x")
+    assert lazy.column_names == ("y", "z")
+    assert lazy.width == 2
+
+
+def test_lazy_tracks_group_levels():
+    lazy = DataFrame(x=[0, 1], y=[2, 3]).lazy().group_by("x").group_by("y")
+    assert lazy.group_levels == (("x",), ("y",))
+    assert lazy.ungroup().group_levels == (("x",),)
+    assert lazy.collect().group_levels == (("x",), ("y",))
+
+
+def test_lazy_validates_eagerly():
+    lazy = DataFrame(x=[0, 1]).lazy().mutate(y="x + 1")
+    with pytest.raises(UnknownVariableError):
+        lazy.filter("z > 0")
+
+
+def test_lazy_validates_group_columns():
+    lazy = DataFrame(x=[0, 1], y=[2, 3]).lazy().group_by("x")
+    with pytest.raises(GroupColumnError):
+        lazy.mutate(x="y")
+
+
+@pytest.mark.parametrize("join", ["inner_join", "left_join", "outer_join"])
+def test_lazy_join(join):
+    left = DataFrame(id=[0, 1, 2], x=[1, 2, 3])
+    right = DataFrame(id=[1, 2, 3], y=["a", "b", "c"])
+    expected = getattr(left, join)(right)
+
+    assert getattr(left.lazy(), join)(right).collect() == expected
+    assert getattr(left.lazy(), join)(right.lazy()).collect() == expected
+
+
+def test_lazy_reshape():
+    df = DataFrame(id=[0, 0, 1, 1], key=["a", "b", "a", "b"], value=[1, 2, 3, 4])
+    expected = df.group_by("id").spread("key", "value").gather("key", "value", "a", "b")
+    actual = df.lazy().group_by("id").spread("key", "value").gather("key", "value", "a", "b")
+    assert actual.collect() == expected
+
+
+def test_lazy_explain():
+    lazy = DataFrame(x=[0, 1, 2], y=[3, 4, 5]).lazy().mutate(z="x + y").filter("x > 0")
+
+    for optimized in [True, False]:
+        plan = lazy.explain(optimized=optimized)
+        assert isinstance(plan, str)
+        assert "FILTER" in plan
+
+
+def test_lazy_explain_physical():
+    lazy = DataFrame(x=[0, 1, 2], y=[3, 4, 5]).lazy().mutate(z="x + y").filter("x > 0")
+
+    for optimized in [True, False]:
+        plan = lazy.explain(optimized=optimized, physical=True)
+        assert isinstance(plan, str)
+        assert "digraph" in plan
+        assert plan != lazy.explain(optimized=optimized)
+
+
+def test_lazy_profile():
+    df = DataFrame(x=[0, 1, 2], y=[3, 4, 5])
+    lazy = df.lazy().mutate(z="x + y").filter("x > 0")
+
+    result, timings = lazy.profile()
+    assert result == lazy.collect()
+    assert timings.column_names == ("node", "start", "end")
+    assert timings.height >= 1
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_lazy_profile_engine(streaming):
+    df = DataFrame(x=[0, 1, 2], y=[3, 4, 5])
+    lazy = df.lazy().mutate(z="x + y").filter("x > 0")
+
+    result, timings = lazy.profile(streaming=streaming)
+    assert result == lazy.collect(streaming=streaming)
+    assert timings.height >= 1
@@ -34,3 +34,16 @@ def test_match_different_names():
     expected = DataFrame(x=[0, 1, 2, 3], y=["a", "b", "c", "d"], z=["d", "c", "b", "a"])
 
     assert actual == expected
+
+
+def test_left_join_grouped():
+    df1 = DataFrame(g=[0, 0, 1, 1], x=[0, 1, 0, 1], y=["a", "b", "c", "d"]).group_by("g")
+    df2 = DataFrame(g=[1, 0, 1], x=[0, 0, 1], z=["e", "f", "g"])
+
+    actual = df1.left_join(df2, by=["x"])
+
+    expected = DataFrame(
+        g=[0, 0, 1, 1], x=[0, 1, 0, 1], y=["a", "b", "c", "d"], z=["f", None, "e", "g"]
+    ).group_by("g")
+
+    assert actual == expected
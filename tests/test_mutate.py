@@ -60,6 +60,33 @@ def test_mutate_reference_previous_mutator_grouped():
     assert actual == expected
 
 
+def test_mutate_reads_before_overwrite():
+    df = DataFrame(x=[0, 0, 1])
+    actual = df.mutate(y="x", x="x + 1", z="x", w="y + z")
+    expected = DataFrame(x=[1, 1, 2], y=[0, 0, 1], z=[1, 1, 2], w=[1, 1, 3])
+    assert actual == expected
+
+
+def test_mutate_many_independent():
+    df = DataFrame(x=[0, 1, 2])
+    actual = df.mutate(**{f"x{i}": f"x + {i}" for i in range(50)})
+    expected = DataFrame(x=[0, 1, 2], **{f"x{i}": [i, i + 1, i + 2] for i in range(50)})
+    assert actual == expected
+
+
+def test_mutate_elementwise_and_reduction_grouped():
+    df = DataFrame(g=[0, 0, 1, 1], x=[1, 2, 3, 5]).group_by("g")
+    actual = df.mutate(y="x * 2 + 1", z="x - mean(x)", w="if_else(x > 2, y, -x)")
+    expected = DataFrame(
+        g=[0, 0, 1, 1],
+        x=[1, 2, 3, 5],
+        y=[3, 5, 7, 11],
+        z=[-0.5, 0.5, -1.0, 1.0],
+        w=[-1, -2, 7, 11],
+    ).group_by("g")
+    assert actual == expected
+
+
 def test_mutate_broadcast_scalar():
     df = DataFrame(x=[0, 0, 1])
     actual = df.mutate(max_x="max(x)")
@@ -0,0 +1,121 @@
+import pytest
+
+from tabeline import Array, DataFrame, DataType
+
+np = pytest.importorskip("numpy")
+
+
+@pytest.mark.parametrize(
+    ("data_type", "numpy_dtype"),
+    [
+        (DataType.Integer8, np.int8),
+        (DataType.Integer16, np.int16),
+        (DataType.Integer32, np.int32),
+        (DataType.Integer64, np.int64),
+        (DataType.Whole8, np.uint8),
+        (DataType.Whole16, np.uint16),
+        (DataType.Whole32, np.uint32),
+        (DataType.Whole64, np.uint64),
+        (DataType.Float32, np.float32),
+        (DataType.Float64, np.float64),
+    ],
+)
+def test_to_numpy_zero_copy(data_type, numpy_dtype):
+    array = Array[data_type](1, 2, 3)
+
+    actual = array.to_numpy(copy=False)
+
+    assert actual.dtype == numpy_dtype
+    assert actual.tolist() == [1, 2, 3]
+    assert not actual.flags.writeable
+    assert np.shares_memory(actual, array.to_numpy())
+
+
+def test_to_numpy_slice_zero_copy():
+    array = Array(0, 1, 2, 3, 4)[1:4]
+    actual = array.to_numpy(copy=False)
+    assert actual.tolist() == [1, 2, 3]
+
+
+def test_to_numpy_copy():
+    array = Array(1.5, 2.5)
+
+    actual = array.to_numpy(copy=True)
+    actual[0] = 0.0
+
+    assert not np.shares_memory(actual, array.to_numpy())
+    assert array == Array(1.5, 2.5)
+
+
+def test_to_numpy_boolean():
+    array = Array(True, False, True)
+    actual = array.to_numpy()
+    assert actual.dtype == np.bool_
+    assert actual.tolist() == [True, False, True]
+
+    with pytest.raises(ValueError):
+        array.to_numpy(copy=False)
+
+
+@pytest.mark.parametrize(
+    "array",
+    [Array(1, None, 3), Array("a", "b"), Array(None, None)],
+)
+def test_to_numpy_requires_copy(array):
+    assert len(array.to_numpy()) == len(array)
+
+    with pytest.raises(ValueError):
+        array.to_numpy(copy=False)
+
+
+def test_to_numpy_empty():
+    actual = Array[DataType.Float64]().to_numpy(copy=False)
+    assert actual.dtype == np.float64
+    assert len(actual) == 0
+
+
+@pytest.mark.parametrize(
+    ("numpy_dtype", "data_type"),
+    [
+        (np.bool_, DataType.Boolean),
+        (np.int8, DataType.Integer8),
+        (np.int16, DataType.Integer16),
+        (np.int32, DataType.Integer32),
+        (np.int64, DataType.Integer64),
+        (np.uint8, DataType.Whole8),
+        (np.uint16, DataType.Whole16),
+        (np.uint32, DataType.Whole32),
+        (np.uint64, DataType.Whole64),
+        (np.float32, DataType.Float32),
+        (np.float64, DataType.Float64),
+    ],
+)
+def test_from_numpy(numpy_dtype, data_type):
+    numpy_array = np.array([1, 0, 1], dtype=numpy_dtype)
+    expected = Array[data_type](*numpy_array.tolist())
+    assert Array.from_numpy(numpy_array) == expected
+
+
+def test_from_numpy_strided_and_big_endian():
+    numpy_array = np.arange(10, dtype=">i4")[::3]
+    assert Array.from_numpy(numpy_array) == Array[DataType.Integer32](0, 3, 6, 9)
+
+
+def test_from_numpy_masked():
+    numpy_array = np.ma.masked_array([1.5, 2.5, 3.5], mask=[False, True, False])
+    assert Array.from_numpy(numpy_array) == Array(1.5, None, 3.5)
+
+
+def test_from_numpy_masked_without_mask():
+    numpy_array = np.ma.masked_array([1, 2, 3])
+    assert Array.from_numpy(numpy_array) == Array(1, 2, 3)
+
+
+def test_from_numpy_strings():
+    numpy_array = np.array(["a", "b"])
+    assert Array.from_numpy(numpy_array) == Array("a", "b")
+
+
+def test_data_frame_from_masked_numpy():
+    df = DataFrame(x=np.ma.masked_array([1, 2], mask=[True, False]), y=np.array([True, False]))
+    assert df == DataFrame(x=[None, 2], y=[True, False])
@@ -34,3 +34,16 @@ def test_match_different_names():
     expected = DataFrame(x=[0, 1, 2, 3], y=["a", "b", "c", "d"], z=["d", "c", "b", "a"])
 
     assert actual == expected
+
+
+def test_outer_join_grouped():
+    df1 = DataFrame(g=[0, 0, 1], x=[0, 1, 0], y=["a", "b", "c"]).group_by("g")
+    df2 = DataFrame(g=[1, 1, 0], x=[0, 1, 0], z=["d", "e", "f"])
+
+    actual = df1.outer_join(df2, by=["x"])
+
+    expected = DataFrame(
+        g=[0, 0, 1, 1], x=[0, 1, 0, 1], y=["a", "b", "c", None], z=["f", None, "d", "e"]
+    ).group_by("g")
+
+    assert actual == expected
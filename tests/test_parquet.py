@@ -0,0 +1,76 @@
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from tabeline import DataFrame, scan_parquet
+
+
+@pytest.mark.parametrize(
+    "df",
+    [
+        DataFrame(x=[0, 0, 1], y=["a", "b", "b"], z=[True, False, True]),
+        DataFrame(x=[1.5, None, 3.5], y=[None, "b", None]),
+        DataFrame(x=[], y=[]),
+    ],
+)
+@pytest.mark.parametrize(
+    "compression", ["uncompressed", "snappy", "gzip", "lz4", "zstd", "brotli"]
+)
+def test_parquet_roundtrip(df, compression):
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory).joinpath("temp.parquet")
+        df.write_parquet(path, compression=compression)
+        actual = DataFrame.read_parquet(path)
+    assert actual == df
+
+
+def test_read_parquet_columns_and_predicate():
+    df = DataFrame(id=list(range(100)), x=[i / 2 for i in range(100)], y=["a", "b"] * 50)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory).joinpath("temp.parquet")
+        df.write_parquet(path, compression_level=3, row_group_size=10)
+        actual = DataFrame.read_parquet(path, columns=["y", "id"], predicate="id >= 95")
+
+    expected = df.filter("id >= 95").select("y", "id")
+    assert actual == expected
+
+
+def test_scan_parquet():
+    df = DataFrame(id=[0, 1, 2, 3], x=[1.5, 2.5, 3.5, 4.5], y=["a", "b", "c", "d"])
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory).joinpath("temp.parquet")
+        df.write_parquet(path, row_group_size=2)
+
+        lazy = scan_parquet(path)
+        assert lazy.column_names == ("id", "x", "y")
+
+        pipeline = lazy.filter("id >= 2").select("id", "y")
+        expected = df.filter("id >= 2").select("id", "y")
+
+        assert pipeline.collect() == expected
+        assert pipeline.collect(streaming=True) == expected
+
+
+def test_write_parquet_unknown_compression():
+    df = DataFrame(x=[0, 1])
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory).joinpath("temp.parquet")
+        with pytest.raises(ValueError):
+            df.write_parquet(path, compression="bogus")
+
+
+def test_read_parquet_missing_file():
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory).joinpath("missing.parquet")
+        with pytest.raises(FileNotFoundError):
+            DataFrame.read_parquet(path)
+
+
+def test_scan_parquet_missing_file():
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory).joinpath("missing.parquet")
+        with pytest.raises(FileNotFoundError):
+            scan_parquet(path)
@@ -38,6 +38,18 @@ def test_slice_groups():
     assert actual == expected
 
 
+def test_slice_groups_unsorted_and_repeated_indexes():
+    df = DataFrame(x=[1, 2, 2, 1, 2, 1], y=[3.5, 2.2, 6.7, 8.9, -1.1, 4.5]).group_by("x")
+
+    expected = DataFrame(x=[1, 1, 2, 2, 2, 1], y=[3.5, 3.5, 2.2, 2.2, -1.1, 4.5]).group_by("x")
+
+    actual = df.slice0([2, 0, 0])
+    assert actual == expected
+
+    actual = df.slice1([3, 1, 1])
+    assert actual == expected
+
+
 def test_slice_one_index():
     df = DataFrame(x=[1, 2, 3, 4], y=[True, False, True, True], z=[3.5, 2.2, 6.7, 8.9])
 
@@ -254,3 +266,24 @@ def test_slice_rowless_out_of_bounds(df):
 
     with pytest.raises(IndexOutOfBoundsError):
         _ = df.slice1([1])
+
+
+def test_slice_builds_group_index():
+    df = DataFrame(x=[1, 2, 2, 1, 2], y=[3.5, 2.2, 6.7, 8.9, -1.1]).group_by("x")
+    assert not df.has_group_index
+
+    _ = df.slice0([0])
+    assert df.has_group_index
+
+
+def test_group_index_shared_with_derived_frames():
+    df = DataFrame(x=[1, 2, 2, 1, 2], y=[3.5, 2.2, 6.7, 8.9, -1.1]).group_by("x")
+    mutated = df.mutate(z="y * 2").rename(w="y")
+
+    _ = df.slice1([1])
+    assert mutated.has_group_index
+    expected = DataFrame(x=[2, 1], w=[6.7, 8.9], z=[13.4, 17.8]).group_by("x")
+    assert mutated.slice1([2]) == expected
+
+    assert not mutated.filter("w > 0").has_group_index
+    assert not mutated.ungroup().has_group_index
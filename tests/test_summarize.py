@@ -25,6 +25,36 @@ def test_summarize_original_and_back_reference():
     assert actual == expected
 
 
+def test_summarize_chained_back_references():
+    df = DataFrame(g=[0, 0, 1, 1], x=[1.0, 3.0, 2.0, 6.0])
+    actual = df.group_by("g").summarize(a="sum(x)", b="a / n()", c="b * a", d="c + b")
+    expected = DataFrame(g=[0, 1], a=[4.0, 8.0], b=[2.0, 4.0], c=[8.0, 32.0], d=[10.0, 36.0])
+    assert actual == expected
+
+
+def test_summarize_back_reference_inside_reducer():
+    df = DataFrame(g=[0, 0, 1, 1], x=[1.0, 3.0, 2.0, 6.0])
+    actual = df.group_by("g").summarize(m="mean(x)", b="m * 2", v="mean((x - m) * b)")
+    expected = DataFrame(g=[0, 1], m=[2.0, 4.0], b=[4.0, 8.0], v=[0.0, 0.0])
+    assert actual == expected
+
+
+def test_summarize_chained_mixed_back_references():
+    df = DataFrame(g=[0, 0, 1, 1], x=[1.0, 3.0, 2.0, 6.0])
+    actual = df.group_by("g").summarize(
+        a="sum(x)", b="a / n()", c="mean(x - b) + a", d="max(x * c) - b"
+    )
+    expected = DataFrame(g=[0, 1], a=[4.0, 8.0], b=[2.0, 4.0], c=[4.0, 8.0], d=[10.0, 44.0])
+    assert actual == expected
+
+
+def test_summarize_mixed_back_reference_keeps_columns_of_same_name():
+    df = DataFrame(g=[0, 0, 1, 1], x=[1.0, 3.0, 2.0, 6.0], _summary_0=[10, 20, 30, 40])
+    actual = df.group_by("g").summarize(a="sum(x)", b="mean(x - a)", c="sum(_summary_0)")
+    expected = DataFrame(g=[0, 1], a=[4.0, 8.0], b=[-2.0, -4.0], c=[30, 70])
+    assert actual == expected
+
+
 def test_literal_in_summarize():
     df = DataFrame(x=[0, 0, 1, 1], y=[1, 2, 3, 4])
     actual = df.group_by("x").summarize(new="1")
@@ -0,0 +1,97 @@
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from tabeline import Array, DataFrame, clear_expression_cache
+
+n_threads = 4
+n_queries = 8
+
+
+def query(df: DataFrame) -> DataFrame:
+    return df.mutate(y="x * 2 + 1").filter("y % 3 == 0").summarize(total="sum(y)", count="n()")
+
+
+@pytest.fixture(scope="module")
+def df():
+    return DataFrame(x=list(range(200_000)))
+
+
+def test_concurrent_queries_match_serial(df):
+    expected = query(df)
+
+    with ThreadPoolExecutor(n_threads) as executor:
+        actual = list(executor.map(query, [df] * n_queries))
+
+    assert all(result == expected for result in actual)
+
+
+def test_concurrent_grouped_queries_match_serial():
+    dfs = [
+        DataFrame(g=[i % 7 for i in range(10_000)], x=list(range(k, 10_000 + k))).group_by("g")
+        for k in range(n_queries)
+    ]
+    expected = [df.summarize(total="sum(x)").sort("g") for df in dfs]
+
+    with ThreadPoolExecutor(n_threads) as executor:
+        actual = list(executor.map(lambda df: df.summarize(total="sum(x)").sort("g"), dfs))
+
+    assert actual == expected
+
+
+def test_concurrent_parsing():
+    # Distinct texts so that every thread goes through the parser rather than the cache
+    df = DataFrame(x=[0, 1, 2])
+    mutators = [{f"y{i}": f"(x + {i}) * 2 - {i} % 3 ** 2 > {i} | ~(x == {i})"} for i in range(200)]
+    clear_expression_cache()
+    expected = [df.mutate(**mutator) for mutator in mutators]
+    clear_expression_cache()
+
+    with ThreadPoolExecutor(n_threads) as executor:
+        actual = list(executor.map(lambda mutator: df.mutate(**mutator), mutators))
+
+    assert actual == expected
+
+
+def test_shared_array_iterator():
+    n = 100_000
+    iterator = iter(Array(*range(n)))
+
+    def drain() -> list[int]:
+        return list(iterator)
+
+    with ThreadPoolExecutor(n_threads) as executor:
+        results = list(executor.map(lambda _: drain(), range(n_threads)))
+
+    # Each element is received by exactly one thread
+    assert sorted(element for result in results for element in result) == list(range(n))
+
+
+def test_collect_releases_gil(df):
+    # With a long switch interval, the main thread keeps the GIL until it
+    # blocks or releases it, so the observer can only run before the query has
+    # been collected if collecting releases the GIL
+    lazy = df.lazy().mutate(y="x * 2 + 1").filter("y % 3 == 0").sort("y")
+    go = threading.Event()
+    collected = False
+    observations = []
+
+    def observe():
+        go.wait()
+        observations.append(collected)
+
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1_000)
+    try:
+        observer = threading.Thread(target=observe)
+        observer.start()
+        go.set()
+        _ = lazy.collect()
+        collected = True
+        observer.join()
+    finally:
+        sys.setswitchinterval(switch_interval)
+
+    assert observations == [False]
@@ -11,6 +11,13 @@ def test_transmute():
     assert actual == expected
 
 
+def test_transmute_reads_before_overwrite():
+    df = DataFrame(x=[0, 0, 1])
+    actual = df.transmute(y="x", x="x + 1", z="x * y")
+    expected = DataFrame(y=[0, 0, 1], x=[1, 1, 2], z=[0, 0, 2])
+    assert actual == expected
+
+
 def test_transmute_grouped():
     df = DataFrame(x=[0, 0, 1], y=[True, False, True], z=[3, 2, 4]).group_by("y", "x")
     actual = df.transmute(zz="z + 1")